@@ -12,24 +12,79 @@ This package provides:
 - Smart error reconciliation
 """
 
-from .models import (
-    Contract,
-    Signal,
-    SignalType,
-    AgentState,
-    AgentStatus,
-    Trajectory,
-    ExecutionPlan,
-)
-from .parser import ContractParser, parse_contracts
-from .signals import SignalBroker, create_broker
-from .isolator import FilesystemIsolator, IsolatedWorkspace, ScopeEnforcer
-from .claude_client import ClaudeClient, AgentConversation, AgentResponse
-from .orchestrator import Orchestrator, OrchestratorResult, AgentResult, run_orchestration
-from .persistence import SessionPersistence, SessionState, get_resume_prompt
-from .verification import VerificationPlanner, VerificationPlan, VerificationCheck
-from .reconciler import ErrorReconciler, ResolutionChain, ErrorCategory
-from .executor import FullPowerExecutor
+import importlib
+
+# Public names -> defining submodule. Submodules are imported on first
+# attribute access so that `import agent_harness` (and the CLI, which lives
+# inside the package) does not pay for the API client, MCP or Docker code
+# paths it never touches.
+_LAZY_EXPORTS = {
+    # Models
+    "Contract": "models",
+    "Signal": "models",
+    "SignalType": "models",
+    "AgentState": "models",
+    "AgentStatus": "models",
+    "Trajectory": "models",
+    "ExecutionPlan": "models",
+    
+    # Parser
+    "ContractParser": "parser",
+    "parse_contracts": "parser",
+    
+    # Signals
+    "SignalBroker": "signals",
+    "create_broker": "signals",
+    
+    # Isolation
+    "FilesystemIsolator": "isolator",
+    "IsolatedWorkspace": "isolator",
+    "ScopeEnforcer": "isolator",
+    
+    # Claude Client
+    "ClaudeClient": "claude_client",
+    "AgentConversation": "claude_client",
+    "AgentResponse": "claude_client",
+    
+    # Orchestrator
+    "Orchestrator": "orchestrator",
+    "OrchestratorResult": "orchestrator",
+    "AgentResult": "orchestrator",
+    "run_orchestration": "orchestrator",
+    
+    # Persistence (v2)
+    "SessionPersistence": "persistence",
+    "SessionState": "persistence",
+    "get_resume_prompt": "persistence",
+    
+    # Verification (v2)
+    "VerificationPlanner": "verification",
+    "VerificationPlan": "verification",
+    "VerificationCheck": "verification",
+    
+    # Error Handling (v2)
+    "ErrorReconciler": "reconciler",
+    "ResolutionChain": "reconciler",
+    "ErrorCategory": "reconciler",
+    
+    # Executor (v2)
+    "FullPowerExecutor": "executor",
+}
+
+
+def __getattr__(name: str):
+    """Import the submodule that defines a public name on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "0.2.0"
 
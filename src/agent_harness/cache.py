@@ -0,0 +1,58 @@
+"""
+Cache - Pickled results under the user's cache directory.
+
+Lets repeated CLI invocations skip re-parsing and re-planning contract
+files that have not changed:
+
+    key = cache_key(path, mtime_ns, size)
+    result = load("contracts", key)
+    if result is None:
+        result = expensive()
+        store("contracts", key, result)
+
+Entries are never trusted to exist: any read or write failure is
+treated as a miss.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+
+CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "agent-harness"
+
+
+def cache_key(*parts: Any) -> str:
+    """Hash the reprs of `parts` into a short hex key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load(namespace: str, key: str) -> Optional[Any]:
+    """Return the value stored under `key`, or None on a miss."""
+    try:
+        with open(CACHE_DIR / namespace / f"{key}.pkl", "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, unreadable or stale entry
+        return None
+
+
+def store(namespace: str, key: str, value: Any) -> None:
+    """Atomically write `value` under `key`, ignoring I/O errors."""
+    directory = CACHE_DIR / namespace
+    tmp_file = directory / f"{key}.{os.getpid()}.tmp"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, directory / f"{key}.pkl")
+    except OSError:
+        pass
@@ -8,17 +8,260 @@ Handles:
 - Signal extraction from responses
 """
 
+import asyncio
+import functools
+import io
 import json
 import os
 import re
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, AsyncIterator, Callable
+from typing import Optional, AsyncIterator, Awaitable, Callable
 from pathlib import Path
 
+try:
+    import anthropic
+except ImportError:
+    # Prompt building and response parsing work without the SDK
+    anthropic = None
+
+try:
+    # RE2 matches in linear time, so untrusted agent output can't trigger
+    # catastrophic backtracking; patterns use inline flags for both engines
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
 from .models import Contract, Signal, SignalType, Trajectory
 
 
-@dataclass
+# Response parsing patterns (compiled once, used on every agent turn).
+# Line-level fields share one alternation so parse_response scans the
+# content a single time; match.lastgroup names the field that matched.
+# Signal payloads are rescanned, since they can carry further tokens.
+_RESPONSE_RE = _regex.compile(
+    r'(?m)'
+    # SIGNAL:TYPE:agent:payload or SIGNAL:TYPE:agent
+    r'(?P<signal>SIGNAL:(?P<signal_type>READY|BLOCKED|FAILED|DATA|ESCALATE)'
+    r':(?P<signal_agent>\w+)(?::(?P<signal_payload>[^\n]+))?)'
+    # READY:agent format without SIGNAL: prefix
+    r'|(?P<simple>^(?P<simple_type>READY|BLOCKED|FAILED)'
+    r':(?P<simple_agent>\w+)(?::(?P<simple_payload>[^\n]+))?$)'
+    r'|(?P<traj>TRAJ:(?P<traj_value>BOUNDED|ESCAPING|CONVERGED|OSCILLATING))'
+    # CHANGED:file:what or ADDED:file:purpose
+    r'|(?P<fileop>^(?P<fileop_kind>CHANGED|ADDED):(?P<fileop_path>[^:\n]+):)'
+)
+# Payload group of each signal field, by index (RE2 spans take no names)
+_PAYLOAD_GROUPS = {
+    kind: _RESPONSE_RE.groupindex[f'{kind}_payload'] for kind in ('signal', 'simple')
+}
+# Terminal signals, checked on each completed line while a turn streams
+_TERMINAL_SIGNAL_RE = _regex.compile(
+    r'(?m)SIGNAL:(?:READY|BLOCKED|FAILED):\w+|^(?:READY|BLOCKED|FAILED):\w+'
+)
+_VERIFIED_RE = _regex.compile(r'VERIFIED:\s*\n((?:- .+\n)+)')
+_VERIFIED_PASS_RE = _regex.compile(r'(?i)✓|pass|exit 0|success|ok')
+_CHECKPOINT_PATTERNS = {
+    key: _regex.compile(pattern)
+    for key, pattern in {
+        'goal': r'GOAL:([^\n]+)',
+        'phase': r'PHASE:([^\n]+)',
+        'done': r'DONE:([^\n]+)',
+        'wip': r'WIP:([^\n]+)',
+        'todo': r'TODO:([^\n]+)',
+        'state': r'STATE:([^\n]+)',
+        'commit': r'COMMIT:([^\n]+)',
+        'resume': r'RESUME:([^\n]+)',
+    }.items()
+}
+
+
+def _iter_response_fields(content: str, pos: int = 0, endpos: Optional[int] = None):
+    """
+    Yield _RESPONSE_RE matches in text order, including those nested in
+    signal payloads.
+    
+    Payloads are rescanned in place rather than as substrings, so
+    line-anchored fields still only match at real line starts.
+    """
+    if endpos is None:
+        endpos = len(content)
+    for match in _RESPONSE_RE.finditer(content, pos, endpos):
+        yield match
+        payload = _PAYLOAD_GROUPS.get(match.lastgroup)
+        if payload is not None and match.start(payload) >= 0:
+            yield from _iter_response_fields(
+                content, match.start(payload), match.end(payload)
+            )
+
+
+def _contract_key(contract: Contract) -> tuple:
+    """Hashable identity of the contract fields that shape its prompt."""
+    return (
+        contract.name,
+        tuple(contract.scope),
+        tuple(contract.cannot),
+        tuple(contract.depends),
+        tuple(contract.expects),
+        tuple(contract.produces),
+        tuple(contract.verify),
+    )
+
+
+# Embedded minimal protocol for when no file is provided
+_MINIMAL_PROTOCOL = """
+# AGENT PROTOCOL (Minimal)
+
+## HEADER (MANDATORY)
+Every response starts with:
+```
+GOAL:[task]|STATUS:[phase]|[done]/[total]|[next]|CTX:[%]|SPLIT:n
+STATE:[key=value,...]|TRAJ:[BOUNDED|ESCAPING|CONVERGED|OSCILLATING]|BLOCK:[none|reason]
+```
+
+## SIGNALS
+When complete: `SIGNAL:READY:{agent_name}`
+When blocked: `SIGNAL:BLOCKED:{agent_name}:{reason}`
+When failed: `SIGNAL:FAILED:{agent_name}:{reason}`
+
+## VERIFY (Before Claiming Done)
+- Tests pass
+- PRODUCES outputs exist
+- VERIFY commands succeed
+
+## COMPLETE
+```
+COMPLETE
+GOAL:[verbatim]
+CHANGED:[file]:[what]
+ADDED:[file]:[purpose]
+VERIFIED:[evidence]
+SIGNAL:READY:{agent_name}
+```
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _load_protocol(protocol_path: Optional[Path]) -> str:
+    """Load the agent protocol, shared by every client in the process."""
+    if protocol_path and protocol_path.exists():
+        return protocol_path.read_text()
+    return _MINIMAL_PROTOCOL
+
+
+# Tool input schemas; only tool descriptions depend on the contract scope
+_TOOL_SCHEMAS = {
+    "read_file": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Relative path to file"
+            }
+        },
+        "required": ["path"]
+    },
+    "write_file": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Relative path to file"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write"
+            }
+        },
+        "required": ["path", "content"]
+    },
+    "execute": {
+        "type": "object",
+        "properties": {
+            "command": {
+                "type": "string",
+                "description": "Shell command to execute"
+            }
+        },
+        "required": ["command"]
+    },
+    "list_files": {
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Relative path to directory"
+            }
+        },
+        "required": ["path"]
+    },
+    "signal": {
+        "type": "object",
+        "properties": {
+            "type": {
+                "type": "string",
+                "enum": ["READY", "BLOCKED", "FAILED"],
+                "description": "Signal type"
+            },
+            "payload": {
+                "type": "string",
+                "description": "Optional reason/details"
+            }
+        },
+        "required": ["type"]
+    },
+}
+
+# Closing section of every agent system prompt
+_CRITICAL_INSTRUCTIONS = """## CRITICAL INSTRUCTIONS
+
+1. You are agent `{name}` - always identify yourself in signals
+2. File operations outside SCOPE will fail - don't attempt them
+3. Before signaling READY, verify all PRODUCES exist and VERIFY commands pass
+4. If blocked, signal BLOCKED immediately with reason
+5. Always emit exactly one terminal signal: READY, BLOCKED, or FAILED
+"""
+
+def _content_blocks(message: dict) -> list[dict]:
+    """Return a message's content as a block list, converting plain text."""
+    if isinstance(message["content"], str):
+        message["content"] = [{"type": "text", "text": message["content"]}]
+    return message["content"]
+
+
+def _content_chars(content) -> int:
+    """
+    Estimate a message's size from the text its content blocks carry.
+    
+    Counts text, tool results and tool input values rather than
+    serializing the message, which would copy every block per turn.
+    """
+    if isinstance(content, str):
+        return len(content)
+    chars = 0
+    for block in content:
+        if "text" in block:
+            chars += len(block["text"])
+        elif "content" in block:
+            chars += _content_chars(block["content"])
+        elif "input" in block:
+            chars += sum(len(str(value)) for value in block["input"].values())
+    return chars
+
+
+# Prompt-cache marker for static request prefixes (system prompt, tools)
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+@dataclass(slots=True)
 class AgentResponse:
     """Parsed response from an agent."""
     content: str
@@ -52,7 +295,11 @@ class ClaudeClient:
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
         self.protocol_path = protocol_path
-        self._protocol_content: Optional[str] = None
+        self._anthropic = None
+        
+        # Built prompts/tools, reused for every conversation on a contract
+        self._system_prompt_cache: dict[tuple, list[dict]] = {}
+        self._tools_cache: dict[tuple, list[dict]] = {}
         
         if not self.api_key:
             raise ValueError(
@@ -61,100 +308,89 @@ class ClaudeClient:
     
     def _get_protocol(self) -> str:
         """Load the agent protocol."""
-        if self._protocol_content:
-            return self._protocol_content
-        
-        if self.protocol_path and self.protocol_path.exists():
-            self._protocol_content = self.protocol_path.read_text()
-        else:
-            # Use embedded minimal protocol
-            self._protocol_content = self._get_minimal_protocol()
-        
-        return self._protocol_content
+        return _load_protocol(self.protocol_path)
     
-    def _get_minimal_protocol(self) -> str:
-        """Minimal embedded protocol for when no file is provided."""
-        return """
-# AGENT PROTOCOL (Minimal)
-
-## HEADER (MANDATORY)
-Every response starts with:
-```
-GOAL:[task]|STATUS:[phase]|[done]/[total]|[next]|CTX:[%]|SPLIT:n
-STATE:[key=value,...]|TRAJ:[BOUNDED|ESCAPING|CONVERGED|OSCILLATING]|BLOCK:[none|reason]
-```
-
-## SIGNALS
-When complete: `SIGNAL:READY:{agent_name}`
-When blocked: `SIGNAL:BLOCKED:{agent_name}:{reason}`
-When failed: `SIGNAL:FAILED:{agent_name}:{reason}`
-
-## VERIFY (Before Claiming Done)
-- Tests pass
-- PRODUCES outputs exist
-- VERIFY commands succeed
-
-## COMPLETE
-```
-COMPLETE
-GOAL:[verbatim]
-CHANGED:[file]:[what]
-ADDED:[file]:[purpose]
-VERIFIED:[evidence]
-SIGNAL:READY:{agent_name}
-```
-"""
+    def _get_anthropic(self):
+        """
+        Get the shared async API client, creating it on first use.
+        
+        One client per ClaudeClient keeps its connection pool alive across
+        every agent and turn instead of re-handshaking per message.
+        """
+        if self._anthropic is None:
+            if anthropic is None:
+                raise ImportError(
+                    "Anthropic SDK required. Run: pip install anthropic"
+                )
+            self._anthropic = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                max_retries=3,
+            )
+        return self._anthropic
     
-    def build_system_prompt(self, contract: Contract) -> str:
+    def build_system_prompt(self, contract: Contract) -> list[dict]:
         """
         Build the system prompt for an agent.
         
+        Returned as text blocks so the protocol and contract prefix can be
+        served from the Anthropic prompt cache on every turn.
+        
         Includes:
         - Base protocol
         - Contract section
         - Tool instructions
+        
+        Results are cached per contract; callers must not mutate them.
         """
+        key = _contract_key(contract)
+        cached = self._system_prompt_cache.get(key)
+        if cached is not None:
+            return cached
+        
         protocol = self._get_protocol()
         contract_section = contract.to_system_prompt_section()
         
         tool_instructions = self._get_tool_instructions(contract)
         
-        return f"""
-{protocol}
-
----
-
-{contract_section}
-
----
-
-{tool_instructions}
-
----
-
-## CRITICAL INSTRUCTIONS
-
-1. You are agent `{contract.name}` - always identify yourself in signals
-2. File operations outside SCOPE will fail - don't attempt them
-3. Before signaling READY, verify all PRODUCES exist and VERIFY commands pass
-4. If blocked, signal BLOCKED immediately with reason
-5. Always emit exactly one terminal signal: READY, BLOCKED, or FAILED
-"""
+        system_prompt = [
+            {
+                "type": "text",
+                "text": protocol,
+                "cache_control": _EPHEMERAL_CACHE,
+            },
+            {
+                "type": "text",
+                "text": "\n\n".join(["---", contract_section]),
+                "cache_control": _EPHEMERAL_CACHE,
+            },
+            {
+                "type": "text",
+                "text": "\n\n".join([
+                    "---",
+                    tool_instructions,
+                    "---",
+                    _CRITICAL_INSTRUCTIONS.format(name=contract.name),
+                ]),
+            },
+        ]
+        self._system_prompt_cache[key] = system_prompt
+        return system_prompt
     
     def _get_tool_instructions(self, contract: Contract) -> str:
         """Generate tool usage instructions based on scope."""
+        scope_str = ', '.join(contract.scope)
         return f"""
 ## AVAILABLE TOOLS
 
 ### read_file
 Read a file from your scope.
 Arguments: {{"path": "relative/path/to/file"}}
-Allowed paths: {', '.join(contract.scope)}
+Allowed paths: {scope_str}
 
 ### write_file
 Write content to a file in your scope.
 Arguments: {{"path": "relative/path/to/file", "content": "file content"}}
-Allowed paths: {', '.join(contract.scope)}
+Allowed paths: {scope_str}
 
 ### execute
 Run a shell command in your workspace.
@@ -174,89 +410,46 @@ Arguments: {{"type": "READY|BLOCKED|FAILED", "payload": "optional reason"}}
         """
         Get tool definitions for the Claude API.
         
-        Tools are scoped based on the contract.
+        Tools are scoped based on the contract. Results are cached per
+        scope; callers must not mutate them.
         """
-        return [
+        key = tuple(contract.scope)
+        cached = self._tools_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        scope_str = ', '.join(contract.scope)
+        tools = [
             {
                 "name": "read_file",
-                "description": f"Read a file. Allowed: {', '.join(contract.scope)}",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Relative path to file"
-                        }
-                    },
-                    "required": ["path"]
-                }
+                "description": f"Read a file. Allowed: {scope_str}",
+                "input_schema": _TOOL_SCHEMAS["read_file"],
             },
             {
-                "name": "write_file", 
-                "description": f"Write a file. Allowed: {', '.join(contract.scope)}",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Relative path to file"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content to write"
-                        }
-                    },
-                    "required": ["path", "content"]
-                }
+                "name": "write_file",
+                "description": f"Write a file. Allowed: {scope_str}",
+                "input_schema": _TOOL_SCHEMAS["write_file"],
             },
             {
                 "name": "execute",
                 "description": "Run a shell command in workspace",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "command": {
-                            "type": "string",
-                            "description": "Shell command to execute"
-                        }
-                    },
-                    "required": ["command"]
-                }
+                "input_schema": _TOOL_SCHEMAS["execute"],
             },
             {
                 "name": "list_files",
-                "description": f"List directory contents. Allowed: {', '.join(contract.scope)}",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Relative path to directory"
-                        }
-                    },
-                    "required": ["path"]
-                }
+                "description": f"List directory contents. Allowed: {scope_str}",
+                "input_schema": _TOOL_SCHEMAS["list_files"],
             },
             {
                 "name": "signal",
                 "description": "Emit a coordination signal (READY, BLOCKED, or FAILED)",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "type": {
-                            "type": "string",
-                            "enum": ["READY", "BLOCKED", "FAILED"],
-                            "description": "Signal type"
-                        },
-                        "payload": {
-                            "type": "string",
-                            "description": "Optional reason/details"
-                        }
-                    },
-                    "required": ["type"]
-                }
-            }
+                "input_schema": _TOOL_SCHEMAS["signal"],
+                # Last tool carries the breakpoint that caches all tool schemas
+                "cache_control": _EPHEMERAL_CACHE,
+            },
         ]
+        self._tools_cache[key] = tools
+        return tools
     
     async def create_conversation(
         self,
@@ -290,9 +483,9 @@ Arguments: {{"type": "READY|BLOCKED|FAILED", "payload": "optional reason"}}
         - Verification results from VERIFIED: section
         - Checkpoint data if present
         """
-        signals = self._extract_signals(content, agent_name)
-        trajectory = self._extract_trajectory(content)
-        files_modified, files_created = self._extract_file_ops(content)
+        signals, trajectory, files_modified, files_created = (
+            self._scan_response(content)
+        )
         verification = self._extract_verification(content)
         checkpoint = self._extract_checkpoint(content)
         
@@ -322,83 +515,65 @@ Arguments: {{"type": "READY|BLOCKED|FAILED", "payload": "optional reason"}}
             checkpoint=checkpoint,
         )
     
-    def _extract_signals(self, content: str, agent_name: str) -> list[Signal]:
-        """Extract signal declarations from response."""
-        signals = []
-        
-        # Pattern: SIGNAL:TYPE:agent:payload or SIGNAL:TYPE:agent
-        pattern = r'SIGNAL:(READY|BLOCKED|FAILED|DATA|ESCALATE):(\w+)(?::([^\n]+))?'
-        
-        for match in re.finditer(pattern, content):
-            signal_type = SignalType(match.group(1))
-            agent = match.group(2)
-            payload = match.group(3)
-            
-            signals.append(Signal(
-                type=signal_type,
-                agent=agent,
-                payload=payload,
-            ))
-        
-        # Also check for READY:agent format without SIGNAL: prefix
-        simple_pattern = r'^(READY|BLOCKED|FAILED):(\w+)(?::([^\n]+))?$'
-        for match in re.finditer(simple_pattern, content, re.MULTILINE):
-            signal_type = SignalType(match.group(1))
-            agent = match.group(2)
-            payload = match.group(3) if match.group(3) else None
-            
-            # Avoid duplicates
-            existing = any(
-                s.type == signal_type and s.agent == agent 
-                for s in signals
-            )
-            if not existing:
-                signals.append(Signal(
-                    type=signal_type,
-                    agent=agent,
-                    payload=payload,
-                ))
+    def _scan_response(
+        self,
+        content: str,
+    ) -> tuple[list[Signal], Trajectory, list[str], list[str]]:
+        """
+        Extract signals, trajectory and file operations in one pass.
         
-        return signals
-    
-    def _extract_trajectory(self, content: str) -> Trajectory:
-        """Extract trajectory state from header."""
-        match = re.search(r'TRAJ:(BOUNDED|ESCAPING|CONVERGED|OSCILLATING)', content)
-        if match:
-            return Trajectory(match.group(1))
-        return Trajectory.BOUNDED
-    
-    def _extract_file_ops(self, content: str) -> tuple[list[str], list[str]]:
-        """Extract file operations from CHANGED/ADDED lines."""
+        Returns (signals, trajectory, files_modified, files_created).
+        """
+        signals = []
+        simple_signals = []
+        trajectory = None
         modified = []
         created = []
         
-        for match in re.finditer(r'^CHANGED:([^:]+):', content, re.MULTILINE):
-            modified.append(match.group(1))
+        for match in _iter_response_fields(content):
+            kind = match.lastgroup
+            if kind == 'signal':
+                signals.append(Signal(
+                    type=SignalType(match.group('signal_type')),
+                    agent=match.group('signal_agent'),
+                    payload=match.group('signal_payload'),
+                ))
+            elif kind == 'simple':
+                simple_signals.append(Signal(
+                    type=SignalType(match.group('simple_type')),
+                    agent=match.group('simple_agent'),
+                    payload=match.group('simple_payload') or None,
+                ))
+            elif kind == 'traj':
+                if trajectory is None:
+                    trajectory = Trajectory(match.group('traj_value'))
+            elif match.group('fileop_kind') == 'CHANGED':
+                modified.append(match.group('fileop_path'))
+            else:
+                created.append(match.group('fileop_path'))
         
-        for match in re.finditer(r'^ADDED:([^:]+):', content, re.MULTILINE):
-            created.append(match.group(1))
+        # Bare signals only count if not already declared with SIGNAL: prefix
+        seen = {(s.type, s.agent) for s in signals}
+        for signal in simple_signals:
+            key = (signal.type, signal.agent)
+            if key not in seen:
+                seen.add(key)
+                signals.append(signal)
         
-        return modified, created
+        return signals, trajectory or Trajectory.BOUNDED, modified, created
     
     def _extract_verification(self, content: str) -> dict[str, bool]:
         """Extract verification results."""
         results = {}
         
         # Look for VERIFIED: section
-        verified_match = re.search(
-            r'VERIFIED:\s*\n((?:- .+\n)+)',
-            content
-        )
+        verified_match = _VERIFIED_RE.search(content)
         if verified_match:
             for line in verified_match.group(1).split('\n'):
                 line = line.strip()
                 if line.startswith('- '):
                     # Check for success indicators
-                    passed = any(
-                        ind in line.lower() 
-                        for ind in ('✓', 'pass', 'exit 0', 'success', 'ok')
-                    )
+                    passed = _VERIFIED_PASS_RE.search(line) is not None
                     results[line[2:]] = passed
         
         return results
@@ -410,19 +585,8 @@ Arguments: {{"type": "READY|BLOCKED|FAILED", "payload": "optional reason"}}
         
         checkpoint = {}
         
-        patterns = {
-            'goal': r'GOAL:([^\n]+)',
-            'phase': r'PHASE:([^\n]+)',
-            'done': r'DONE:([^\n]+)',
-            'wip': r'WIP:([^\n]+)',
-            'todo': r'TODO:([^\n]+)',
-            'state': r'STATE:([^\n]+)',
-            'commit': r'COMMIT:([^\n]+)',
-            'resume': r'RESUME:([^\n]+)',
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, content)
+        for key, pattern in _CHECKPOINT_PATTERNS.items():
+            match = pattern.search(content)
             if match:
                 checkpoint[key] = match.group(1).strip()
         
@@ -439,6 +603,17 @@ class AgentConversation:
     - Response streaming
     """
     
+    # API calls between moves of the message-history cache breakpoint
+    cache_checkpoint_interval: int = 4
+    
+    # Stop generation as soon as a READY/BLOCKED/FAILED line is streamed
+    stop_on_terminal_signal: bool = True
+    
+    # History compaction: once the history's text passes the threshold,
+    # older exchanges are folded into a summary, keeping the latest messages
+    compact_threshold_chars: int = 200_000
+    compact_keep_messages: int = 10
+    
     def __init__(
         self,
         client: ClaudeClient,
@@ -448,89 +623,226 @@ class AgentConversation:
         self.client = client
         self.contract = contract
         self.goal = goal
-        self.messages: list[dict] = []
+        self.messages: deque[dict] = deque()
+        
+        # Memoized on the client: every conversation for this contract sends
+        # the same system/tool objects, which must be treated as read-only
         self.system_prompt = client.build_system_prompt(contract)
         self.tools = client.get_tools(contract)
         
         # Tool handlers (set by orchestrator)
         self.tool_handlers: dict[str, Callable] = {}
+        
+        # Prompt-cache breakpoint in the message history
+        self._api_calls = 0
+        self._cache_block: Optional[dict] = None
+        
+        # Estimated history size and the summary of compacted exchanges
+        self._history_chars = 0
+        self._summary_block: Optional[dict] = None
     
     def set_tool_handler(self, name: str, handler: Callable) -> None:
         """Register a handler for a tool."""
         self.tool_handlers[name] = handler
     
-    async def send(self, message: str) -> AgentResponse:
+    def _checkpoint_cache(self) -> None:
+        """
+        Move the message cache breakpoint to the latest user turn.
+        
+        Only one breakpoint is kept in the history so the request stays
+        within the API limit alongside the system and tool breakpoints.
+        """
+        self._set_cache_block(_content_blocks(self.messages[-1])[-1])
+    
+    def _set_cache_block(self, block: dict) -> None:
+        """Make block the single cache breakpoint in the history."""
+        if self._cache_block is not None:
+            self._cache_block.pop("cache_control", None)
+        self._cache_block = block
+        self._cache_block["cache_control"] = _EPHEMERAL_CACHE
+    
+    def _append_message(self, role: str, content) -> None:
+        """Add a message to the history and track its estimated size."""
+        self.messages.append({"role": role, "content": content})
+        self._history_chars += _content_chars(content)
+    
+    def _compact_history(self) -> None:
+        """
+        Fold the oldest exchanges into a summary on the opening message.
+        
+        The opening user message and the latest compact_keep_messages are
+        kept verbatim. Removal stops just before an assistant message so
+        roles still alternate and no tool_result loses its tool_use. The
+        cache breakpoint moves to the summary, the new stable prefix.
+        """
+        if len(self.messages) <= self.compact_keep_messages + 1:
+            return
+        
+        first = self.messages.popleft()
+        to_remove = len(self.messages) - self.compact_keep_messages
+        removed = 0
+        tool_calls = []
+        
+        while len(self.messages) > 1 and (
+            removed < to_remove or self.messages[0]["role"] != "assistant"
+        ):
+            message = self.messages.popleft()
+            removed += 1
+            if isinstance(message["content"], list):
+                for block in message["content"]:
+                    if block.get("type") == "tool_use":
+                        call = f"{block['name']} {_dumps(block['input'])}"
+                        tool_calls.append(f"- {call[:120]}")
+        
+        self.messages.appendleft(first)
+        
+        summary = f"[{removed} earlier messages compacted"
+        if tool_calls:
+            summary += "; tool calls made:\n" + "\n".join(tool_calls)
+        summary += "]"
+        
+        if self._summary_block is None:
+            self._summary_block = {"type": "text", "text": summary}
+            _content_blocks(first).append(self._summary_block)
+        else:
+            self._summary_block["text"] += "\n" + summary
+        
+        if self._cache_block is not None and not any(
+            block is self._cache_block
+            for message in self.messages
+            for block in _content_blocks(message)
+        ):
+            self._cache_block = None
+        self._set_cache_block(self._summary_block)
+        
+        self._history_chars = sum(
+            _content_chars(m["content"]) for m in self.messages
+        )
+    
+    async def send(
+        self,
+        message: str,
+        on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> AgentResponse:
         """
         Send a message and get a response.
         
         Handles tool calls automatically using registered handlers.
+        Responses are streamed; on_delta, if given, is awaited with each
+        text chunk as it arrives.
         """
-        import anthropic
-        
-        self.messages.append({
-            "role": "user",
-            "content": message,
-        })
-        
-        client = anthropic.Anthropic(api_key=self.client.api_key)
-        
-        while True:
-            response = client.messages.create(
-                model=self.client.model,
-                max_tokens=8192,
-                system=self.system_prompt,
-                tools=self.tools,
-                messages=self.messages,
+        self._append_message("user", message)
+        
+        client = self.client._get_anthropic()
+        
+        # Text from every turn of this exchange, parsed once at the end
+        text_buf = io.StringIO()
+        
+        response, tool_uses = await self._stream_turn(client, text_buf, on_delta)
+        while response.stop_reason == "tool_use":
+            # Tools in one turn are independent; results keep call order
+            results = await asyncio.gather(
+                *(self._handle_tool(tool_use) for tool_use in tool_uses)
             )
+            self._append_message("user", [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_use.id,
+                    "content": result,
+                }
+                for tool_use, result in zip(tool_uses, results)
+            ])
             
-            # Collect response content
-            assistant_content = []
-            tool_uses = []
-            text_content = ""
-            
-            for block in response.content:
-                if block.type == "text":
-                    text_content += block.text
-                    assistant_content.append({
-                        "type": "text",
-                        "text": block.text,
-                    })
-                elif block.type == "tool_use":
-                    tool_uses.append(block)
-                    assistant_content.append({
-                        "type": "tool_use",
-                        "id": block.id,
-                        "name": block.name,
-                        "input": block.input,
-                    })
-            
-            self.messages.append({
-                "role": "assistant",
-                "content": assistant_content,
-            })
+            response, tool_uses = await self._stream_turn(
+                client, text_buf, on_delta
+            )
+        
+        return self.client.parse_response(text_buf.getvalue(), self.contract.name)
+    
+    async def _stream_turn(
+        self,
+        client,
+        text_buf: io.StringIO,
+        on_delta: Optional[Callable[[str], Awaitable[None]]],
+    ) -> tuple:
+        """
+        Stream one model turn and record it in the message history.
+        
+        Text is written to text_buf as it arrives. Once a completed line
+        carries a terminal signal the stream is closed, so nothing after
+        it is generated. Returns the final message (or the partial one,
+        with no stop_reason, if closed early) and its tool_use blocks.
+        """
+        if self._history_chars > self.compact_threshold_chars:
+            self._compact_history()
+        if self._api_calls % self.cache_checkpoint_interval == 0:
+            self._checkpoint_cache()
+        self._api_calls += 1
+        
+        if text_buf.tell():
+            text_buf.write("\n")
+        
+        async with client.messages.stream(
+            model=self.client.model,
+            max_tokens=8192,
+            system=self.system_prompt,
+            tools=self.tools,
+            messages=list(self.messages),
+        ) as stream:
+            # Incomplete trailing line, held until its newline arrives
+            pending = ""
+            stopped = False
             
-            # Handle tool calls
-            if tool_uses:
-                tool_results = []
-                for tool_use in tool_uses:
-                    result = await self._handle_tool(tool_use)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": result,
-                    })
+            async for text in stream.text_stream:
+                text_buf.write(text)
+                if on_delta:
+                    await on_delta(text)
                 
-                self.messages.append({
-                    "role": "user",
-                    "content": tool_results,
-                })
-                
-                # Continue conversation if not end_turn
-                if response.stop_reason != "end_turn":
+                if not self.stop_on_terminal_signal:
                     continue
+                pending += text
+                if "\n" in text:
+                    lines, _, pending = pending.rpartition("\n")
+                    if _TERMINAL_SIGNAL_RE.search(lines):
+                        await stream.close()
+                        stopped = True
+                        break
             
-            # Parse and return response
-            return self.client.parse_response(text_content, self.contract.name)
+            if stopped:
+                response = stream.current_message_snapshot
+            else:
+                response = await stream.get_final_message()
+        
+        assistant_content = []
+        tool_uses = []
+        
+        # Calls are only answered when the turn stopped for them; a turn
+        # closed early or cut off at max_tokens may hold a half-built call,
+        # and an unanswered tool_use would fail the next request
+        calls_complete = response.stop_reason == "tool_use"
+        
+        for block in response.content:
+            if block.type == "text":
+                assistant_content.append({
+                    "type": "text",
+                    "text": block.text,
+                })
+            elif block.type == "tool_use" and calls_complete:
+                tool_uses.append(block)
+                assistant_content.append({
+                    "type": "tool_use",
+                    "id": block.id,
+                    "name": block.name,
+                    "input": block.input,
+                })
+        
+        if not assistant_content:
+            # The API rejects empty assistant turns mid-conversation
+            assistant_content.append({"type": "text", "text": "[response cut off]"})
+        
+        self._append_message("assistant", assistant_content)
+        
+        return response, tool_uses
     
     async def _handle_tool(self, tool_use) -> str:
         """Execute a tool and return the result."""
@@ -539,19 +851,19 @@ class AgentConversation:
         if handler:
             try:
                 result = await handler(tool_use.input)
-                return json.dumps({"success": True, "result": result})
+                return _dumps({"success": True, "result": result})
             except PermissionError as e:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": f"Access denied: {e}"
                 })
             except Exception as e:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": str(e)
                 })
         else:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"Unknown tool: {tool_use.name}"
             })
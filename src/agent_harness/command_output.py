@@ -0,0 +1,94 @@
+"""
+Command Output - Bounded capture of subprocess output.
+
+Shared by the isolator, which runs agents' commands, and the MCP
+server, which runs verification checks:
+
+    returncode, stdout, stderr = await collect_output(proc, timeout=60)
+
+Output is drained while the command runs, so neither pipe can fill up
+and block it, and only a bounded number of lines is kept in memory.
+"""
+
+import asyncio
+import codecs
+import collections
+
+
+# Lines of stdout/stderr kept per command; lines in between are dropped
+OUTPUT_MAX_LINES = 10_000
+
+
+class CommandOutput:
+    """
+    The first and last lines of a command's output stream.
+
+    Fed raw chunks as they arrive, so a chatty command costs at most
+    head_lines + max_lines lines of memory rather than its whole
+    output. The head keeps what a command reports first, such as the
+    error that made the rest of its output fail; by default only the
+    tail is kept.
+    """
+
+    def __init__(self, max_lines: int = OUTPUT_MAX_LINES, head_lines: int = 0):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._head: list[str] = []
+        self._head_lines = head_lines
+        self._lines: collections.deque[str] = collections.deque(maxlen=max_lines)
+        self._partial = ""
+        self._dropped = 0
+
+    def feed(self, data: bytes) -> None:
+        """Add a chunk of output, which may end mid-line or mid-character."""
+        lines = (self._partial + self._decoder.decode(data)).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            if len(self._head) < self._head_lines:
+                self._head.append(line + "\n")
+                continue
+            if len(self._lines) == self._lines.maxlen:
+                self._dropped += 1
+            self._lines.append(line + "\n")
+
+    def text(self) -> str:
+        """Return the kept output, noting how many lines were dropped."""
+        tail = "".join(self._lines) + self._partial + self._decoder.decode(b"", final=True)
+        if not self._dropped:
+            return "".join(self._head) + tail
+        if self._head:
+            return f"{''.join(self._head)}[... {self._dropped} lines dropped]\n{tail}"
+        return f"[... {self._dropped} earlier lines dropped]\n{tail}"
+
+
+async def collect_output(
+    proc: asyncio.subprocess.Process,
+    timeout: float,
+    head_lines: int = 0,
+) -> tuple[int, str, str]:
+    """
+    Drain a process's stdout and stderr as it runs, then wait for it.
+
+    Each stream keeps its last OUTPUT_MAX_LINES lines, plus its first
+    head_lines lines. A process that outlives timeout is killed and
+    reported as (-1, "", "Command timed out").
+    """
+    stdout = CommandOutput(head_lines=head_lines)
+    stderr = CommandOutput(head_lines=head_lines)
+
+    async def drain(stream: asyncio.StreamReader, output: CommandOutput) -> None:
+        while chunk := await stream.read(64 * 1024):
+            output.feed(chunk)
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                drain(proc.stdout, stdout), drain(proc.stderr, stderr), proc.wait()
+            ),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return -1, "", "Command timed out"
+
+    return proc.returncode, stdout.text(), stderr.text()
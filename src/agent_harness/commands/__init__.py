@@ -0,0 +1,25 @@
+"""
+CLI subcommands, one module per command.
+
+Loaded on demand by the `cli` group so that invoking one command never
+imports the others.
+"""
+
+import click
+
+
+# Positional contracts file shared by plan and run
+contracts_file_argument = click.argument("contracts_file", type=click.Path())
+
+
+def missing_path(path: str, param_hint: str) -> click.BadParameter:
+    """
+    Build the error click.Path(exists=True) raises for a missing path.
+    
+    Commands take file arguments as plain click.Path() and let the first
+    real read fail instead of paying for an extra stat during parsing.
+    """
+    return click.BadParameter(
+        f"Path {click.format_filename(path)!r} does not exist.",
+        param_hint=param_hint,
+    )
@@ -0,0 +1,84 @@
+"""
+Extract Command - Extract contracts from a Claude response.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from . import missing_path
+
+
+@click.command()
+@click.argument("response_file", type=click.Path())
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    help="Output file for extracted contracts"
+)
+def extract(response_file: str, output: Optional[str]):
+    """
+    Extract contracts from a Claude response.
+    
+    Parses ---AGENT blocks from Claude's split response
+    and optionally saves them to a file.
+    """
+    from ..parser import ContractParser
+    
+    try:
+        content = Path(response_file).read_text()
+    except FileNotFoundError:
+        raise missing_path(response_file, "'RESPONSE_FILE'") from None
+    contracts, metadata = ContractParser.from_claude_response(content)
+    
+    if not contracts:
+        click.echo("No contracts found in response")
+        sys.exit(1)
+    
+    click.echo(f"Extracted {len(contracts)} contract(s)")
+    
+    if metadata.get('complexity'):
+        click.echo(f"Complexity: {metadata['complexity']}")
+    if metadata.get('execution_mode'):
+        click.echo(f"Execution: {metadata['execution_mode']}")
+    
+    for contract in contracts:
+        click.echo(f"\n---AGENT:{contract.name}")
+        click.echo(f"SCOPE: {', '.join(contract.scope)}")
+        click.echo(f"CANNOT: {', '.join(contract.cannot)}")
+        click.echo(f"DEPENDS: {', '.join(contract.depends) or 'none'}")
+        click.echo(f"PRODUCES: {', '.join(contract.produces)}")
+        click.echo(f"VERIFY: {'; '.join(contract.verify)}")
+        click.echo("---")
+    
+    if output:
+        # Write as YAML for easier editing
+        import yaml
+        
+        # LibYAML's C emitter when PyYAML was built with it
+        try:
+            from yaml import CSafeDumper as SafeDumper
+        except ImportError:
+            from yaml import SafeDumper
+        
+        data = {
+            "agents": [
+                {
+                    "name": c.name,
+                    "scope": c.scope,
+                    "cannot": c.cannot,
+                    "depends": c.depends,
+                    "expects": c.expects,
+                    "produces": c.produces,
+                    "verify": c.verify,
+                }
+                for c in contracts
+            ]
+        }
+        
+        Path(output).write_text(
+            yaml.dump(data, Dumper=SafeDumper, default_flow_style=False)
+        )
+        click.echo(f"\nContracts written to {output}")
@@ -0,0 +1,72 @@
+"""
+Plan Command - Show the execution plan without running.
+"""
+
+import sys
+
+import click
+
+from . import contracts_file_argument, missing_path
+
+
+@click.command()
+@contracts_file_argument
+def plan(contracts_file: str):
+    """
+    Show execution plan without running.
+    
+    Displays:
+    - Dependency graph
+    - Parallel execution groups
+    - Sequential ordering
+    """
+    from ..models import ExecutionPlan
+    from ..parser import ContractParser
+    
+    try:
+        contracts, errors = ContractParser.parse_file(contracts_file)
+    except FileNotFoundError:
+        raise missing_path(contracts_file, "'CONTRACTS_FILE'") from None
+    
+    if not contracts:
+        click.echo("No contracts found")
+        sys.exit(1)
+    
+    # Validate first
+    if errors:
+        click.echo(click.style("Validation errors - cannot plan:", fg="red"))
+        for error in errors:
+            click.echo(f"  ✗ {error}")
+        sys.exit(1)
+    
+    # Build plan
+    plan = ExecutionPlan.from_contracts_cached(contracts)
+    
+    # Collect the report and write it once; each click.echo is a write()
+    lines = ["Execution Plan", "=" * 40, "\nDependency Graph:"]
+    
+    total_scopes = 0
+    for contract in contracts:
+        total_scopes += len(contract.scope)
+        deps = contract.get_dependency_signals()
+        if deps:
+            lines.append(f"  {contract.name} ← {', '.join(deps)}")
+        else:
+            lines.append(f"  {contract.name} (entry point)")
+    
+    lines.append("\nParallel Groups:")
+    max_parallel = 0
+    for i, group in enumerate(plan.parallel_groups):
+        max_parallel = max(max_parallel, len(group))
+        if len(group) > 1:
+            lines.append(f"  Group {i+1} (parallel): {', '.join(group)}")
+        else:
+            lines.append(f"  Group {i+1}: {group[0]}")
+    
+    lines.append(f"\nSequential Order: {' → '.join(plan.sequential_order)}")
+    
+    # Estimate complexity
+    lines.append(f"\nTotal scope patterns: {total_scopes}")
+    lines.append(f"Max parallel agents: {max_parallel}")
+    
+    click.echo("\n".join(lines))
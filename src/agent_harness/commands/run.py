@@ -0,0 +1,225 @@
+"""
+Run Command - Execute agents from a contracts file.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from . import contracts_file_argument, missing_path
+
+from ..models import AgentStatus
+
+
+# Styled status labels, built once rather than per reported agent
+_STATUS_STYLE = {
+    status: click.style(
+        status.value,
+        fg="green" if status == AgentStatus.COMPLETED else "red",
+    )
+    for status in AgentStatus
+}
+
+
+@click.command()
+@contracts_file_argument
+@click.option(
+    "--repo", "-r",
+    type=click.Path(exists=True),
+    default=".",
+    help="Repository root path"
+)
+@click.option(
+    "--goal", "-g",
+    multiple=True,
+    help="Agent goal in format 'agent:goal text'"
+)
+@click.option(
+    "--model", "-m",
+    default="claude-sonnet-4-20250514",
+    help="Claude model to use"
+)
+@click.option(
+    "--protocol", "-p",
+    type=click.Path(exists=True),
+    help="Path to protocol markdown file"
+)
+@click.option(
+    "--docker/--no-docker",
+    default=False,
+    help="Use Docker for isolation"
+)
+@click.option(
+    "--timeout", "-t",
+    default=600,
+    help="Timeout per agent in seconds"
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(),
+    help="Output JSON file for results"
+)
+@click.option(
+    "--verbose", "-v",
+    is_flag=True,
+    help="Verbose output"
+)
+def run(
+    contracts_file: str,
+    repo: str,
+    goal: tuple,
+    model: str,
+    protocol: Optional[str],
+    docker: bool,
+    timeout: int,
+    output: Optional[str],
+    verbose: bool,
+):
+    """
+    Run agents from a contracts file.
+    
+    CONTRACTS_FILE can be markdown with ---AGENT blocks or YAML.
+    
+    Examples:
+    
+        # Run from markdown file
+        agent-harness run contracts.md --repo ./myproject
+        
+        # Run with custom goals
+        agent-harness run contracts.yaml -g "backend:add JWT auth" -g "frontend:add login page"
+        
+        # Run with Docker isolation
+        agent-harness run contracts.md --docker --repo ./myproject
+    """
+    import asyncio
+    import json
+    import logging
+    import os
+    
+    from click.globals import resolve_color_default
+    
+    from ..orchestrator import Orchestrator
+    from ..parser import ContractParser
+    
+    if verbose:
+        logging.basicConfig(level=logging.INFO)
+    
+    # Parse contracts
+    try:
+        contracts, _ = ContractParser.parse_file(contracts_file)
+    except FileNotFoundError:
+        raise missing_path(contracts_file, "'CONTRACTS_FILE'") from None
+    
+    if not contracts:
+        click.echo("No contracts found in file", err=True)
+        sys.exit(1)
+    
+    click.echo(f"Found {len(contracts)} agent(s): {', '.join(c.name for c in contracts)}")
+    
+    # Parse goals
+    goals = {
+        agent: goal_text
+        for agent, sep, goal_text in (g.partition(":") for g in goal)
+        if sep
+    }
+    
+    # Run orchestration
+    async def execute():
+        orchestrator = Orchestrator(
+            repo_root=Path(repo),
+            model=model,
+            protocol_path=Path(protocol) if protocol else None,
+            use_docker=docker,
+            agent_timeout=timeout,
+        )
+        return await orchestrator.run(contracts, goals)
+    
+    # uvloop's libuv loop cuts per-callback scheduling cost when installed
+    try:
+        import uvloop
+    except ImportError:
+        result = asyncio.run(execute())
+    else:
+        result = uvloop.run(execute())
+    
+    # Collect the report and write it once; each click.echo is a write()
+    if result.success:
+        lines = [click.style("\n✓ All agents completed successfully", fg="green")]
+    else:
+        lines = [click.style("\n✗ Some agents failed", fg="red")]
+    
+    lines.append(f"\nExecution order: {' → '.join(result.execution_order)}")
+    lines.append(f"Total duration: {result.total_duration_seconds:.1f}s")
+    
+    # Report each agent and collect its JSON record in the same pass
+    agents_out = {}
+    for name, agent_result in result.agents.items():
+        files_created = list(agent_result.files_created)
+        files_modified = list(agent_result.files_modified)
+        
+        lines += [
+            f"\n{name}:",
+            f"  Status: {_STATUS_STYLE[agent_result.status]}",
+            f"  Duration: {agent_result.duration_seconds:.1f}s",
+            f"  Restarts: {agent_result.restart_count}",
+            f"  Files created: {len(files_created)}",
+            f"  Files modified: {len(files_modified)}",
+            f"  Verification: {'✓' if agent_result.verification_passed else '✗'}",
+        ]
+        
+        if agent_result.error:
+            lines.append(f"  Error: {click.style(agent_result.error, fg='red')}")
+        
+        agents_out[name] = {
+            "status": agent_result.status.value,
+            "duration_seconds": agent_result.duration_seconds,
+            "files_created": files_created,
+            "files_modified": files_modified,
+            "verification_passed": agent_result.verification_passed,
+            "error": agent_result.error,
+            "restart_count": agent_result.restart_count,
+        }
+    
+    if result.errors:
+        lines.append(click.style("\nErrors:", fg="red"))
+        for error in result.errors:
+            lines.append(f"  - {error}")
+    
+    # Encode the report once and hand click bytes, which it writes to the
+    # binary stream without a TextIOWrapper pass. Bytes are not un-styled
+    # by click, so strip ANSI ourselves the way click.echo would.
+    report = "\n".join(lines)
+    color = resolve_color_default()
+    if not (sys.stdout.isatty() if color is None else color):
+        report = click.unstyle(report)
+    click.echo(report.encode(sys.stdout.encoding or "utf-8", "replace"))
+    
+    # Write JSON output
+    if output:
+        output_data = {
+            "success": result.success,
+            "duration_seconds": result.total_duration_seconds,
+            "execution_order": result.execution_order,
+            "agents": agents_out,
+            "signals": [str(s) for s in result.signals],
+            "errors": result.errors,
+        }
+        try:
+            import orjson
+        except ImportError:
+            payload = json.dumps(output_data, indent=2).encode()
+        else:
+            payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+        # Write the encoded bytes straight to the fd; no text layer or buffer
+        fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        click.echo(f"\nResults written to {output}")
+    
+    sys.exit(0 if result.success else 1)
@@ -0,0 +1,109 @@
+"""
+Validate Command - Check contracts for errors.
+"""
+
+import sys
+
+import click
+
+from . import missing_path
+
+
+def _validate_one(path: str) -> tuple[int, list[str]]:
+    """Parse and validate one file; runs in a worker process for batches."""
+    from ..parser import ContractParser
+    
+    contracts, errors = ContractParser.parse_file(path)
+    return len(contracts), errors
+
+
+def _validate_batch(paths: tuple[str, ...]) -> int:
+    """
+    Validate several files in parallel and print one summary per file.
+    
+    Returns the exit code: 1 if any file failed, else 0.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    
+    failed = False
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_validate_one, path) for path in paths]
+        
+        for path, future in zip(paths, futures):
+            try:
+                count, errors = future.result()
+            except FileNotFoundError:
+                raise missing_path(path, "'CONTRACTS_FILES...'") from None
+            except Exception as e:
+                click.echo(f"{path}: {click.style(f'Parse error: {e}', fg='red')}")
+                failed = True
+                continue
+            
+            if not count:
+                click.echo(f"{path}: No contracts found")
+                failed = True
+            elif errors:
+                click.echo(f"{path}: {click.style('Validation errors:', fg='red')}")
+                for error in errors:
+                    click.echo(f"  ✗ {error}")
+                failed = True
+            else:
+                click.echo(
+                    f"{path}: {click.style(f'✓ {count} contract(s) valid', fg='green')}"
+                )
+    
+    return 1 if failed else 0
+
+
+@click.command()
+@click.argument("contracts_files", nargs=-1, required=True, type=click.Path())
+def validate(contracts_files: tuple[str, ...]):
+    """
+    Validate contracts for errors.
+    
+    Checks:
+    - Syntax errors
+    - Overlapping scopes
+    - Missing dependencies
+    - Circular dependencies
+    
+    With several files, each is validated in a separate process and
+    summarized on one line.
+    """
+    from ..parser import ContractParser
+    
+    if len(contracts_files) > 1:
+        sys.exit(_validate_batch(contracts_files))
+    
+    contracts_file = contracts_files[0]
+    
+    try:
+        contracts, errors = ContractParser.parse_file(contracts_file)
+    except FileNotFoundError:
+        raise missing_path(contracts_file, "'CONTRACTS_FILES...'") from None
+    except Exception as e:
+        click.echo(click.style(f"Parse error: {e}", fg="red"))
+        sys.exit(1)
+    
+    if not contracts:
+        click.echo("No contracts found")
+        sys.exit(1)
+    
+    click.echo(f"Found {len(contracts)} contract(s)")
+    
+    if errors:
+        click.echo(click.style("\nValidation errors:", fg="red"))
+        for error in errors:
+            click.echo(f"  ✗ {error}")
+        sys.exit(1)
+    else:
+        click.echo(click.style("\n✓ All contracts valid", fg="green"))
+        
+        for contract in contracts:
+            click.echo(f"\n{contract.name}:")
+            click.echo(f"  Scope: {', '.join(contract.scope)}")
+            click.echo(f"  Cannot: {', '.join(contract.cannot) or '(none)'}")
+            click.echo(f"  Depends: {', '.join(contract.depends) or '(none)'}")
+            click.echo(f"  Produces: {', '.join(contract.produces) or '(none)'}")
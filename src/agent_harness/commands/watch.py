@@ -0,0 +1,87 @@
+"""
+Watch Command - Monitor agent signals as they are emitted.
+"""
+
+from pathlib import Path
+
+import click
+
+
+# Styled signal-type labels, built once rather than per event
+_SIGNAL_STYLE = {
+    signal_type: click.style(signal_type, fg=color)
+    for signal_type, color in {
+        'READY': 'green',
+        'BLOCKED': 'yellow',
+        'FAILED': 'red',
+        'DATA': 'blue',
+        'ESCALATE': 'magenta',
+    }.items()
+}
+
+
+@click.command()
+@click.option(
+    "--signal-dir", "-d",
+    type=click.Path(),
+    default="/tmp/agent_signals",
+    help="Signal directory to watch"
+)
+def watch(signal_dir: str):
+    """
+    Watch agent signals in real-time.
+    
+    Monitors the signal directory and displays
+    signals as they are emitted.
+    """
+    import time
+    
+    # orjson parses the raw bytes in one pass; json.loads accepts bytes too
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+    
+    class SignalHandler(PatternMatchingEventHandler):
+        def __init__(self):
+            # Let watchdog drop non-signal files before dispatching to us
+            super().__init__(patterns=["*.json"], ignore_directories=True)
+        
+        def on_created(self, event):
+            try:
+                data = loads(Path(event.src_path).read_bytes())
+                signal_type = data.get('type', 'UNKNOWN')
+                agent = data.get('agent', 'unknown')
+                payload = data.get('payload', '')
+                
+                styled = _SIGNAL_STYLE.get(signal_type)
+                if styled is None:
+                    styled = click.style(signal_type, fg='white')
+                
+                click.echo(
+                    f"[{time.strftime('%H:%M:%S')}] "
+                    f"{styled}:{agent}"
+                    f"{':' + payload if payload else ''}"
+                )
+            except Exception:
+                pass
+    
+    signal_path = Path(signal_dir)
+    signal_path.mkdir(parents=True, exist_ok=True)
+    
+    click.echo(f"Watching {signal_dir} for signals...")
+    click.echo("Press Ctrl+C to stop\n")
+    
+    observer = Observer()
+    observer.schedule(SignalHandler(), str(signal_path), recursive=True)
+    observer.start()
+    
+    # Block on the observer thread rather than waking up to poll it
+    try:
+        observer.join()
+    except KeyboardInterrupt:
+        observer.stop()
+        observer.join()
@@ -13,16 +13,173 @@ This module:
 """
 
 import asyncio
+import codecs
+import functools
 import json
 import os
 import subprocess
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, AsyncIterator
 import shutil
 
+from .models import _bullets
+
+
+# FICLONE ioctl: share extents between files on Btrfs/XFS (Linux)
+_FICLONE = 0x40049409
+
+
+def _reflink_copy(src: str, dst: str) -> str:
+    """
+    Copy a file as a reflink when the filesystem allows it.
+    
+    Used as copytree's copy_function. Falls back to shutil.copy2 on
+    other platforms, filesystems without reflinks, and symlinks.
+    """
+    if sys.platform.startswith("linux") and not os.path.islink(src):
+        try:
+            import fcntl
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+# Mission prompt for full-power agents; see _render_agent_prompt()
+_AGENT_PROMPT_TEMPLATE = """
+# Agent Mission: {name}
+
+## Your Goal
+{goal}
+
+## Context
+
+You are an autonomous agent working on a specific part of a larger task.
+You have FULL CAPABILITIES - you can:
+- Install any packages you need (npm, pip, apt-get, etc.)
+- Search the web for documentation or solutions
+- Use all available MCP tools
+- Create, modify, delete any files
+- Run any commands
+
+## Your Focus Area
+
+You should primarily work in these areas:
+{scope}
+
+Other agents are handling:
+{cannot}
+
+## What You're Expected to Produce
+{produces}
+
+## How to Verify Success
+{verify}
+
+## Inputs Available
+{expects}
+
+## Instructions
+
+1. Analyze what needs to be done
+2. Install any dependencies you need
+3. Implement the solution
+4. Test your implementation
+5. When complete, create a file `.agent_complete.json` with:
+   ```json
+   {{
+     "status": "complete",
+     "files_created": ["list", "of", "files"],
+     "files_modified": ["list", "of", "files"],
+     "verification": {{
+       "commands_run": ["npm test"],
+       "results": "all passed"
+     }},
+     "notes": "any important notes for integration"
+   }}
+   ```
+
+If you get stuck or need user input:
+- Create `.agent_blocked.json` with the reason and what you need
+
+Work autonomously. Make decisions. Get it done.
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def _render_agent_prompt(
+    name: str,
+    goal: str,
+    scope: tuple[str, ...],
+    cannot: tuple[str, ...],
+    produces: tuple[str, ...],
+    verify: tuple[str, ...],
+    expects: tuple[str, ...],
+) -> str:
+    """Fill in the mission prompt; retried contracts reuse the result."""
+    return _AGENT_PROMPT_TEMPLATE.format(
+        name=name,
+        goal=goal,
+        scope=_bullets(scope, ""),
+        cannot=_bullets(cannot, "- (no other agents specified)"),
+        produces=_bullets(produces, "- Complete the goal"),
+        verify=_bullets(verify, "- Ensure your changes work correctly"),
+        expects=_bullets(expects, "- Standard codebase"),
+    )
+
+
+async def _git(
+    cwd: Path,
+    *args: str,
+    input: Optional[bytes] = None,
+) -> tuple[int, bytes]:
+    """Run a git command in cwd, returning its exit code and stdout."""
+    process = await asyncio.create_subprocess_exec(
+        "git", "-C", str(cwd), *args,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate(input)
+    return process.returncode, stdout
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_container(repo_root: str) -> bool:
+    """Filesystem checks behind FullPowerExecutor._is_dev_container()."""
+    # Check for /workspaces/ path (GitHub Codespaces, VS Code Dev Containers)
+    if repo_root.startswith("/workspaces/"):
+        return True
+    
+    # Check for devcontainer.json in repo, with one directory listing
+    try:
+        with os.scandir(repo_root) as entries:
+            for entry in entries:
+                if entry.name == ".devcontainer.json":
+                    return True
+                if entry.name == ".devcontainer" and entry.is_dir():
+                    if os.path.exists(os.path.join(entry.path, "devcontainer.json")):
+                        return True
+    except OSError:
+        pass
+    
+    # Check for common container indicators
+    return _in_docker()
+
+
+@functools.cache
+def _in_docker() -> bool:
+    """Whether this process runs in a Docker container (fixed per process)."""
+    return os.path.exists("/.dockerenv")
+
 
 @dataclass
 class AgentExecution:
@@ -35,6 +192,82 @@ class AgentExecution:
     finished_at: Optional[datetime] = None
     exit_code: Optional[int] = None
     output: str = ""
+    stderr_output: str = ""
+
+
+class WorkspacePool:
+    """
+    Keeps agent workspaces checked out ahead of time.
+    
+    Creating a worktree is the bulk of the per-agent setup cost before
+    the Claude CLI starts. The pool provisions `size` detached worktrees
+    in the background and hands one out per execution, refilling as it
+    goes, so batch spawns skip that wait.
+    
+    The CLI processes themselves are not pre-spawned: each needs its
+    workspace as cwd and AGENT_* variables that are only known per
+    contract. Non-git repos are not pooled, since a pre-made copy could
+    miss files synced back in the meantime.
+    """
+    
+    def __init__(self, executor: "FullPowerExecutor", size: int = 4):
+        self.executor = executor
+        self.size = size
+        # Ready workspaces, or the errors of provisions that failed
+        self._ready: asyncio.Queue[Path | Exception] = asyncio.Queue()
+        self._refills: set[asyncio.Task] = set()
+        self._counter = 0
+    
+    async def acquire(self) -> Path:
+        """
+        Take a ready workspace, checked out at the repo's current HEAD.
+        
+        Raises the error of the provision that failed to make it; the
+        next call tries a fresh one.
+        """
+        if not self._refills and self._ready.empty():
+            for _ in range(self.size):
+                self._refill()
+        
+        workspace = await self._ready.get()
+        self._refill()
+        if isinstance(workspace, Exception):
+            raise workspace
+        
+        # Earlier agents may have been committed since this was provisioned
+        returncode, head = await _git(self.executor.repo_root, "rev-parse", "HEAD")
+        if returncode == 0:
+            await _git(workspace, "checkout", "-q", "--detach", head.decode().strip())
+        return workspace
+    
+    async def close(self) -> None:
+        """Stop refilling and remove workspaces nobody acquired."""
+        for task in list(self._refills):
+            task.cancel()
+        await asyncio.gather(*self._refills, return_exceptions=True)
+        
+        while not self._ready.empty():
+            workspace = self._ready.get_nowait()
+            if isinstance(workspace, Path):
+                await self.executor._remove_workspace(workspace)
+    
+    def _refill(self) -> None:
+        task = asyncio.create_task(self._provision())
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+    
+    async def _provision(self) -> None:
+        self._counter += 1
+        workspace = self.executor.work_dir / f"pool_{self._counter}_{os.getpid()}"
+        try:
+            workspace.mkdir(parents=True, exist_ok=True)
+            await self.executor._copy_repo_to_workspace(workspace)
+        except Exception as e:
+            # Wake the acquire() waiting for this workspace first
+            await self._ready.put(e)
+            await self.executor._remove_workspace(workspace)
+            return
+        await self._ready.put(workspace)
 
 
 class FullPowerExecutor:
@@ -76,6 +309,7 @@ class FullPowerExecutor:
         inherit_env: bool = True,
         inherit_mcp: bool = True,
         require_container: bool = True,  # Safety check
+        workspace_pool_size: int = 0,  # Pre-provisioned workspaces (git only)
     ):
         self.repo_root = Path(repo_root).resolve()
         self.work_dir = Path(work_dir or tempfile.mkdtemp(prefix="agent_exec_"))
@@ -83,6 +317,14 @@ class FullPowerExecutor:
         self.inherit_env = inherit_env
         self.inherit_mcp = inherit_mcp
         
+        # Environment shared by every agent, snapshotted once
+        self._base_env = dict(os.environ) if inherit_env else {}
+        self._base_env["DOTFILES_CONTAINER"] = "true"  # Signal autonomous mode
+        
+        # Ensure PATH includes common tools
+        if "PATH" in self._base_env:
+            self._base_env["PATH"] = f"/usr/local/bin:/usr/bin:/bin:{self._base_env['PATH']}"
+        
         # Safety check: only run in dev containers
         if require_container and not self._is_dev_container():
             raise RuntimeError(
@@ -98,6 +340,10 @@ class FullPowerExecutor:
         
         self.work_dir.mkdir(parents=True, exist_ok=True)
         self.executions: dict[str, AgentExecution] = {}
+        
+        self.workspace_pool: Optional[WorkspacePool] = None
+        if workspace_pool_size > 0 and (self.repo_root / ".git").exists():
+            self.workspace_pool = WorkspacePool(self, workspace_pool_size)
     
     def _is_dev_container(self) -> bool:
         """Check if running in a dev container."""
@@ -105,43 +351,35 @@ class FullPowerExecutor:
         if os.environ.get("DOTFILES_CONTAINER") == "true":
             return True
         
-        # Check for /workspaces/ path (GitHub Codespaces, VS Code Dev Containers)
-        if self.repo_root.as_posix().startswith("/workspaces/"):
-            return True
-        
-        # Check for devcontainer.json in repo
-        if (self.repo_root / ".devcontainer" / "devcontainer.json").exists():
-            return True
-        if (self.repo_root / ".devcontainer.json").exists():
-            return True
-        
-        # Check for common container indicators
-        if Path("/.dockerenv").exists():
-            return True
-        
-        return False
+        return _probe_container(self.repo_root.as_posix())
     
     async def execute_agent(
         self,
         contract: "Contract",
         on_output: Optional[Callable[[str], None]] = None,
         timeout: float = 600,
+        log: bool = True,
     ) -> AgentExecution:
         """
         Execute an agent as a full Claude Code session.
         
         The agent runs in its own workspace with full capabilities.
         Contract scope is advisory (in the prompt), not enforced.
+        With log=False no .agent_log.txt is written, for callers that
+        already consume output through on_output.
         """
-        # Create workspace
-        workspace = self.work_dir / f"agent_{contract.name}_{os.getpid()}"
-        workspace.mkdir(parents=True, exist_ok=True)
-        
-        # Copy repo to workspace
-        await self._copy_repo_to_workspace(workspace)
+        if self.workspace_pool:
+            workspace = await self.workspace_pool.acquire()
+        else:
+            # Create workspace
+            workspace = self.work_dir / f"agent_{contract.name}_{os.getpid()}"
+            workspace.mkdir(parents=True, exist_ok=True)
+            
+            # Copy repo to workspace
+            await self._copy_repo_to_workspace(workspace)
         
         # Create log file
-        log_file = workspace / ".agent_log.txt"
+        log_file = workspace / ".agent_log.txt" if log else None
         
         # Build the agent prompt
         prompt = self._build_agent_prompt(contract)
@@ -168,7 +406,7 @@ class FullPowerExecutor:
                 env=env,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,
+                stderr=asyncio.subprocess.PIPE,
             )
             execution.process = process
 
@@ -178,37 +416,62 @@ class FullPowerExecutor:
             process.stdin.close()
             await process.stdin.wait_closed()
             
-            # Stream output
-            output_lines = []
-            while True:
-                try:
-                    line = await asyncio.wait_for(
-                        process.stdout.readline(),
-                        timeout=timeout
-                    )
-                    if not line:
-                        break
-                    
-                    decoded = line.decode('utf-8', errors='replace')
-                    output_lines.append(decoded)
+            # Drain stdout and stderr concurrently in large chunks so a
+            # burst on either pipe never blocks the agent. Lines are only
+            # split out for the on_output callback.
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            timed_out = False
+            
+            # Each chunk goes to the log in a single unbuffered write
+            log_fd = None
+            if log_file:
+                log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            
+            async def drain(stream, buf: bytearray) -> None:
+                # Only the callback needs text; storage decodes once at the end
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                pending = ""
+                while chunk := await stream.read(1 << 16):
+                    buf += chunk
+                    if log_fd is not None:
+                        os.write(log_fd, chunk)
                     
                     # Callback for real-time output
                     if on_output:
-                        on_output(decoded)
-                    
-                    # Write to log
-                    with open(log_file, 'a') as f:
-                        f.write(decoded)
-                        
-                except asyncio.TimeoutError:
-                    process.kill()
-                    output_lines.append("\n[TIMEOUT - Agent killed]\n")
-                    break
+                        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+                        for line in lines:
+                            on_output(line + "\n")
+                
+                if on_output:
+                    pending += decoder.decode(b"", final=True)
+                    if pending:
+                        on_output(pending)
+            
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        drain(process.stdout, stdout_buf),
+                        drain(process.stderr, stderr_buf),
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                timed_out = True
+            finally:
+                if log_fd is not None:
+                    os.close(log_fd)
+            
+            output = stdout_buf.decode('utf-8', errors='replace')
+            if timed_out:
+                output += "\n[TIMEOUT - Agent killed]\n"
             
             await process.wait()
             
             execution.exit_code = process.returncode
-            execution.output = "".join(output_lines)
+            execution.output = output
+            execution.stderr_output = stderr_buf.decode('utf-8', errors='replace')
             execution.finished_at = datetime.now()
             
         except Exception as e:
@@ -218,6 +481,31 @@ class FullPowerExecutor:
         
         return execution
     
+    async def execute_agents(
+        self,
+        contracts: list["Contract"],
+        max_concurrent: int = 4,
+        on_output: Optional[Callable[[str], None]] = None,
+        timeout: float = 600,
+    ) -> list[AgentExecution | BaseException]:
+        """
+        Execute independent agents concurrently.
+        
+        At most `max_concurrent` agents run at once. Results are returned
+        in contract order; an agent that raised is returned as its
+        exception rather than aborting the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def run_one(contract: "Contract") -> AgentExecution:
+            async with semaphore:
+                return await self.execute_agent(contract, on_output, timeout)
+        
+        return await asyncio.gather(
+            *(run_one(contract) for contract in contracts),
+            return_exceptions=True,
+        )
+    
     def _build_agent_prompt(self, contract: "Contract") -> str:
         """
         Build the prompt that gives the agent its mission.
@@ -225,82 +513,25 @@ class FullPowerExecutor:
         This is CONTEXT, not RESTRICTION. The agent has full powers
         but is told what to focus on.
         """
-        return f"""
-# Agent Mission: {contract.name}
-
-## Your Goal
-{contract.goal}
-
-## Context
-
-You are an autonomous agent working on a specific part of a larger task.
-You have FULL CAPABILITIES - you can:
-- Install any packages you need (npm, pip, apt-get, etc.)
-- Search the web for documentation or solutions
-- Use all available MCP tools
-- Create, modify, delete any files
-- Run any commands
-
-## Your Focus Area
-
-You should primarily work in these areas:
-{chr(10).join(f"- {s}" for s in contract.scope)}
-
-Other agents are handling:
-{chr(10).join(f"- {c}" for c in contract.cannot) if contract.cannot else "- (no other agents specified)"}
-
-## What You're Expected to Produce
-{chr(10).join(f"- {p}" for p in contract.produces) if contract.produces else "- Complete the goal"}
-
-## How to Verify Success
-{chr(10).join(f"- {v}" for v in contract.verify) if contract.verify else "- Ensure your changes work correctly"}
-
-## Inputs Available
-{chr(10).join(f"- {e}" for e in contract.expects) if contract.expects else "- Standard codebase"}
-
-## Instructions
-
-1. Analyze what needs to be done
-2. Install any dependencies you need
-3. Implement the solution
-4. Test your implementation
-5. When complete, create a file `.agent_complete.json` with:
-   ```json
-   {{
-     "status": "complete",
-     "files_created": ["list", "of", "files"],
-     "files_modified": ["list", "of", "files"],
-     "verification": {{
-       "commands_run": ["npm test"],
-       "results": "all passed"
-     }},
-     "notes": "any important notes for integration"
-   }}
-   ```
-
-If you get stuck or need user input:
-- Create `.agent_blocked.json` with the reason and what you need
-
-Work autonomously. Make decisions. Get it done.
-"""
+        return _render_agent_prompt(
+            contract.name,
+            contract.goal,
+            tuple(contract.scope),
+            tuple(contract.cannot),
+            tuple(contract.produces),
+            tuple(contract.verify),
+            tuple(contract.expects),
+        )
     
     def _build_environment(self, contract: "Contract", workspace: Path) -> dict:
         """Build environment for agent process."""
-        env = os.environ.copy() if self.inherit_env else {}
-        
-        # Agent-specific vars
-        env.update({
+        # Agent-specific vars on top of the shared base
+        return {
+            **self._base_env,
             "AGENT_NAME": contract.name,
             "AGENT_WORKSPACE": str(workspace),
             "AGENT_GOAL": contract.goal,
-            "DOTFILES_CONTAINER": "true",  # Signal autonomous mode
-        })
-        
-        # Ensure PATH includes common tools
-        if "PATH" in env:
-            env["PATH"] = f"/usr/local/bin:/usr/bin:/bin:{env['PATH']}"
-        
-        return env
+        }
     
     def _build_command(
         self,
@@ -333,10 +564,25 @@ Work autonomously. Make decisions. Get it done.
         return cmd
     
     async def _copy_repo_to_workspace(self, workspace: Path) -> None:
-        """Copy repository to workspace."""
-        # Use git clone if it's a git repo (preserves history)
+        """
+        Materialize the repository in the workspace.
+        
+        Git repos get a detached worktree, which shares the object
+        database instead of copying it. Other trees are copied with
+        reflinks where the filesystem supports them.
+        """
         git_dir = self.repo_root / ".git"
         if git_dir.exists():
+            process = await asyncio.create_subprocess_exec(
+                "git", "-C", str(self.repo_root),
+                "worktree", "add", "--detach", str(workspace),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            if await process.wait() == 0:
+                return
+            
+            # Fall back to a full clone (e.g. git too old for worktrees)
             process = await asyncio.create_subprocess_exec(
                 "git", "clone", "--local", str(self.repo_root), str(workspace),
                 stdout=asyncio.subprocess.DEVNULL,
@@ -344,15 +590,30 @@ Work autonomously. Make decisions. Get it done.
             )
             await process.wait()
         else:
-            # Copy files
-            shutil.copytree(
-                self.repo_root, 
-                workspace, 
+            # Copy files off the event loop
+            await asyncio.to_thread(
+                shutil.copytree,
+                self.repo_root,
+                workspace,
                 dirs_exist_ok=True,
                 ignore=shutil.ignore_patterns(
                     'node_modules', '__pycache__', '.git', 'venv', '.env'
-                )
+                ),
+                copy_function=_reflink_copy,
+            )
+    
+    async def _remove_workspace(self, workspace: Path) -> None:
+        """Remove a workspace, detaching it from the repo if a worktree."""
+        if (workspace / ".git").is_file():
+            process = await asyncio.create_subprocess_exec(
+                "git", "-C", str(self.repo_root),
+                "worktree", "remove", "--force", str(workspace),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
+            await process.wait()
+        if workspace.exists():
+            await asyncio.to_thread(shutil.rmtree, workspace)
     
     async def get_agent_result(self, name: str) -> Optional[dict]:
         """Get the result from an agent's completion file."""
@@ -379,51 +640,106 @@ Work autonomously. Make decisions. Get it done.
         if not execution or not execution.workspace:
             return {}
         
-        synced = {}
+        workspace = execution.workspace
         
         # If git repo, get diff
-        git_dir = execution.workspace / ".git"
+        git_dir = workspace / ".git"
         if git_dir.exists():
-            # Get list of changed files
-            process = await asyncio.create_subprocess_exec(
-                "git", "diff", "--name-only", "HEAD",
-                cwd=execution.workspace,
-                stdout=asyncio.subprocess.PIPE,
+            # New files only show up in the diff once git knows of them;
+            # the agent's status files and the log stay out
+            await _git(
+                workspace, "add", "--all", "--intent-to-add",
+                "--", ".", ":(exclude).agent*",
             )
-            stdout, _ = await process.communicate()
             
-            for line in stdout.decode().strip().split('\n'):
-                if line:
-                    src = execution.workspace / line
-                    dst = self.repo_root / line
-                    if src.exists():
-                        dst.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(src, dst)
-                        synced[line] = dst
-        else:
-            # Manual diff (compare modification times)
-            for src in execution.workspace.rglob('*'):
-                if src.is_file() and not src.name.startswith('.agent'):
-                    rel = src.relative_to(execution.workspace)
-                    dst = self.repo_root / rel
-                    
-                    # Copy if new or modified
-                    if not dst.exists() or src.stat().st_mtime > dst.stat().st_mtime:
-                        dst.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(src, dst)
-                        synced[str(rel)] = dst
+            # Changed files and their patch; deletions are not synced back
+            diff = ["diff", "--diff-filter=d"]
+            (_, names), (_, patch) = await asyncio.gather(
+                _git(workspace, *diff, "--name-only", "-z", "HEAD"),
+                _git(workspace, *diff, "--binary", "HEAD"),
+            )
+            changed = [name for name in names.decode().split('\0') if name]
+            if not changed:
+                return {}
+            
+            # Apply as one patch stream; if the main tree has diverged,
+            # fall back to copying the files (one thread hop for all)
+            returncode, _ = await _git(self.repo_root, "apply", "--binary", input=patch)
+            if returncode == 0:
+                return {name: self.repo_root / name for name in changed}
+            return await asyncio.to_thread(self._copy_back, workspace, changed)
         
+        # Manual diff (compare modification times)
+        return await asyncio.to_thread(self._sync_by_mtime, workspace)
+    
+    def _copy_back(self, workspace: Path, changed: list[str]) -> dict[str, Path]:
+        """Copy the listed workspace files that still exist into the repo."""
+        synced = {}
+        for line in changed:
+            src = workspace / line
+            dst = self.repo_root / line
+            if src.exists():
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(src, dst)
+                synced[line] = dst
         return synced
     
+    def _sync_by_mtime(self, workspace: Path) -> dict[str, Path]:
+        """Copy workspace files that are new or newer than the repo's."""
+        root = str(workspace)
+        
+        def walk(directory: str):
+            # DirEntry caches its stat, so each file costs one syscall
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from walk(entry.path)
+                    elif entry.is_file() and not entry.name.startswith('.agent'):
+                        yield entry
+        
+        # Copy if new or modified
+        to_copy = []
+        for entry in walk(root):
+            rel = os.path.relpath(entry.path, root)
+            dst = self.repo_root / rel
+            try:
+                if entry.stat().st_mtime <= os.stat(dst).st_mtime:
+                    continue
+            except FileNotFoundError:
+                pass
+            to_copy.append((rel, entry.path, dst))
+        
+        def copy(src: str, dst: Path) -> None:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst)
+        
+        # Overlap the copies so the disk sees more than one request at once
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(copy, src, dst) for _, src, dst in to_copy]:
+                future.result()
+        
+        return {rel: dst for rel, _, dst in to_copy}
+    
     async def cleanup(self, name: Optional[str] = None) -> None:
         """Clean up workspace(s)."""
         if name:
             execution = self.executions.get(name)
             if execution and execution.workspace and execution.workspace.exists():
-                shutil.rmtree(execution.workspace)
+                await self._remove_workspace(execution.workspace)
         else:
+            if self.workspace_pool:
+                await self.workspace_pool.close()
             if self.work_dir.exists():
-                shutil.rmtree(self.work_dir)
+                await asyncio.to_thread(shutil.rmtree, self.work_dir)
+            
+            # Drop worktree records whose directories went with work_dir
+            if (self.repo_root / ".git").exists():
+                process = await asyncio.create_subprocess_exec(
+                    "git", "-C", str(self.repo_root), "worktree", "prune",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await process.wait()
 
 
 class DelegatingExecutor:
@@ -460,7 +776,7 @@ class DelegatingExecutor:
         """
         import anthropic
         
-        client = anthropic.Anthropic(api_key=self.api_key)
+        client = anthropic.AsyncAnthropic(api_key=self.api_key)
         
         # Build system prompt with full permissions
         system = f"""
@@ -509,45 +825,51 @@ If blocked, call 'signal_blocked' with what you need.
         messages = [{"role": "user", "content": f"Execute your mission: {contract.goal}"}]
         
         # Agentic loop
-        while True:
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=8192,
-                system=system,
-                tools=tools,
-                messages=messages,
-            )
-            
-            # Process response
-            assistant_content = []
-            result = None
-            
-            for block in response.content:
-                if block.type == "text":
+        try:
+            while True:
+                # Stream so on_message sees text as it arrives and the
+                # event loop stays free for other agents meanwhile
+                async with client.messages.stream(
+                    model=self.model,
+                    max_tokens=8192,
+                    system=system,
+                    tools=tools,
+                    messages=messages,
+                ) as stream:
                     if on_message:
-                        on_message(block.text)
-                    assistant_content.append({"type": "text", "text": block.text})
+                        async for text in stream.text_stream:
+                            on_message(text)
+                    response = await stream.get_final_message()
                 
-                elif block.type == "tool_use":
-                    assistant_content.append({
-                        "type": "tool_use",
-                        "id": block.id,
-                        "name": block.name,
-                        "input": block.input,
-                    })
+                # Process response
+                assistant_content = []
+                
+                for block in response.content:
+                    if block.type == "text":
+                        assistant_content.append({"type": "text", "text": block.text})
                     
-                    # Check for completion signals
-                    if block.name == "signal_complete":
-                        return {"status": "complete", **block.input}
-                    elif block.name == "signal_blocked":
-                        return {"status": "blocked", **block.input}
-            
-            messages.append({"role": "assistant", "content": assistant_content})
-            
-            # Handle tool calls (would need actual tool execution here)
-            # This is where you'd integrate with MCP tool handlers
-            
-            if response.stop_reason == "end_turn":
-                break
+                    elif block.type == "tool_use":
+                        assistant_content.append({
+                            "type": "tool_use",
+                            "id": block.id,
+                            "name": block.name,
+                            "input": block.input,
+                        })
+                        
+                        # Check for completion signals
+                        if block.name == "signal_complete":
+                            return {"status": "complete", **block.input}
+                        elif block.name == "signal_blocked":
+                            return {"status": "blocked", **block.input}
+                
+                messages.append({"role": "assistant", "content": assistant_content})
+                
+                # Handle tool calls (would need actual tool execution here)
+                # This is where you'd integrate with MCP tool handlers
+                
+                if response.stop_reason == "end_turn":
+                    break
+        finally:
+            await client.close()
         
         return {"status": "incomplete", "output": "Agent ended without signaling"}
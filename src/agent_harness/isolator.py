@@ -5,24 +5,192 @@ Creates isolated environments where agents can only see/modify
 files within their declared SCOPE.
 
 Isolation mechanisms:
-1. Docker containers with volume mounts
+1. Docker containers with volume mounts (one per agent, mounting only
+   its workspace and signal directory)
 2. Read-only mounts for CANNOT paths
 3. Workspace overlay for modifications
+
+When the kernel allows it (root with overlay support), the workspace is
+an OverlayFS mount over a private snapshot of the scoped files, so the
+agent's writes land in a separate upper layer that sync_back reads
+directly. Otherwise scoped files are copied into a plain directory.
 """
 
 import asyncio
+import collections
+import functools
 import json
+import mmap
 import os
+import re
 import shutil
+import stat
+import sys
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 import fnmatch
 import hashlib
 
+from .command_output import CommandOutput, collect_output
 from .models import Contract
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Directories never copied into or shown in a workspace
+_SKIP_DIR = re.compile(r"\.|(?:node_modules|__pycache__|venv)$")
+
+# Directories sync_back does not look into
+_HIDDEN_DIR = re.compile(r"\.")
+
+# RAM-backed filesystem for workspaces on Linux
+_SHM_DIR = "/dev/shm"
+
+# Main process of agent containers; commands arrive via exec
+_KEEPALIVE = ["sleep", "infinity"]
+
+# Host part is ignored on a unix socket connection
+_DOCKER_HOST = "http://docker"
+
+
+class _DockerNotFound(RuntimeError):
+    """The daemon answered 404, e.g. for a missing image or container."""
+
+
+class _DockerAPI:
+    """
+    Minimal Docker Engine API client over the daemon's unix socket.
+    
+    Spares forking the docker CLI for every container operation. Only
+    used when aiohttp is installed and the socket exists; otherwise the
+    isolator shells out to `docker`.
+    """
+    
+    def __init__(self, socket_path: str = DOCKER_SOCKET):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.UnixConnector(path=socket_path)
+        )
+        # Unversioned until negotiate_version() asks the daemon
+        self._base = _DOCKER_HOST
+    
+    async def negotiate_version(self) -> None:
+        """Pin requests to the API version the daemon reports."""
+        version = await self._request("GET", "/version")
+        self._base = f"{_DOCKER_HOST}/v{version['ApiVersion']}"
+    
+    async def _request(self, method: str, path: str, **kwargs):
+        """Send a request and return the decoded JSON body, if any."""
+        async with self._session.request(
+            method, f"{self._base}{path}", **kwargs
+        ) as resp:
+            body = await resp.read()
+            if resp.status >= 400:
+                error = _DockerNotFound if resp.status == 404 else RuntimeError
+                raise error(body.decode(errors="replace").strip())
+            return json.loads(body) if body else None
+    
+    async def create_container(self, name: str, config: dict) -> str:
+        """Create a container and return its ID, pulling a missing image."""
+        try:
+            created = await self._request(
+                "POST", "/containers/create", params={"name": name}, json=config
+            )
+        except _DockerNotFound:
+            # Unlike `docker create`, the API does not pull the image itself
+            await self.pull_image(config["Image"])
+            created = await self._request(
+                "POST", "/containers/create", params={"name": name}, json=config
+            )
+        return created["Id"]
+    
+    async def pull_image(self, image: str) -> None:
+        """Pull an image, like `docker pull`."""
+        params = {"fromImage": image}
+        if "@" not in image and ":" not in image.rsplit("/", 1)[-1]:
+            # Without a tag the API pulls every tag of the image
+            params["tag"] = "latest"
+        
+        # Pulls can outlast the session's default timeout
+        async with self._session.post(
+            f"{self._base}/images/create",
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=None),
+        ) as resp:
+            body = await resp.read()
+            if resp.status >= 400:
+                raise RuntimeError(body.decode(errors="replace").strip())
+        
+        # Failures during the pull still answer 200, with the error as
+        # the last object of the JSON progress stream
+        for line in body.splitlines():
+            if line.strip():
+                progress = json.loads(line)
+                if "error" in progress:
+                    raise RuntimeError(progress["error"])
+    
+    async def start_container(self, container_id: str) -> None:
+        """Start a created container."""
+        await self._request("POST", f"/containers/{container_id}/start")
+    
+    async def remove_container(self, container_id: str) -> None:
+        """Kill and remove a container, like `docker rm -f`."""
+        await self._request(
+            "DELETE", f"/containers/{container_id}", params={"force": "1"}
+        )
+    
+    async def exec(
+        self,
+        container_id: str,
+        cmd: list[str],
+        workdir: str,
+        env: list[str],
+    ) -> tuple[int, str, str]:
+        """Run cmd in the container and return (exit_code, stdout, stderr)."""
+        exec_id = (await self._request(
+            "POST", f"/containers/{container_id}/exec",
+            json={
+                "Cmd": cmd,
+                "WorkingDir": workdir,
+                "Env": env,
+                "AttachStdout": True,
+                "AttachStderr": True,
+            },
+        ))["Id"]
+        
+        # Without a TTY the output is multiplexed into frames with an
+        # 8-byte header: stream type (1 or 2), padding, big-endian length
+        output = {1: CommandOutput(), 2: CommandOutput()}
+        async with self._session.post(
+            f"{self._base}/exec/{exec_id}/start",
+            json={"Detach": False, "Tty": False},
+        ) as resp:
+            if resp.status >= 400:
+                raise RuntimeError((await resp.text()).strip())
+            while True:
+                try:
+                    header = await resp.content.readexactly(8)
+                except asyncio.IncompleteReadError:
+                    break
+                frame = await resp.content.readexactly(
+                    int.from_bytes(header[4:], "big")
+                )
+                if header[0] in output:
+                    output[header[0]].feed(frame)
+        
+        info = await self._request("GET", f"/exec/{exec_id}/json")
+        return info["ExitCode"], output[1].text(), output[2].text()
+    
+    async def close(self) -> None:
+        """Close the socket connection pool."""
+        await self._session.close()
+
 
 @dataclass
 class IsolatedWorkspace:
@@ -41,32 +209,232 @@ class IsolatedWorkspace:
     signal_dir: Path
     
     # Tracking
-    files_written: list[str]
-    files_read: list[str]
+    files_written: set[str] = field(default_factory=set)
+    files_read: set[str] = field(default_factory=set)
+    
+    # Holds upper/ and work/ when workspace_path is an overlay mount
+    overlay_dir: Optional[Path] = None
+    
+    # rel_path -> (size, mtime_ns) of each file copied into a non-overlay
+    # workspace, so sync_back can spot untouched files without the repo
+    original_stats: Optional[dict[str, tuple[int, int]]] = None
+    
+    # Repo files within the contract's scope when the workspace was made;
+    # sync_back never overwrites other existing repo files
+    scoped_files: Optional[frozenset[str]] = None
+    
+    # target -> rel_path -> (size, mtime_ns) of files checked by the last
+    # sync_back there; files still matching are skipped on the next one
+    _sync_stats: dict[Path, dict[str, tuple[int, int]]] = field(
+        default_factory=dict, repr=False
+    )
+    
+    # Maps handed out by get_modifications_lazy(), closed in cleanup()
+    _mapped: list[tuple[mmap.mmap, memoryview]] = field(
+        default_factory=list, repr=False
+    )
+    
+    # Removes container_id; set by the isolator that started it
+    _remove_container: Optional[Callable[[str], Awaitable[None]]] = field(
+        default=None, repr=False
+    )
     
     async def get_modifications(self) -> dict[str, str]:
         """Get all files modified by the agent."""
+        mapped = await asyncio.to_thread(self._map_modifications)
         mods = {}
-        for rel_path in self.files_written:
-            full_path = self.workspace_path / rel_path
-            if full_path.exists():
-                mods[rel_path] = full_path.read_text()
+        for rel_path, (mm, view) in mapped.items():
+            mods[rel_path] = str(view, "utf-8")
+            _unmap(mm, view)
         return mods
     
+    async def get_modifications_lazy(self) -> dict[str, memoryview]:
+        """
+        Get all files modified by the agent as read-only memory maps.
+        
+        Nothing is read or decoded up front, so callers can peek at
+        large outputs cheaply. The views stay valid until cleanup().
+        """
+        mapped = await asyncio.to_thread(self._map_modifications)
+        self._mapped.extend(mapped.values())
+        return {rel_path: view for rel_path, (_, view) in mapped.items()}
+    
+    def _map_modifications(self) -> dict[str, tuple[Optional[mmap.mmap], memoryview]]:
+        """Map each written file that still exists."""
+        mapped = {}
+        for rel_path in self.files_written:
+            try:
+                fd = os.open(self.workspace_path / rel_path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                if os.fstat(fd).st_size:
+                    mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+                    mapped[rel_path] = (mm, memoryview(mm))
+                else:
+                    # Empty files cannot be mapped
+                    mapped[rel_path] = (None, memoryview(b""))
+            finally:
+                os.close(fd)
+        return mapped
+    
     async def cleanup(self) -> None:
-        """Remove the isolated workspace."""
-        if self.container_id:
-            proc = await asyncio.create_subprocess_exec(
-                "docker", "rm", "-f", self.container_id,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
+        """Remove the isolated workspace and its container."""
+        if self.container_id and self._remove_container:
+            await self._remove_container(self.container_id)
+        
+        for mm, view in self._mapped:
+            _unmap(mm, view)
+        self._mapped.clear()
+        
+        if self.overlay_dir:
+            await _unmount(self.workspace_path)
+            if self.overlay_dir.exists():
+                shutil.rmtree(self.overlay_dir)
         
         if self.workspace_path.exists():
             shutil.rmtree(self.workspace_path)
 
 
+def _unmap(mm: Optional[mmap.mmap], view: memoryview) -> None:
+    """Release a view and close its map, unless a caller still holds slices."""
+    try:
+        view.release()
+        if mm is not None:
+            mm.close()
+    except BufferError:
+        pass
+
+
+# Files copied concurrently by _copy_scoped_files
+_COPY_BATCH = 64
+
+
+def _fast_copy(src: Path, dst: Path) -> os.stat_result:
+    """
+    Copy a file's bytes in the kernel, keeping its mtime.
+    
+    Uses copy_file_range where available (and sendfile otherwise), so
+    data never passes through Python buffers. The mtime is preserved
+    for _files_differ; the mode only for executables, since workspace
+    copies don't need the rest of copy2's metadata.
+    
+    Returns:
+        The source file's stat, taken before copying
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        st = os.fstat(fsrc.fileno())
+        remaining = st.st_size
+        if hasattr(os, "copy_file_range"):
+            copy = os.copy_file_range
+        else:
+            def copy(fd_in, fd_out, count):
+                return os.sendfile(fd_out, fd_in, None, count)
+        while remaining > 0:
+            try:
+                copied = copy(fsrc.fileno(), fdst.fileno(), remaining)
+            except OSError:
+                # Unsupported between these filesystems
+                shutil.copyfileobj(fsrc, fdst)
+                break
+            if not copied:
+                break
+            remaining -= copied
+    
+    if st.st_mode & 0o111:
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return st
+
+
+def _iter_files(root: str | Path, skip_dir: re.Pattern):
+    """
+    Yield (rel_path, entry) for every file below root.
+    
+    Uses os.scandir directly so callers get DirEntry objects, whose
+    type checks come from the directory listing and whose stat() is
+    cached. Directories matching skip_dir are not descended into.
+    """
+    stack = [(os.fspath(root), "")]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Like os.walk, symlinks to directories are neither
+                # followed nor yielded as files
+                if entry.is_dir():
+                    if not entry.is_symlink() and not skip_dir.match(entry.name):
+                        stack.append((entry.path, f"{prefix}{entry.name}{os.sep}"))
+                else:
+                    yield prefix + entry.name, entry
+
+
+def _files_differ(
+    a: Path,
+    b: Path,
+    stat_a: Optional[os.stat_result] = None,
+    stat_b: Optional[os.stat_result] = None,
+    chunk_size: int = 64 * 1024,
+) -> bool:
+    """
+    Check whether two files have different contents.
+    
+    Workspace copies keep the original's mtime (copy2), so a file with
+    the same size and mtime is treated as untouched without reading it.
+    Otherwise the files are compared chunk by chunk, stopping at the
+    first difference. Stats the caller already has can be passed in.
+    """
+    stat_a = stat_a or os.stat(a)
+    stat_b = stat_b or os.stat(b)
+    if stat_a.st_size != stat_b.st_size:
+        return True
+    if stat_a.st_mtime_ns == stat_b.st_mtime_ns:
+        return False
+    
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk = fa.read(chunk_size)
+            if chunk != fb.read(chunk_size):
+                return True
+            if not chunk:
+                return False
+
+
+# Accesses remembered by each ScopeEnforcer for get_violations()
+_ACCESS_LOG_SIZE = 10_000
+
+
+def _copy_back(changed: list[tuple[str, str]], target: Path) -> dict[str, Path]:
+    """
+    Copy (rel_path, source) pairs under target for sync_back.
+    
+    Destination directories are created once each, parents first,
+    rather than once per file.
+    
+    Returns:
+        Dict of relative_path -> absolute_path of the copied files
+    """
+    synced = {rel_path: target / rel_path for rel_path, _ in changed}
+    
+    for directory in sorted({path.parent for path in synced.values()}):
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    for rel_path, source in changed:
+        shutil.copy2(source, synced[rel_path])
+    
+    return synced
+
+
+async def _unmount(path: Path) -> None:
+    """Unmount an overlay workspace, ignoring paths that are not mounted."""
+    proc = await asyncio.create_subprocess_exec(
+        "umount", str(path),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await proc.wait()
+
+
 class FilesystemIsolator:
     """
     Creates isolated filesystems for agents based on their contracts.
@@ -75,6 +443,10 @@ class FilesystemIsolator:
     - SCOPE paths are mounted read-write
     - CANNOT paths are not visible
     - All modifications go to an overlay directory
+    
+    Without an explicit work_dir, workspaces are created in RAM-backed
+    /dev/shm when work_dir_tmpfs is True. Every workspace holds a copy
+    of its agent's scope, overlay or not, so this is opt-in.
     """
     
     def __init__(
@@ -82,14 +454,64 @@ class FilesystemIsolator:
         repo_root: Path,
         work_dir: Optional[Path] = None,
         use_docker: bool = True,
-        docker_image: str = "python:3.11-slim"
+        docker_image: str = "python:3.11-slim",
+        work_dir_tmpfs: bool = False,
     ):
+        # Mounting needs root on Linux; cleared after the first failed mount
+        # so later agents copy directly
+        self._overlay_supported = (
+            sys.platform.startswith("linux") and os.geteuid() == 0
+        )
+        
+        tmp_root = _SHM_DIR if work_dir_tmpfs and os.path.isdir(_SHM_DIR) else None
+        
         self.repo_root = Path(repo_root).resolve()
-        self.work_dir = Path(work_dir or tempfile.mkdtemp(prefix="agent_harness_"))
+        self.work_dir = Path(
+            work_dir or tempfile.mkdtemp(prefix="agent_harness_", dir=tmp_root)
+        )
         self.use_docker = use_docker
         self.docker_image = docker_image
         
         self.work_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Containers started and not yet removed
+        self._containers: set[str] = set()
+        
+        # Environment for local commands, built once
+        self._child_env = {**os.environ, "AGENT_ISOLATED": "true"}
+        
+        # Created on first use, inside the running event loop; cleared
+        # for good once the socket API fails, leaving the docker CLI
+        self._docker: Optional[_DockerAPI] = None
+        self._docker_api_usable = aiohttp is not None
+    
+    async def _get_docker(self) -> Optional[_DockerAPI]:
+        """Return the socket API client, or None to use the docker CLI."""
+        if (
+            self._docker is None
+            and self._docker_api_usable
+            and os.path.exists(DOCKER_SOCKET)
+        ):
+            docker = _DockerAPI(DOCKER_SOCKET)
+            try:
+                await docker.negotiate_version()
+            except (aiohttp.ClientError, RuntimeError, KeyError, TypeError):
+                await docker.close()
+                self._docker_api_usable = False
+                return None
+            if self._docker is None:
+                self._docker = docker
+            else:
+                # Another caller negotiated meanwhile
+                await docker.close()
+        return self._docker
+    
+    async def _drop_docker(self) -> None:
+        """Switch to the docker CLI after the socket API failed."""
+        docker, self._docker = self._docker, None
+        self._docker_api_usable = False
+        if docker:
+            await docker.close()
     
     async def create_workspace(
         self, 
@@ -107,55 +529,186 @@ class FilesystemIsolator:
             IsolatedWorkspace with configured isolation
         """
         # Create workspace directory
-        workspace_id = hashlib.sha256(
-            f"{contract.name}_{os.getpid()}".encode()
-        ).hexdigest()[:12]
+        workspace_id = hashlib.blake2b(
+            f"{contract.name}_{os.getpid()}".encode(), digest_size=6
+        ).hexdigest()
         
         workspace_path = self.work_dir / f"agent_{contract.name}_{workspace_id}"
         workspace_path.mkdir(parents=True, exist_ok=True)
         
-        # Copy scoped files to workspace
-        await self._copy_scoped_files(contract, workspace_path)
-        
-        container_id = None
-        if self.use_docker:
-            container_id = await self._create_container(
-                contract, workspace_path, signal_dir
-            )
-        
-        return IsolatedWorkspace(
+        overlay_dir, original_stats, scoped_files = await self._prepare_workspace(
+            contract, workspace_path
+        )
+        workspace = IsolatedWorkspace(
             agent_name=contract.name,
-            container_id=container_id,
+            container_id=None,
             workspace_path=workspace_path,
             repo_root=self.repo_root,
             signal_dir=signal_dir,
-            files_written=[],
-            files_read=[],
+            overlay_dir=overlay_dir,
+            original_stats=original_stats,
+            scoped_files=scoped_files,
+            _remove_container=self._remove_container,
         )
+        
+        # The container is created only once the overlay is mounted. A
+        # mount made later would need mount propagation to reach it,
+        # which Docker refuses when the host's mounts are private
+        if self.use_docker:
+            try:
+                workspace.container_id = await self._create_container(
+                    contract, workspace_path, signal_dir
+                )
+            except BaseException:
+                await workspace.cleanup()
+                raise
+        
+        return workspace
+    
+    async def _prepare_workspace(
+        self,
+        contract: Contract,
+        workspace_path: Path,
+    ) -> tuple[
+        Optional[Path], Optional[dict[str, tuple[int, int]]], frozenset[str]
+    ]:
+        """
+        Mount an overlay over a copy of the scope, or use the copy directly.
+        
+        Raises:
+            RuntimeError: If the scoped files could not be copied, e.g.
+                because the work directory is out of space
+        
+        Returns:
+            Tuple of (overlay_dir, original_stats, scoped_files); exactly
+            one of the first two is None
+        """
+        overlay_dir = workspace_path.with_name(f"{workspace_path.name}.overlay")
+        lower = overlay_dir / "lower" if self._overlay_supported else workspace_path
+        try:
+            lower.mkdir(parents=True, exist_ok=True)
+            original_stats = await self._copy_scoped_files(contract, lower)
+        except OSError as e:
+            # Don't leave a partial copy behind in the work directory
+            shutil.rmtree(overlay_dir, ignore_errors=True)
+            shutil.rmtree(workspace_path, ignore_errors=True)
+            raise RuntimeError(
+                f"Failed to copy the scope of {contract.name}: {e}"
+            ) from e
+        scoped_files = frozenset(original_stats)
+        
+        if lower != workspace_path:
+            if await self._mount_overlay(workspace_path, overlay_dir):
+                return overlay_dir, None, scoped_files
+            
+            # The snapshot already holds the scope, so it becomes the
+            # workspace; renames keep the mtimes original_stats recorded
+            for entry in os.scandir(lower):
+                os.replace(entry.path, workspace_path / entry.name)
+            shutil.rmtree(overlay_dir, ignore_errors=True)
+        
+        return None, original_stats, scoped_files
+    
+    async def _mount_overlay(self, workspace_path: Path, overlay_dir: Path) -> bool:
+        """
+        Mount overlay_dir/lower at workspace_path with a writable layer.
+        
+        lower holds a copy (reflinked where the filesystem supports it)
+        of the scoped files. The live repo cannot be the lowerdir:
+        changing it while mounted, as sync_back does, is undefined for
+        OverlayFS, and files added later would show up in the
+        workspace. The agent's writes are copied up into
+        overlay_dir/upper.
+        
+        Returns:
+            Whether the overlay was mounted
+        """
+        lower = overlay_dir / "lower"
+        upper = overlay_dir / "upper"
+        work = overlay_dir / "work"
+        upper.mkdir(exist_ok=True)
+        work.mkdir(exist_ok=True)
+        
+        proc = await asyncio.create_subprocess_exec(
+            "mount", "-t", "overlay", "overlay",
+            "-o", f"lowerdir={lower},upperdir={upper},workdir={work}",
+            str(workspace_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        if await proc.wait() != 0:
+            self._overlay_supported = False
+            return False
+        
+        return True
+    
+    def _walk_scope(self, contract: Contract):
+        """
+        Walk the repo, splitting each directory's files by contract scope.
+        
+        Yields (rel_root, skipped_dirs, allowed_files, denied_files) with
+        rel_root relative to the repo ("" at the top). Skipped
+        directories (hidden, node_modules, ...) are not descended into.
+        """
+        scope_re = contract._compile_scope()
+        
+        stack = [(str(self.repo_root), "")]
+        while stack:
+            path, prefix = stack.pop()
+            skipped, allowed, denied = [], [], []
+            
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        if _SKIP_DIR.match(name):
+                            skipped.append(name)
+                        elif not entry.is_symlink():
+                            stack.append((entry.path, f"{prefix}{name}{os.sep}"))
+                        continue
+                    
+                    if scope_re and scope_re.match(prefix + name):
+                        allowed.append(name)
+                    else:
+                        denied.append(name)
+            
+            yield prefix, skipped, allowed, denied
     
     async def _copy_scoped_files(
         self, 
         contract: Contract, 
         workspace_path: Path
-    ) -> None:
-        """Copy only files matching scope patterns to workspace."""
-        for root, dirs, files in os.walk(self.repo_root):
-            # Skip hidden directories and common excludes
-            dirs[:] = [
-                d for d in dirs 
-                if not d.startswith('.') 
-                and d not in ('node_modules', '__pycache__', 'venv', '.git')
-            ]
+    ) -> dict[str, tuple[int, int]]:
+        """
+        Copy only files matching scope patterns to workspace.
+        
+        Returns:
+            Dict of relative_path -> (size, mtime_ns) of the copied files
+        """
+        rel_paths = []
+        pairs = []
+        for rel_root, _, allowed, _ in self._walk_scope(contract):
+            if not allowed:
+                continue
             
-            for filename in files:
-                full_path = Path(root) / filename
-                rel_path = full_path.relative_to(self.repo_root)
-                
-                # Check if path is in scope and not forbidden
-                if contract.path_allowed(str(rel_path)):
-                    dest_path = workspace_path / rel_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(full_path, dest_path)
+            dest_dir = workspace_path / rel_root
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            for filename in allowed:
+                rel_paths.append(rel_root + filename)
+                pairs.append((self.repo_root / rel_root / filename, dest_dir / filename))
+        
+        # Copy on worker threads, a batch at a time to bound open files
+        stats = []
+        for i in range(0, len(pairs), _COPY_BATCH):
+            stats += await asyncio.gather(*(
+                asyncio.to_thread(_fast_copy, src, dst)
+                for src, dst in pairs[i:i + _COPY_BATCH]
+            ))
+        
+        return {
+            rel_path: (st.st_size, st.st_mtime_ns)
+            for rel_path, st in zip(rel_paths, stats)
+        }
     
     async def _create_container(
         self,
@@ -163,29 +716,52 @@ class FilesystemIsolator:
         workspace_path: Path,
         signal_dir: Path,
     ) -> str:
-        """Create a Docker container with isolated mounts."""
-        # Build volume mounts
-        mounts = [
-            f"{workspace_path}:/workspace:rw",
-            f"{signal_dir}:/signals:rw",
-        ]
+        """
+        Create and start a Docker container with isolated mounts.
+        
+        Only the agent's workspace and signal directory are mounted, so
+        agents cannot see each other's files.
+        """
+        docker = await self._get_docker()
+        container_id = None
+        if docker:
+            try:
+                container_id = await self._create_container_api(
+                    docker, contract, workspace_path, signal_dir
+                )
+            except aiohttp.ClientError:
+                await self._drop_docker()
+        if container_id is None:
+            container_id = await self._create_container_cli(
+                contract, workspace_path, signal_dir
+            )
+        
+        self._containers.add(container_id)
+        return container_id
+    
+    async def _create_container_cli(
+        self,
+        contract: Contract,
+        workspace_path: Path,
+        signal_dir: Path,
+    ) -> str:
+        """Create and start the container with the docker CLI."""
+        workspace = f"type=bind,source={workspace_path.resolve()},target=/workspace"
         
         # Create container
         cmd = [
             "docker", "create",
-            "--name", f"agent_{contract.name}_{os.getpid()}",
+            "--name", workspace_path.name,
+            "--mount", workspace,
+            "-v", f"{signal_dir}:/signals:rw",
             "-w", "/workspace",
             "-e", f"AGENT_NAME={contract.name}",
             "-e", "AGENT_ISOLATED=true",
-        ]
-        
-        for mount in mounts:
-            cmd.extend(["-v", mount])
-        
-        cmd.extend([
+            # Reap commands orphaned when a timed-out exec is killed
+            "--init",
             self.docker_image,
-            "tail", "-f", "/dev/null"  # Keep container alive
-        ])
+            *_KEEPALIVE,
+        ]
         
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -208,10 +784,72 @@ class FilesystemIsolator:
         _, stderr = await proc.communicate()
         
         if proc.returncode != 0:
+            self._containers.add(container_id)
             raise RuntimeError(f"Failed to start container: {stderr.decode()}")
         
         return container_id
     
+    async def _create_container_api(
+        self,
+        docker: _DockerAPI,
+        contract: Contract,
+        workspace_path: Path,
+        signal_dir: Path,
+    ) -> str:
+        """Same as _create_container_cli, over the socket API."""
+        workspace = {
+            "Type": "bind",
+            "Source": str(workspace_path.resolve()),
+            "Target": "/workspace",
+        }
+        
+        try:
+            container_id = await docker.create_container(workspace_path.name, {
+                "Image": self.docker_image,
+                "Cmd": _KEEPALIVE,
+                "WorkingDir": "/workspace",
+                "Env": [f"AGENT_NAME={contract.name}", "AGENT_ISOLATED=true"],
+                "HostConfig": {
+                    "Init": True,
+                    "Mounts": [workspace],
+                    "Binds": [f"{signal_dir}:/signals:rw"],
+                },
+            })
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to create container: {e}") from None
+        
+        try:
+            await docker.start_container(container_id)
+        except RuntimeError as e:
+            self._containers.add(container_id)
+            raise RuntimeError(f"Failed to start container: {e}") from None
+        
+        return container_id
+    
+    async def _remove_container(self, container_id: str) -> None:
+        """Kill and remove a container started by this isolator."""
+        self._containers.discard(container_id)
+        
+        docker = await self._get_docker()
+        if docker:
+            try:
+                await docker.remove_container(container_id)
+                return
+            except RuntimeError:
+                return  # Already gone
+            except aiohttp.ClientError:
+                await self._drop_docker()
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "docker", "rm", "-f", container_id,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            return  # No docker CLI, so nothing to remove
+        await proc.wait()
+    
     async def execute_in_workspace(
         self,
         workspace: IsolatedWorkspace,
@@ -225,9 +863,7 @@ class FilesystemIsolator:
             Tuple of (return_code, stdout, stderr)
         """
         if workspace.container_id:
-            return await self._execute_in_container(
-                workspace.container_id, command, timeout
-            )
+            return await self._execute_in_container(workspace, command, timeout)
         else:
             return await self._execute_local(
                 workspace.workspace_path, command, timeout
@@ -235,26 +871,40 @@ class FilesystemIsolator:
     
     async def _execute_in_container(
         self,
-        container_id: str,
+        workspace: IsolatedWorkspace,
         command: str,
         timeout: float,
     ) -> tuple[int, str, str]:
-        """Execute command inside Docker container."""
+        """Execute command inside the agent's Docker container."""
+        workdir = "/workspace"
+        env = ["AGENT_SIGNAL_DIR=/signals"]
+        
+        docker = await self._get_docker()
+        if docker:
+            try:
+                return await asyncio.wait_for(
+                    docker.exec(
+                        workspace.container_id, ["sh", "-c", command], workdir, env
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                return -1, "", "Command timed out"
+            except aiohttp.ClientConnectorError:
+                # Could not reach the daemon, so the command never started
+                await self._drop_docker()
+        
         proc = await asyncio.create_subprocess_exec(
-            "docker", "exec", container_id,
+            "docker", "exec",
+            "-w", workdir,
+            "-e", env[0],
+            workspace.container_id,
             "sh", "-c", command,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
         
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=timeout
-            )
-            return proc.returncode, stdout.decode(), stderr.decode()
-        except asyncio.TimeoutError:
-            proc.kill()
-            return -1, "", "Command timed out"
+        return await collect_output(proc, timeout)
     
     async def _execute_local(
         self,
@@ -268,20 +918,10 @@ class FilesystemIsolator:
             cwd=workspace_path,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            env={
-                **os.environ,
-                "AGENT_ISOLATED": "true",
-            }
+            env=self._child_env,
         )
         
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=timeout
-            )
-            return proc.returncode, stdout.decode(), stderr.decode()
-        except asyncio.TimeoutError:
-            proc.kill()
-            return -1, "", "Command timed out"
+        return await collect_output(proc, timeout)
     
     async def sync_back(
         self,
@@ -299,47 +939,116 @@ class FilesystemIsolator:
             Dict of relative_path -> absolute_path for modified files
         """
         target = target_dir or self.repo_root
-        synced = {}
         
-        # Walk workspace and find modified/new files
-        for root, dirs, files in os.walk(workspace.workspace_path):
-            # Skip hidden and temp directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
+        if workspace.overlay_dir:
+            return await asyncio.to_thread(
+                self._sync_upper, workspace, target
+            )
+        return await asyncio.to_thread(self._sync_copied, workspace, target)
+    
+    def _sync_copied(
+        self,
+        workspace: IsolatedWorkspace,
+        target: Path,
+    ) -> dict[str, Path]:
+        """Copy new and modified files of a copied workspace back to target."""
+        changed = []
+        original_stats = workspace.original_stats or {}
+        scoped_files = workspace.scoped_files
+        last_sync = workspace._sync_stats.setdefault(target, {})
+        checked = {}
+        
+        # Walk workspace (skipping hidden directories) and find modified/new files
+        for rel_path, entry in _iter_files(workspace.workspace_path, _HIDDEN_DIR):
+            # Skip signal files and temp files
+            if rel_path.startswith(('signals/', '.tmp')):
+                continue
+            
+            # Same size and mtime as when copied in or last synced: untouched
+            st = entry.stat()
+            key = (st.st_size, st.st_mtime_ns)
+            if key == original_stats.get(rel_path) or key == last_sync.get(rel_path):
+                continue
+            checked[rel_path] = key
             
-            for filename in files:
-                workspace_file = Path(root) / filename
-                rel_path = workspace_file.relative_to(workspace.workspace_path)
-                
-                # Skip signal files and temp files
-                if str(rel_path).startswith(('signals/', '.tmp')):
-                    continue
-                
-                target_file = target / rel_path
-                original_file = self.repo_root / rel_path
-                
-                # Check if file is new or modified
-                is_new = not original_file.exists()
-                is_modified = (
-                    not is_new and 
-                    workspace_file.read_bytes() != original_file.read_bytes()
+            original_file = self.repo_root / rel_path
+            
+            # Check if file is new or modified
+            try:
+                original_stat = original_file.stat()
+            except FileNotFoundError:
+                is_new, is_modified = True, False
+            else:
+                if scoped_files is not None and rel_path not in scoped_files:
+                    continue  # Existing file outside the agent's scope
+                is_new = False
+                is_modified = _files_differ(
+                    entry.path, original_file, st, original_stat
                 )
-                
-                if is_new or is_modified:
-                    target_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(workspace_file, target_file)
-                    synced[str(rel_path)] = target_file
+            
+            if is_new or is_modified:
+                changed.append((rel_path, entry.path))
+        
+        synced = _copy_back(changed, target)
+        last_sync.update(checked)
+        return synced
+    
+    def _sync_upper(
+        self,
+        workspace: IsolatedWorkspace,
+        target: Path,
+    ) -> dict[str, Path]:
+        """Copy the files an overlay's upper layer holds back to target."""
+        upper = workspace.overlay_dir / "upper"
+        scoped_files = workspace.scoped_files
+        last_sync = workspace._sync_stats.setdefault(target, {})
+        checked = {}
+        changed = []
+        
+        # Every regular file in upper was written by the agent; whiteouts
+        # (the agent's deletions) are character devices and skipped
+        for rel_path, entry in _iter_files(upper, _HIDDEN_DIR):
+            if rel_path.startswith(('signals/', '.tmp')):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            
+            # Unchanged since the last sync to this target
+            st = entry.stat()
+            key = (st.st_size, st.st_mtime_ns)
+            if key == last_sync.get(rel_path):
+                continue
+            checked[rel_path] = key
+            
+            # Created over an existing repo file outside the scope
+            if (
+                scoped_files is not None
+                and rel_path not in scoped_files
+                and os.path.lexists(self.repo_root / rel_path)
+            ):
+                continue
+            
+            changed.append((rel_path, entry.path))
         
+        synced = _copy_back(changed, target)
+        last_sync.update(checked)
         return synced
     
     async def cleanup_all(self) -> None:
         """Clean up all workspaces and containers."""
-        # Stop all agent containers
-        proc = await asyncio.create_subprocess_shell(
-            "docker ps -q --filter 'name=agent_*' | xargs -r docker rm -f",
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        await proc.wait()
+        # Containers of workspaces that were never cleaned up
+        await asyncio.gather(*(
+            self._remove_container(container_id)
+            for container_id in list(self._containers)
+        ))
+        
+        docker, self._docker = self._docker, None
+        if docker:
+            await docker.close()
+        
+        # Unmount overlays first so rmtree cannot reach through them
+        for overlay_dir in self.work_dir.glob("agent_*.overlay"):
+            await _unmount(overlay_dir.with_name(overlay_dir.name[:-len(".overlay")]))
         
         # Remove work directory
         if self.work_dir.exists():
@@ -352,37 +1061,52 @@ class ScopeEnforcer:
     
     Can be used as a wrapper around file operations to enforce
     contract scope without full container isolation.
+    
+    With log=False, accesses are not recorded and get_violations()
+    stays empty, so each check is a cache lookup.
     """
     
-    def __init__(self, contract: Contract, base_path: Path):
+    def __init__(self, contract: Contract, base_path: Path, log: bool = True):
         self.contract = contract
         self.base_path = Path(base_path).resolve()
-        self._access_log: list[tuple[str, str, bool]] = []  # (path, op, allowed)
+        self._base_prefix = os.path.join(str(self.base_path), "")
+        self._scope_re = contract._compile_scope()
+        self._log_enabled = log
+        # (path, op, allowed), most recent entries only
+        self._access_log: collections.deque[tuple[str, str, bool]] = (
+            collections.deque(maxlen=_ACCESS_LOG_SIZE)
+        )
+        # Files are opened repeatedly, so remember decisions per path
+        self._check_cached = functools.lru_cache(maxsize=4096)(self._check_access)
     
     def check_read(self, path: str | Path) -> bool:
         """Check if reading from path is allowed."""
-        allowed = self._check_access(path)
-        self._access_log.append((str(path), "read", allowed))
+        path = os.path.normpath(path)
+        allowed = self._check_cached(path)
+        if self._log_enabled:
+            self._access_log.append((path, "read", allowed))
         return allowed
     
     def check_write(self, path: str | Path) -> bool:
         """Check if writing to path is allowed."""
-        allowed = self._check_access(path)
-        self._access_log.append((str(path), "write", allowed))
+        path = os.path.normpath(path)
+        allowed = self._check_cached(path)
+        if self._log_enabled:
+            self._access_log.append((path, "write", allowed))
         return allowed
     
-    def _check_access(self, path: str | Path) -> bool:
-        """Check if path is within allowed scope."""
-        path = Path(path)
-        
+    def _check_access(self, path: str) -> bool:
+        """Check if a normalized path is within allowed scope."""
         # Make path relative if absolute
-        if path.is_absolute():
-            try:
-                path = path.relative_to(self.base_path)
-            except ValueError:
+        if os.path.isabs(path):
+            if path == str(self.base_path):
+                path = "."
+            elif path.startswith(self._base_prefix):
+                path = path[len(self._base_prefix):]
+            else:
                 return False  # Outside base path
         
-        return self.contract.path_allowed(str(path))
+        return bool(self._scope_re and self._scope_re.match(path))
     
     def get_violations(self) -> list[tuple[str, str]]:
         """Get list of access violations (path, operation)."""
@@ -15,7 +15,8 @@ Usage with Claude Code CLI:
 import asyncio
 import json
 import os
-import subprocess
+import re
+import shlex
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -24,22 +25,111 @@ import logging
 try:
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
-    from mcp.types import Tool, TextContent, Resource
+    from mcp.types import (
+        CallToolRequest,
+        CallToolRequestParams,
+        CallToolResult,
+        Resource,
+        TextContent,
+        Tool,
+    )
 except ImportError:
     raise ImportError("MCP SDK required. Run: pip install mcp")
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 from .models import Contract, ExecutionPlan
 from .parser import ContractParser
 from .persistence import SessionPersistence, SessionState, ContractPersist, get_resume_prompt
 from .verification import VerificationPlanner, VerificationCheck
 from .reconciler import ErrorReconciler, ResolutionChain
-from .executor import FullPowerExecutor
+from .executor import FullPowerExecutor, _git
+from .command_output import collect_output
 from .passive_context import PassiveContextProvider
 from .workspace_monitor import WorkspaceMonitor
 from .task_analyzer import TaskAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Tools whose results are fresh on every call; hint clients not to spend
+# prompt-cache writes on them
+NO_CACHE_TOOLS = frozenset({"check_session", "get_execution_status", "run_verification"})
+
+
+# Whether the SDK passes a returned CallToolResult through; probed once
+_CALL_TOOL_RESULT: Optional[bool] = None
+
+
+async def _accepts_call_tool_result() -> bool:
+    """Whether Server.call_tool passes a returned CallToolResult through.
+
+    Older SDKs treat the return value as a list of content, so the hint is
+    only sent where it is understood. The SDK is asked by dispatching one
+    request through a throwaway server.
+    """
+    global _CALL_TOOL_RESULT
+    if _CALL_TOOL_RESULT is None:
+        probe = {"probe": True}
+        try:
+            server = Server("probe")
+
+            @server.call_tool()
+            async def call_tool(name: str, arguments: dict):
+                return CallToolResult(content=[], _meta=probe)
+
+            response = await server.request_handlers[CallToolRequest](
+                CallToolRequest(
+                    method="tools/call",
+                    params=CallToolRequestParams(name="probe", arguments={}),
+                )
+            )
+            result = getattr(response, "root", response)
+            _CALL_TOOL_RESULT = getattr(result, "meta", None) == probe
+        except Exception:
+            # No such decorator or dispatch in this SDK
+            _CALL_TOOL_RESULT = False
+    return _CALL_TOOL_RESULT
+
+
+# First line of `git commit` output: "[branch (root-commit) abc1234] message"
+_COMMIT_SUMMARY = re.compile(r"\[[^\n]* ([0-9a-f]{4,})\] ")
+
+# Leading output lines of each verification check kept for the error
+# analysis, which looks for the first failure a check reports
+_VERIFY_HEAD_LINES = 200
+
+# Anything the shell would expand, redirect or chain
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`*?\[\]{}~\n]|^\w+=|(?:^|\s)#")
+
+
+def _command_argv(command: Optional[str]) -> Optional[list[str]]:
+    """Split a check command into argv, or None if it needs a shell."""
+    if not command or _SHELL_SYNTAX.search(command):
+        return None
+    try:
+        return shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes; let the shell report it
+        return None
+
+
+def _dependency_agents(depends: list[str]) -> list[str]:
+    """Names of the agents whose READY signals a DEPENDS list waits for."""
+    return [
+        dep.split(":")[1] if ":" in dep else dep
+        for dep in depends
+        if dep.lower() != "none"
+    ]
+
 
 class AgentHarnessMCP:
     """
@@ -63,6 +153,9 @@ class AgentHarnessMCP:
         self._passive_context: Optional[PassiveContextProvider] = None
         self._workspace_monitor: Optional[WorkspaceMonitor] = None
         self._task_analyzer: Optional[TaskAnalyzer] = None
+        
+        # Contracts built for execution, by (session, agent, version)
+        self._contract_cache: dict[tuple[str, str, int], Contract] = {}
         self._state: Optional[SessionState] = None
 
         # MCP Server (lightweight initialization)
@@ -224,19 +317,19 @@ class AgentHarnessMCP:
         @self.server.read_resource()
         async def read_resource(uri: str):
             if uri == "agent://session/status":
-                return json.dumps(self._get_status_dict(), indent=2)
+                return _dumps(self._get_status_dict())
             elif uri == "agent://session/resume":
                 return get_resume_prompt(self.state)
             elif uri == "agent://context/codebase-summary":
                 return self.passive_context.generate_codebase_summary()
             elif uri == "agent://context/task-complexity":
                 # Default complexity for resource read (no task context)
-                return json.dumps({
+                return _dumps({
                     "note": "Use get_task_guidance tool for task-specific complexity assessment",
                     "default_complexity": self.passive_context.assess_task_complexity([]),
-                }, indent=2)
+                })
             elif uri == "agent://context/scope-suggestions":
-                return json.dumps(self.passive_context.suggest_scopes(), indent=2)
+                return _dumps(self.passive_context.suggest_scopes())
             elif uri == "agent://workspace/dependency-status":
                 return self.workspace_monitor.format_dependency_report()
             elif uri == "agent://workspace/health-check":
@@ -374,14 +467,15 @@ class AgentHarnessMCP:
                 Tool(
                     name="execute_next_agent",
                     description="""
-                    Execute the next pending agent.
-                    Runs as FULL Claude Code session with all capabilities.
-                    Creates checkpoint commit on completion.
+                    Execute all pending agents whose dependencies are complete,
+                    in parallel, or one specific agent.
+                    Runs each as FULL Claude Code session with all capabilities.
+                    Creates one checkpoint commit per batch.
                     """,
                     inputSchema={
                         "type": "object",
                         "properties": {
-                            "agent_name": {"type": "string", "description": "Specific agent (or auto-selects next)"}
+                            "agent_name": {"type": "string", "description": "Specific agent (or runs every ready agent)"}
                         }
                     }
                 ),
@@ -444,7 +538,11 @@ class AgentHarnessMCP:
                 # Feedback and iteration
                 Tool(
                     name="provide_feedback",
-                    description="User provides feedback, triggers retry/adjustment",
+                    description=(
+                        "User provides feedback, triggers retry/adjustment. "
+                        "revert only reaches checkpoints still in the session log; "
+                        "older ones are archived in history.jsonl"
+                    ),
                     inputSchema={
                         "type": "object",
                         "properties": {
@@ -473,17 +571,24 @@ class AgentHarnessMCP:
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict):
-            try:
-                handler = getattr(self, f"_tool_{name}", None)
-                if not handler:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
-                
-                result = await handler(arguments)
-                self._save()  # Persist after every tool call
-                return [TextContent(type="text", text=result)]
-            except Exception as e:
-                logger.exception(f"Tool {name} failed")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+            return await self._call_tool(name, arguments)
+    
+    async def _call_tool(self, name: str, arguments: dict):
+        """Run a tool and wrap its result as MCP content."""
+        try:
+            handler = getattr(self, f"_tool_{name}", None)
+            if not handler:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            
+            result = await handler(arguments)
+            self._save()  # Persist after every tool call
+            content = [TextContent(type="text", text=result)]
+            if name in NO_CACHE_TOOLS and await _accepts_call_tool_result():
+                return CallToolResult(content=content, _meta={"cache_hint": "no-cache"})
+            return content
+        except Exception as e:
+            logger.exception(f"Tool {name} failed")
+            return [TextContent(type="text", text=f"Error: {str(e)}")]
     
     # ==================== Tool Implementations ====================
 
@@ -502,7 +607,7 @@ class AgentHarnessMCP:
 
         if quick_score < 2:
             # DORMANT MODE: Minimal overhead for simple tasks
-            return json.dumps({
+            return _dumps({
                 "approach": "direct",
                 "recommendation": "Simple task - proceed directly without orchestration",
                 "complexity": {
@@ -515,7 +620,7 @@ class AgentHarnessMCP:
                 "pitfalls": [],
                 "dormant_mode": True,
                 "message": "MCP staying dormant for simple task (minimal overhead)",
-            }, indent=2)
+            })
 
         # Complex enough - load full context
         complexity = self.passive_context.assess_task_complexity([task, context])
@@ -570,7 +675,7 @@ class AgentHarnessMCP:
             "dormant_mode": False,
         }
 
-        return json.dumps(guidance, indent=2)
+        return _dumps(guidance)
 
     def _suggest_verification(self, task: str) -> list:
         """Suggest verification steps based on task type."""
@@ -686,7 +791,7 @@ class AgentHarnessMCP:
     async def _tool_check_session(self, args: dict) -> str:
         """Check for existing session or start fresh."""
         if self.state.session_id and self.state.phase != "not_started":
-            return json.dumps({
+            return _dumps({
                 "has_session": True,
                 "session_id": self.state.session_id,
                 "phase": self.state.phase,
@@ -694,12 +799,12 @@ class AgentHarnessMCP:
                 "resume_context": self.state.resume_context,
                 "next_action": self.state.next_action,
                 "message": "Existing session found. Review resume_context and continue."
-            }, indent=2)
+            })
         
-        return json.dumps({
+        return _dumps({
             "has_session": False,
             "message": "No existing session. Ready for new task."
-        }, indent=2)
+        })
     
     async def _tool_analyze_and_plan(self, args: dict) -> str:
         """Create plan with auto-generated verification."""
@@ -714,11 +819,8 @@ class AgentHarnessMCP:
         self.state.phase = "planning"
         
         # Build contracts
-        contracts = []
-        verification_plans = []
-        
-        for a in agents_data:
-            contract = Contract(
+        contracts = [
+            Contract(
                 name=a["name"],
                 goal=a["goal"],
                 scope=a.get("scope", []),
@@ -727,12 +829,26 @@ class AgentHarnessMCP:
                 produces=a.get("produces", []),
                 verify=a.get("verify", []),
             )
-            contracts.append(contract)
-            
-            # Auto-generate verification plan
-            vplan = self.verifier.generate_plan(contract)
-            verification_plans.append(vplan)
-            
+            for a in agents_data
+        ]
+        
+        # Validate before any planning work, so a rejected plan costs
+        # nothing and leaves no contracts behind in the session
+        errors = ContractParser.validate_contracts(contracts)
+        if errors:
+            return _dumps({
+                "status": "invalid",
+                "errors": errors,
+            })
+        
+        # Auto-generate verification plans; test discovery walks each
+        # agent's scope, so plan them side by side off the event loop
+        verification_plans = await asyncio.gather(*(
+            asyncio.to_thread(self.verifier.generate_plan, contract)
+            for contract in contracts
+        ))
+        
+        for contract, vplan in zip(contracts, verification_plans):
             # Store as persistable contract
             self.state.proposed_contracts.append(ContractPersist(
                 name=contract.name,
@@ -744,19 +860,16 @@ class AgentHarnessMCP:
                 produces=contract.produces,
                 verify=contract.verify,
                 verification_plan=[
-                    {"type": c.type, "description": c.description, "command": c.command}
+                    {
+                        "type": c.type,
+                        "description": c.description,
+                        "command": c.command,
+                        "argv": _command_argv(c.command),
+                    }
                     for c in vplan.automated_checks + vplan.manual_checks
                 ],
             ))
         
-        # Validate
-        errors = ContractParser.validate_contracts(contracts)
-        if errors:
-            return json.dumps({
-                "status": "invalid",
-                "errors": errors,
-            }, indent=2)
-        
         # Build execution plan
         plan = ExecutionPlan.from_contracts(contracts)
         self.state.pending_agents = list(plan.sequential_order)
@@ -795,7 +908,7 @@ class AgentHarnessMCP:
         
         self.state.next_action = "Review plan and verification, then approve or modify"
         
-        return json.dumps(output, indent=2)
+        return _dumps(output)
     
     async def _tool_approve_plan(self, args: dict) -> str:
         """Approve plan and create branch."""
@@ -803,155 +916,193 @@ class AgentHarnessMCP:
             return json.dumps({"status": "error", "message": "No plan to approve"})
         
         # Get current branch
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True
-        )
-        self.state.original_branch = result.stdout.strip() or "main"
+        _, current = await _git(self.repo_root, "branch", "--show-current")
+        self.state.original_branch = current.decode().strip() or "main"
         
         # Create session branch
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         branch = args.get("branch_name") or f"ai/session-{timestamp}"
         self.state.session_branch = branch
         
-        subprocess.run(
-            ["git", "checkout", "-b", branch],
-            cwd=self.repo_root,
-            capture_output=True
-        )
+        await _git(self.repo_root, "checkout", "-b", branch)
         
         self.state.execution_plan_approved = True
         self.state.verification_plan_approved = True
         self.state.phase = "executing"
         self.state.next_action = "Call execute_next_agent to start"
         
-        return json.dumps({
+        return _dumps({
             "status": "approved",
             "branch": branch,
             "agents_to_execute": self.state.pending_agents,
             "message": f"Created branch '{branch}'. Call execute_next_agent to begin."
-        }, indent=2)
+        })
     
     async def _tool_execute_next_agent(self, args: dict) -> str:
-        """Execute next agent with full Claude capabilities."""
+        """Execute every ready agent, or the named one, with full Claude capabilities."""
         if not self.state.pending_agents:
             return json.dumps({
                 "status": "complete",
                 "message": "All agents executed. Run verification or finalize."
             })
         
-        # Get next agent
-        agent_name = args.get("agent_name") or self.state.pending_agents[0]
-        
-        if agent_name not in self.state.pending_agents:
-            return json.dumps({
-                "status": "error",
-                "message": f"Agent '{agent_name}' not in pending list"
-            })
-        
-        # Find contract
-        contract_data = next(
-            (c for c in self.state.proposed_contracts if c.name == agent_name),
-            None
-        )
-        if not contract_data:
-            return json.dumps({"status": "error", "message": "Contract not found"})
+        if args.get("agent_name"):
+            batch = [args["agent_name"]]
+            if batch[0] not in self.state.pending_agents:
+                return json.dumps({
+                    "status": "error",
+                    "message": f"Agent '{batch[0]}' not in pending list"
+                })
+        else:
+            # Agents whose dependencies have all completed run side by side;
+            # read from the contracts now so modify_plan edits count
+            completed = set(self.state.completed_agents)
+            depends = {c.name: c.depends for c in self.state.proposed_contracts}
+            waiting = {
+                agent: [
+                    dep for dep in _dependency_agents(depends.get(agent, []))
+                    if dep not in completed
+                ]
+                for agent in self.state.pending_agents
+            }
+            batch = [agent for agent, missing in waiting.items() if not missing]
+            if not batch:
+                return _dumps({
+                    "status": "waiting",
+                    "waiting_on": waiting,
+                    "next": "Retry failed dependencies, or pass agent_name to run one anyway",
+                })
         
-        # Convert to Contract
-        contract = Contract(
-            name=contract_data.name,
-            goal=contract_data.goal,
-            scope=contract_data.scope,
-            cannot=contract_data.cannot,
-            depends=contract_data.depends,
-            produces=contract_data.produces,
-            verify=contract_data.verify,
-        )
+        contracts = []
+        for agent_name in batch:
+            contract_data = next(
+                (c for c in self.state.proposed_contracts if c.name == agent_name),
+                None
+            )
+            if not contract_data:
+                return json.dumps({"status": "error", "message": "Contract not found"})
+            contracts.append(self._get_contract(contract_data))
         
-        self.state.current_agent = agent_name
+        self.state.current_agents = batch
         
         # Execute with full power
-        output_buffer = []
-        def on_output(line):
-            output_buffer.append(line)
-        
-        execution = await self.executor.execute_agent(
-            contract,
-            on_output=on_output,
-            timeout=600,
-        )
-        
-        # Get result
-        result = await self.executor.get_agent_result(agent_name)
-        
-        # Update state
-        self.state.pending_agents.remove(agent_name)
+        executions = await self.executor.execute_agents(contracts, timeout=600)
         
-        if result and result.get("status") == "complete":
-            self.state.completed_agents.append(agent_name)
+        outcomes = []
+        synced = {}
+        for agent_name, execution in zip(batch, executions):
+            # Get result
+            if isinstance(execution, BaseException):
+                result = None
+            else:
+                result = await self.executor.get_agent_result(agent_name)
             
-            # Sync changes back
-            synced = await self.executor.sync_workspace_back(agent_name)
+            # Update state
+            self.state.pending_agents.remove(agent_name)
             
-            # Checkpoint commit
-            subprocess.run(["git", "add", "-A"], cwd=self.repo_root)
-            commit_msg = f"checkpoint: {agent_name} complete"
-            subprocess.run(
-                ["git", "commit", "-m", commit_msg],
-                cwd=self.repo_root,
-                capture_output=True
-            )
+            if result and result.get("status") == "complete":
+                self.state.completed_agents.append(agent_name)
+                
+                # Sync changes back
+                synced[agent_name] = await self.executor.sync_workspace_back(agent_name)
+                outcomes.append({
+                    "status": "success",
+                    "agent": agent_name,
+                    "files_synced": list(synced[agent_name]),
+                })
             
-            # Get commit hash
-            hash_result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True
-            )
-            commit_hash = hash_result.stdout.strip()
+            elif result and result.get("status") == "blocked":
+                self.state.failed_agents.append(agent_name)
+                self.state.errors_encountered.append({
+                    "agent": agent_name,
+                    "error": result.get("reason", "Unknown"),
+                    "need": result.get("need"),
+                })
+                
+                outcomes.append({
+                    "status": "blocked",
+                    "agent": agent_name,
+                    "reason": result.get("reason"),
+                    "need": result.get("need"),
+                    "next": "Use handle_error or provide_feedback",
+                })
+            
+            else:
+                self.state.failed_agents.append(agent_name)
+                if isinstance(execution, BaseException):
+                    output = str(execution)
+                else:
+                    output = execution.output[-2000:] if execution.output else "No output"
+                outcomes.append({
+                    "status": "failed",
+                    "agent": agent_name,
+                    "output": output,
+                    "next": "Use handle_error to analyze",
+                })
+        
+        # One checkpoint commit for the whole batch; each step needs the
+        # previous one, but awaiting them keeps the server responsive
+        commit_hash = None
+        if synced:
+            done = ", ".join(synced)
+            await _git(self.repo_root, "add", "-A")
+            commit_msg = f"checkpoint: {done} complete"
+            _, summary = await _git(self.repo_root, "commit", "-m", commit_msg)
+            
+            # Get commit hash from "[branch abc1234] message", and only ask
+            # git separately when nothing was committed
+            match = _COMMIT_SUMMARY.match(summary.decode(errors="replace"))
+            if match:
+                commit_hash = match.group(1)
+            else:
+                _, head = await _git(self.repo_root, "rev-parse", "--short", "HEAD")
+                commit_hash = head.decode().strip()
             
             self.state.commits.append({
                 "hash": commit_hash,
                 "message": commit_msg,
-                "agent": agent_name,
+                "agent": done,
             })
-            
-            return json.dumps({
-                "status": "success",
-                "agent": agent_name,
-                "files_synced": list(synced.keys()),
-                "commit": commit_hash,
-                "remaining_agents": self.state.pending_agents,
-                "next": "Run verification or execute_next_agent",
-            }, indent=2)
         
-        elif result and result.get("status") == "blocked":
-            self.state.failed_agents.append(agent_name)
-            self.state.errors_encountered.append({
-                "agent": agent_name,
-                "error": result.get("reason", "Unknown"),
-                "need": result.get("need"),
-            })
-            
-            return json.dumps({
-                "status": "blocked",
-                "agent": agent_name,
-                "reason": result.get("reason"),
-                "need": result.get("need"),
-                "next": "Use handle_error or provide_feedback",
-            }, indent=2)
+        if len(outcomes) == 1:
+            if synced:
+                outcomes[0].update({
+                    "commit": commit_hash,
+                    "remaining_agents": self.state.pending_agents,
+                    "next": "Run verification or execute_next_agent",
+                })
+            return _dumps(outcomes[0])
         
-        else:
-            self.state.failed_agents.append(agent_name)
-            return json.dumps({
-                "status": "failed",
-                "agent": agent_name,
-                "output": execution.output[-2000:] if execution.output else "No output",
-                "next": "Use handle_error to analyze",
-            }, indent=2)
+        return _dumps({
+            "status": "success" if len(synced) == len(outcomes) else "partial",
+            "agents": outcomes,
+            "commit": commit_hash,
+            "remaining_agents": self.state.pending_agents,
+            "next": "Run verification or execute_next_agent",
+        })
+    
+    def _get_contract(self, contract_data: ContractPersist) -> Contract:
+        """Contract for a persisted one, reused until it is edited."""
+        key = (self.state.session_id, contract_data.name, contract_data.version)
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = self._contract_cache[key] = Contract(
+                name=contract_data.name,
+                goal=contract_data.goal,
+                scope=contract_data.scope,
+                cannot=contract_data.cannot,
+                depends=contract_data.depends,
+                produces=contract_data.produces,
+                verify=contract_data.verify,
+            )
+        return contract
+    
+    def _bump_version(self, contract_data: ContractPersist) -> None:
+        """Mark a persisted contract as edited, dropping its cached Contract."""
+        self._contract_cache.pop(
+            (self.state.session_id, contract_data.name, contract_data.version), None
+        )
+        contract_data.version += 1
     
     async def _tool_handle_error(self, args: dict) -> str:
         """Analyze and auto-fix errors."""
@@ -997,7 +1148,7 @@ class AgentHarnessMCP:
             "resolution": result.get("message"),
         })
         
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     
     async def _tool_run_verification(self, args: dict) -> str:
         """Run verification checks for an agent."""
@@ -1014,19 +1165,40 @@ class AgentHarnessMCP:
         results = []
         all_passed = True
         
+        # Automated checks are independent, so run them side by side
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def run_check(check: dict) -> tuple[int, str, str]:
+            # Plain commands were split at planning time and skip the shell
+            pipes = {"stdout": asyncio.subprocess.PIPE, "stderr": asyncio.subprocess.PIPE}
+            async with semaphore:
+                if check.get("argv"):
+                    proc = await asyncio.create_subprocess_exec(
+                        *check["argv"], cwd=self.repo_root, **pipes
+                    )
+                else:
+                    proc = await asyncio.create_subprocess_shell(
+                        check["command"], cwd=self.repo_root, **pipes
+                    )
+                return await collect_output(
+                    proc, timeout=60, head_lines=_VERIFY_HEAD_LINES
+                )
+        
+        automated = [c for c in contract_data.verification_plan if c.get("command")]
+        outcomes = await asyncio.gather(
+            *(run_check(c) for c in automated),
+            return_exceptions=True,
+        )
+        outputs = {}
+        for check, outcome in zip(automated, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = (-1, "", str(outcome))
+            returncode, stdout, stderr = outcome
+            outputs[id(check)] = (returncode == 0, stdout + stderr)
+        
         for check in contract_data.verification_plan:
             if check.get("command"):
-                # Run automated check
-                proc = subprocess.run(
-                    check["command"],
-                    shell=True,
-                    cwd=self.repo_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-                
-                passed = proc.returncode == 0
+                passed, output = outputs[id(check)]
                 all_passed = all_passed and passed
                 
                 results.append({
@@ -1034,17 +1206,15 @@ class AgentHarnessMCP:
                     "description": check["description"],
                     "command": check["command"],
                     "passed": passed,
-                    "output": (proc.stdout + proc.stderr)[:500],
+                    "output": output[:500],
                 })
                 
-                # Auto-fix if failed
+                # Auto-fix if failed; fixes touch the repo, so one at a time
                 if not passed:
-                    analysis = self.reconciler.analyze(proc.stdout + proc.stderr)
+                    analysis = self.reconciler.analyze(output)
                     if analysis.can_auto_resolve:
                         chain = ResolutionChain(self.reconciler)
-                        resolved, _ = await chain.resolve_with_escalation(
-                            proc.stdout + proc.stderr
-                        )
+                        resolved, _ = await chain.resolve_with_escalation(output)
                         results[-1]["auto_fix_attempted"] = True
                         results[-1]["auto_fixed"] = resolved
             else:
@@ -1063,7 +1233,7 @@ class AgentHarnessMCP:
         
         manual_pending = [r for r in results if r.get("awaiting_user")]
         
-        return json.dumps({
+        return _dumps({
             "agent": agent_name,
             "all_automated_passed": all_passed if not manual_pending else "pending manual",
             "results": results,
@@ -1071,7 +1241,7 @@ class AgentHarnessMCP:
             "next": "Use confirm_manual_check for pending items" if manual_pending else (
                 "Ready to finalize" if all_passed else "Fix failures and re-verify"
             ),
-        }, indent=2)
+        })
     
     async def _tool_confirm_manual_check(self, args: dict) -> str:
         """User confirms a manual verification check."""
@@ -1090,12 +1260,12 @@ class AgentHarnessMCP:
         # Check if all manual checks done
         pending = [r for r in self.state.verification_results if r.get("awaiting_user")]
         
-        return json.dumps({
+        return _dumps({
             "status": "confirmed",
             "check_id": check_id,
             "passed": passed,
             "remaining_manual_checks": len(pending),
-        }, indent=2)
+        })
     
     async def _tool_provide_feedback(self, args: dict) -> str:
         """Handle user feedback."""
@@ -1116,6 +1286,7 @@ class AgentHarnessMCP:
             for c in self.state.proposed_contracts:
                 if c.name == agent_name:
                     c.goal = f"{c.goal}\n\nFEEDBACK: {feedback}"
+                    self._bump_version(c)
                     break
             
             # Add back to pending
@@ -1126,39 +1297,57 @@ class AgentHarnessMCP:
             if agent_name not in self.state.pending_agents:
                 self.state.pending_agents.insert(0, agent_name)
             
-            return json.dumps({
+            return _dumps({
                 "status": "ready_to_retry",
                 "agent": agent_name,
                 "next": "Call execute_next_agent",
-            }, indent=2)
+            })
         
         elif action == "skip":
             if agent_name in self.state.pending_agents:
                 self.state.pending_agents.remove(agent_name)
             
-            return json.dumps({
+            return _dumps({
                 "status": "skipped",
                 "agent": agent_name,
                 "remaining": self.state.pending_agents,
-            }, indent=2)
+            })
         
         elif action == "revert":
             # Git revert to before this agent
             agent_commit = next(
-                (c for c in reversed(self.state.commits) if c["agent"] == agent_name),
+                (
+                    c for c in reversed(self.state.commits)
+                    if agent_name in c["agent"].split(", ")
+                ),
                 None
             )
-            if agent_commit:
-                subprocess.run(
-                    ["git", "revert", "--no-commit", agent_commit["hash"]],
-                    cwd=self.repo_root,
-                    capture_output=True,
-                )
+            if agent_commit is None:
+                return _dumps({
+                    "status": "error",
+                    "message": f"No checkpoint for {agent_name} in the session log",
+                })
+            await _git(self.repo_root, "revert", "--no-commit", agent_commit["hash"])
             
-            return json.dumps({
-                "status": "reverted",
-                "agent": agent_name,
-            }, indent=2)
+            # A batch checkpoint also reverts the agents that ran alongside
+            # this one, so they have to run again
+            requeued = [
+                name for name in agent_commit["agent"].split(", ")
+                if name != agent_name
+            ]
+            for name in reversed(requeued):
+                if name in self.state.completed_agents:
+                    self.state.completed_agents.remove(name)
+                if name not in self.state.pending_agents:
+                    self.state.pending_agents.insert(0, name)
+            
+            response = {"status": "reverted", "agent": agent_name}
+            if requeued:
+                response.update({
+                    "requeued_agents": requeued,
+                    "next": "Call execute_next_agent to run them again",
+                })
+            return _dumps(response)
         
         return json.dumps({"status": "error", "message": f"Unknown action: {action}"})
     
@@ -1171,74 +1360,46 @@ class AgentHarnessMCP:
         if action == "merge":
             commit_msg = args.get("commit_message") or f"feat: {self.state.original_goal}"
             
-            subprocess.run(
-                ["git", "checkout", original_branch],
-                cwd=self.repo_root,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "merge", "--squash", session_branch],
-                cwd=self.repo_root,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "commit", "-m", commit_msg],
-                cwd=self.repo_root,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "branch", "-D", session_branch],
-                cwd=self.repo_root,
-                capture_output=True,
-            )
+            await _git(self.repo_root, "checkout", original_branch)
+            await _git(self.repo_root, "merge", "--squash", session_branch)
+            await _git(self.repo_root, "commit", "-m", commit_msg)
+            await _git(self.repo_root, "branch", "-D", session_branch)
             
             # Archive session
             self.state.phase = "finalized"
             self.persistence.archive(self.state)
             self.state = SessionState()
             
-            return json.dumps({
+            return _dumps({
                 "status": "merged",
                 "message": f"Merged to {original_branch}",
-            }, indent=2)
+            })
         
         elif action == "keep":
-            subprocess.run(
-                ["git", "checkout", original_branch],
-                cwd=self.repo_root,
-                capture_output=True,
-            )
+            await _git(self.repo_root, "checkout", original_branch)
             
             self.state.phase = "finalized"
             self.persistence.archive(self.state)
             self.state = SessionState()
             
-            return json.dumps({
+            return _dumps({
                 "status": "kept",
                 "branch": session_branch,
                 "message": "Branch kept for manual review",
-            }, indent=2)
+            })
         
         elif action == "discard":
-            subprocess.run(
-                ["git", "checkout", original_branch],
-                cwd=self.repo_root,
-                capture_output=True,
-            )
+            await _git(self.repo_root, "checkout", original_branch)
             if session_branch:
-                subprocess.run(
-                    ["git", "branch", "-D", session_branch],
-                    cwd=self.repo_root,
-                    capture_output=True,
-                )
+                await _git(self.repo_root, "branch", "-D", session_branch)
             
             self.state = SessionState()
             self.persistence.save(self.state)
             
-            return json.dumps({
+            return _dumps({
                 "status": "discarded",
                 "message": "All changes removed",
-            }, indent=2)
+            })
         
         return json.dumps({"status": "error", "message": f"Unknown action: {action}"})
     
@@ -1262,6 +1423,7 @@ class AgentHarnessMCP:
                         for key, value in changes.items():
                             if hasattr(c, key):
                                 setattr(c, key, value)
+                        self._bump_version(c)
                         break
             
             elif action == "add":
@@ -1278,15 +1440,15 @@ class AgentHarnessMCP:
                 ))
                 self.state.pending_agents.append(agent)
         
-        return json.dumps({
+        return _dumps({
             "status": "modified",
             "agents": [c.name for c in self.state.proposed_contracts],
             "pending": self.state.pending_agents,
-        }, indent=2)
+        })
     
     async def _tool_get_execution_status(self, args: dict) -> str:
         """Get current execution status."""
-        return json.dumps(self._get_status_dict(), indent=2)
+        return _dumps(self._get_status_dict())
     
     def _get_status_dict(self) -> dict:
         """Build status dictionary."""
@@ -1300,7 +1462,7 @@ class AgentHarnessMCP:
                 "completed": self.state.completed_agents,
                 "failed": self.state.failed_agents,
                 "pending": self.state.pending_agents,
-                "current": self.state.current_agent,
+                "current": self.state.current_agents,
             },
             "commits": self.state.commits[-5:],
             "errors": len(self.state.errors_encountered),
@@ -1327,7 +1489,15 @@ def main():
     repo_root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
     
     server = AgentHarnessMCP(repo_root)
-    asyncio.run(server.run())
+    
+    # uvloop spawns agent subprocesses through libuv, so the loop never
+    # blocks in Popen waiting for the child's exec to complete
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(server.run())
+    else:
+        uvloop.run(server.run())
 
 
 if __name__ == "__main__":
@@ -7,7 +7,8 @@ with actual runtime enforcement capabilities.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 from pathlib import Path
 import re
 
@@ -39,7 +40,7 @@ class AgentStatus(Enum):
     ESCALATED = "escalated"   # Needs human intervention
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """
     Coordination primitive between agents.
@@ -73,6 +74,41 @@ class Signal:
         return cls(type=signal_type, agent=agent, payload=payload)
 
 
+def _glob_to_regex(pattern: str) -> str:
+    """Convert a scope glob to a regex matched from the start of a path."""
+    regex = pattern.replace(".", r"\.").replace("*", ".*").replace("?", ".")
+    if not regex.endswith(".*"):
+        regex = f"^{regex}.*"
+    return regex
+
+
+@lru_cache(maxsize=256)
+def _compile_scope_regex(
+    scope: tuple[str, ...],
+    cannot: tuple[str, ...],
+) -> Optional[re.Pattern]:
+    """
+    Compile scope minus cannot into a single regex.
+    
+    Matches paths that some scope glob matches, unless a cannot glob
+    (checked by a lookahead) matches first. None if nothing is in scope.
+    """
+    if not scope:
+        return None
+    allow = "|".join(f"(?:{_glob_to_regex(p)})" for p in scope)
+    if not cannot:
+        return re.compile(allow)
+    deny = "|".join(f"(?:{_glob_to_regex(p)})" for p in cannot)
+    return re.compile(f"(?!{deny})(?:{allow})")
+
+
+def _bullets(items: Sequence[str], default: str) -> str:
+    """Render items as a markdown bullet list, or the default bullet."""
+    if not items:
+        return default
+    return "\n".join(f"- {item}" for item in items)
+
+
 @dataclass
 class Contract:
     """
@@ -99,27 +135,21 @@ class Contract:
     
     def path_allowed(self, path: str | Path) -> bool:
         """Check if a path is within scope and not forbidden."""
-        path_str = str(path)
-        
-        # Check forbidden first
-        for pattern in self.cannot:
-            if self._matches_glob(path_str, pattern):
-                return False
-        
-        # Check allowed
-        for pattern in self.scope:
-            if self._matches_glob(path_str, pattern):
-                return True
+        scope_re = self._compile_scope()
+        return bool(scope_re and scope_re.match(str(path)))
+    
+    def _compile_scope(self) -> Optional[re.Pattern]:
+        """
+        Return one regex matching paths in scope and not forbidden.
         
-        return False
+        However many globs the contract has, a path is checked with a
+        single regex match. Compiled patterns are cached by their globs.
+        """
+        return _compile_scope_regex(tuple(self.scope), tuple(self.cannot))
     
     def _matches_glob(self, path: str, pattern: str) -> bool:
         """Simple glob matching."""
-        # Convert glob to regex
-        regex = pattern.replace(".", r"\.").replace("*", ".*").replace("?", ".")
-        if not regex.endswith(".*"):
-            regex = f"^{regex}.*"
-        return bool(re.match(regex, path))
+        return bool(re.match(_glob_to_regex(pattern), path))
     
     def get_dependency_signals(self) -> list[str]:
         """Extract signal names from depends field."""
@@ -141,22 +171,22 @@ class Contract:
 You are agent `{self.name}` operating under strict isolation.
 
 ### SCOPE (Files you CAN access)
-{chr(10).join(f"- {s}" for s in self.scope)}
+{_bullets(self.scope, "")}
 
 ### CANNOT (Files you MUST NOT touch - access will be denied)
-{chr(10).join(f"- {c}" for c in self.cannot) if self.cannot else "- (none specified)"}
+{_bullets(self.cannot, "- (none specified)")}
 
 ### DEPENDS (Signals that must exist before you start)
-{chr(10).join(f"- {d}" for d in self.depends) if self.depends else "- none"}
+{_bullets(self.depends, "- none")}
 
 ### EXPECTS (Inputs you require)
-{chr(10).join(f"- {e}" for e in self.expects) if self.expects else "- (none)"}
+{_bullets(self.expects, "- (none)")}
 
 ### PRODUCES (Outputs you must create)
-{chr(10).join(f"- {p}" for p in self.produces) if self.produces else "- (none specified)"}
+{_bullets(self.produces, "- (none specified)")}
 
 ### VERIFY (Commands that must pass before signaling READY)
-{chr(10).join(f"- {v}" for v in self.verify) if self.verify else "- (manual verification)"}
+{_bullets(self.verify, "- (manual verification)")}
 
 ### ENFORCEMENT
 - File operations outside SCOPE will fail with PermissionError
@@ -233,7 +263,7 @@ class ExecutionPlan:
         
         # Topological sort for sequential order
         sequential = []
-        remaining = set(deps.keys())
+        remaining = set(deps)
         
         while remaining:
             # Find agents with no unmet dependencies
@@ -270,6 +300,37 @@ class ExecutionPlan:
             parallel_groups=parallel_groups,
             sequential_order=sequential
         )
+    
+    @classmethod
+    def from_contracts_cached(cls, contracts: list[Contract]) -> "ExecutionPlan":
+        """
+        Build execution plan, reusing the ordering of a dependency graph
+        this process has planned before.
+        """
+        # The ordering depends only on names and dependency signals
+        parallel_groups, sequential_order = _plan_ordering(tuple(
+            (c.name, tuple(c.get_dependency_signals())) for c in contracts
+        ))
+        return cls(
+            agents=contracts,
+            parallel_groups=[list(group) for group in parallel_groups],
+            sequential_order=list(sequential_order)
+        )
+
+
+@lru_cache(maxsize=32)
+def _plan_ordering(
+    graph: tuple[tuple[str, tuple[str, ...]], ...],
+) -> tuple[tuple[tuple[str, ...], ...], tuple[str, ...]]:
+    """Plan a graph of (name, dependency signals) pairs, as tuples."""
+    plan = ExecutionPlan.from_contracts([
+        Contract(name=name, scope=[], depends=list(signals))
+        for name, signals in graph
+    ])
+    return (
+        tuple(tuple(group) for group in plan.parallel_groups),
+        tuple(plan.sequential_order),
+    )
 
 
 # ============================================================
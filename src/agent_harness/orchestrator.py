@@ -135,7 +135,7 @@ class Orchestrator:
             )
         
         # Build execution plan
-        plan = ExecutionPlan.from_contracts(contracts)
+        plan = ExecutionPlan.from_contracts_cached(contracts)
         logger.info(f"Execution plan: {plan.sequential_order}")
         logger.info(f"Parallel groups: {plan.parallel_groups}")
         
@@ -204,6 +204,12 @@ class Orchestrator:
                     await workspace.cleanup()
                 except Exception as e:
                     logger.warning(f"Cleanup error: {e}")
+            
+            # Containers of failed workspace setups, and the API connection
+            try:
+                await self.isolator.cleanup_all()
+            except Exception as e:
+                logger.warning(f"Cleanup error: {e}")
         
         duration = (datetime.now() - start_time).total_seconds()
         
@@ -415,7 +421,7 @@ Begin execution. Follow the protocol header format.
             if not full_path.exists():
                 raise FileNotFoundError(f"File not found: {path}")
             
-            workspace.files_read.append(path)
+            workspace.files_read.add(path)
             return full_path.read_text()
         
         return handler
@@ -437,7 +443,7 @@ Begin execution. Follow the protocol header format.
             full_path.parent.mkdir(parents=True, exist_ok=True)
             full_path.write_text(content)
             
-            workspace.files_written.append(path)
+            workspace.files_written.add(path)
             return f"Written {len(content)} bytes to {path}"
         
         return handler
@@ -12,11 +12,19 @@ VERIFY: npm test
 ---
 """
 
+import copy
+import functools
 import re
+from pathlib import Path
 from typing import Iterator
+from . import cache
 from .models import Contract
 
 
+# Bump when Contract or the parse output changes shape
+_CACHE_VERSION = 1
+
+
 class ContractParser:
     """Parse agent contracts from various formats."""
     
@@ -131,6 +139,24 @@ class ContractParser:
         
         return contracts
     
+    @classmethod
+    def parse_file(cls, path: str | Path) -> tuple[list[Contract], list[str]]:
+        """
+        Parse and validate a contracts file, with caching.
+        
+        Results are memoized in-process and pickled to the user cache, keyed
+        by path, mtime and size, so `validate` followed by `plan` on an
+        unchanged file parses and validates it once.
+        
+        Returns:
+            Tuple of (contracts, validation_errors)
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        result = _parse_file_cached(str(path), stat.st_mtime_ns, stat.st_size)
+        # Callers (e.g. the orchestrator) mutate contracts; keep the cache clean
+        return copy.deepcopy(result)
+    
     @classmethod
     def validate_contracts(cls, contracts: list[Contract]) -> list[str]:
         """
@@ -236,6 +262,22 @@ class ContractParser:
         return contracts, metadata
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_file_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[list[Contract], list[str]]:
+    """Parse and validate a file, going through the on-disk cache."""
+    key = cache.cache_key(_CACHE_VERSION, path, mtime_ns, size)
+    result = cache.load("contracts", key)
+    if result is None:
+        contracts = parse_contracts(Path(path).read_text())
+        result = (contracts, ContractParser.validate_contracts(contracts))
+        cache.store("contracts", key, result)
+    return result
+
+
 def parse_contracts(source: str) -> list[Contract]:
     """
     Convenience function to parse contracts from any format.
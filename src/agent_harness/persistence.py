@@ -6,17 +6,72 @@ Saves complete session state to disk so that:
 2. User can close terminal, come back later
 3. Crash recovery
 
-State is saved after every significant action.
+State is saved after every significant action. Saves append the fields
+that changed to a journal next to the snapshot, which is rewritten in
+full only every JOURNAL_MAX_OPS operations or when a new session starts.
 """
 
 import json
 import os
-from dataclasses import dataclass, field, asdict
+import time
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Any
 import hashlib
 
+try:
+    import orjson
+
+    def _encode(data: Any) -> bytes:
+        # Serializes the dataclasses natively, without asdict()'s deep copy
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+
+    def _encode_compact(data: Any) -> bytes:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _decode = orjson.loads
+except ImportError:
+    def _encode(data: Any) -> bytes:
+        if hasattr(data, "__dataclass_fields__"):
+            data = asdict(data)
+        return json.dumps(data, indent=2, default=str).encode()
+
+    def _fallback_default(obj: Any) -> Any:
+        if hasattr(obj, "__dataclass_fields__"):
+            return asdict(obj)
+        return str(obj)
+
+    def _encode_compact(data: Any) -> bytes:
+        return json.dumps(
+            data, default=_fallback_default, separators=(",", ":")
+        ).encode()
+
+    _decode = json.loads
+
+# Journal operations between full snapshots
+JOURNAL_MAX_OPS = 256
+
+# Session lists that grow for the whole session; beyond MAX_LOG_ENTRIES
+# the oldest half is moved to history.jsonl (commits there can no longer
+# be reverted through provide_feedback)
+LOG_FIELDS = ("commits", "verification_results", "errors_encountered", "feedback_history")
+MAX_LOG_ENTRIES = 256
+
+
+def _write_bytes(path: Path, payload: bytes, append: bool = False) -> None:
+    """Write payload to path straight through the fd, without a text layer."""
+    mode = os.O_APPEND if append else os.O_TRUNC
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode | os.O_CLOEXEC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 @dataclass
 class AgentResultPersist:
@@ -49,6 +104,9 @@ class ContractPersist:
     # e.g. [{"type": "test", "command": "npm test", "expected": "exit 0"},
     #       {"type": "manual", "description": "Login flow works"},
     #       {"type": "endpoint", "url": "/api/auth/login", "method": "POST"}]
+    
+    # Bumped whenever the contract is edited after planning
+    version: int = 0
 
 
 @dataclass
@@ -63,6 +121,7 @@ class SessionState:
     session_id: str = ""
     created_at: str = ""
     updated_at: str = ""
+    revision: int = 0  # time_ns() of the last full snapshot, strictly increasing
     
     # Task
     original_goal: str = ""
@@ -89,7 +148,7 @@ class SessionState:
     
     # Execution state
     execution_started: bool = False
-    current_agent: Optional[str] = None
+    current_agents: list[str] = field(default_factory=list)  # Last batch run
     completed_agents: list[str] = field(default_factory=list)
     failed_agents: list[str] = field(default_factory=list)
     pending_agents: list[str] = field(default_factory=list)
@@ -124,21 +183,34 @@ class SessionState:
     resume_context: str = ""  # Human-readable summary for new context window
 
 
+_STATE_FIELDS = tuple(f.name for f in fields(SessionState))
+
+
 class SessionPersistence:
     """
     Manages session state persistence.
     
-    State is saved to .agent-harness/session.json in repo root.
+    State is saved to .agent-harness/session.json in repo root, with
+    changes since that snapshot in .agent-harness/session.journal. Each
+    journal line sets one field or extends one list field, and names the
+    snapshot it applies to by its revision.
     """
     
     def __init__(self, repo_root: Path):
         self.repo_root = Path(repo_root)
         self.state_dir = self.repo_root / ".agent-harness"
         self.state_file = self.state_dir / "session.json"
+        self.journal_file = self.state_dir / "session.journal"
+        self.overflow_file = self.state_dir / "history.jsonl"
         self.history_dir = self.state_dir / "history"
         
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Compact encoding and length of each field as last persisted
+        self._persisted: Optional[dict[str, tuple[bytes, int]]] = None
+        self._base = b""
+        self._journal_ops = 0
     
     def load(self) -> Optional[SessionState]:
         """Load existing session or return None."""
@@ -146,13 +218,19 @@ class SessionPersistence:
             return None
         
         try:
-            data = json.loads(self.state_file.read_text())
-            return self._dict_to_state(data)
+            data = _decode(self.state_file.read_bytes())
+            base = data.get("revision", 0)
+            self._journal_ops = self._replay_journal(data, base)
+            state = self._dict_to_state(data)
         except (json.JSONDecodeError, KeyError) as e:
             # Corrupted state - backup and return None
             backup = self.state_file.with_suffix('.json.corrupted')
             self.state_file.rename(backup)
             return None
+        
+        self._base = _encode_compact(base)
+        self._persisted = self._encode_fields(state)
+        return state
     
     def save(self, state: SessionState) -> None:
         """Save session state to disk."""
@@ -161,12 +239,119 @@ class SessionPersistence:
         # Update resume context
         state.resume_context = self._generate_resume_context(state)
         
-        data = self._state_to_dict(state)
+        self._spill_overflow(state)
+        encoded = self._encode_fields(state)
+        if (
+            self._persisted is None
+            or encoded["session_id"] != self._persisted["session_id"]
+            or self._journal_ops >= JOURNAL_MAX_OPS
+            or not self.state_file.exists()
+        ):
+            self._write_snapshot(state, encoded)
+            return
+        
+        # Only the fields that changed, and only the new items of lists
+        # that grew by appending, go to the journal
+        lines = []
+        prefix = b'{"base":' + self._base + b',"field":"'
+        for name, (data, length) in encoded.items():
+            old_data, old_length = self._persisted[name]
+            if data == old_data:
+                continue
+            value = getattr(state, name)
+            if isinstance(value, list) and length > old_length and (
+                old_length == 0 or data.startswith(old_data[:-1] + b",")
+            ):
+                op, data = b"extend", _encode_compact(value[old_length:])
+            else:
+                op = b"set"
+            lines.append(
+                prefix + name.encode() + b'","op":"' + op + b'","value":' + data + b"}\n"
+            )
+        
+        # One O_APPEND write per save, so a crash loses at most this save
+        _write_bytes(self.journal_file, b"".join(lines), append=True)
+        self._journal_ops += len(lines)
+        self._persisted = encoded
+    
+    def _spill_overflow(self, state: SessionState) -> None:
+        """Move the oldest entries of overlong LOG_FIELDS to history.jsonl."""
+        lines = []
+        session_id = _encode_compact(state.session_id)
+        for name in LOG_FIELDS:
+            entries = getattr(state, name)
+            if len(entries) <= MAX_LOG_ENTRIES:
+                continue
+            # Trimming by half means a full rewrite of the field in the
+            # journal only every MAX_LOG_ENTRIES // 2 appends. Manual checks
+            # still awaiting the user stay so they can be confirmed.
+            excess = len(entries) - MAX_LOG_ENTRIES // 2
+            spilled, kept = [], []
+            for e in entries:
+                if len(spilled) < excess and not (isinstance(e, dict) and e.get("awaiting_user")):
+                    spilled.append(e)
+                else:
+                    kept.append(e)
+            prefix = b'{"session_id":' + session_id + b',"field":"' + name.encode() + b'","entry":'
+            lines.extend(prefix + _encode_compact(e) + b"}\n" for e in spilled)
+            entries[:] = kept
+        
+        if lines:
+            _write_bytes(self.overflow_file, b"".join(lines), append=True)
+    
+    def _write_snapshot(
+        self,
+        state: SessionState,
+        encoded: dict[str, tuple[bytes, int]],
+    ) -> None:
+        """Write the full state and start an empty journal."""
+        # A wall clock stepping back must not reuse a revision
+        state.revision = max(time.time_ns(), state.revision + 1)
+        encoded["revision"] = (_encode_compact(state.revision), 0)
         
-        # Atomic write
+        # Atomic write; journal lines for the previous snapshot no longer
+        # match its revision, so a crash before the unlink is harmless
         tmp_file = self.state_file.with_suffix('.tmp')
-        tmp_file.write_text(json.dumps(data, indent=2, default=str))
+        _write_bytes(tmp_file, _encode(state))
         tmp_file.rename(self.state_file)
+        self.journal_file.unlink(missing_ok=True)
+        
+        self._base = encoded["revision"][0]
+        self._persisted = encoded
+        self._journal_ops = 0
+    
+    def _replay_journal(self, data: dict, base: int) -> int:
+        """Apply journal lines for snapshot `base` to data; return their count."""
+        try:
+            journal = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return 0
+        
+        ops = 0
+        for line in journal.splitlines():
+            try:
+                entry = _decode(line)
+            except json.JSONDecodeError:
+                # Torn final write from a crash
+                continue
+            if entry["base"] != base:
+                continue
+            if entry["op"] == "extend":
+                data[entry["field"]].extend(entry["value"])
+            else:
+                data[entry["field"]] = entry["value"]
+            ops += 1
+        return ops
+    
+    @staticmethod
+    def _encode_fields(state: SessionState) -> dict[str, tuple[bytes, int]]:
+        """Encode each state field compactly, with list lengths."""
+        encoded = {}
+        for name in _STATE_FIELDS:
+            value = getattr(state, name)
+            length = len(value) if isinstance(value, list) else 0
+            encoded[name] = (_encode_compact(value), length)
+        return encoded
     
     def create_new(self, goal: str) -> SessionState:
         """Create a new session."""
@@ -191,12 +376,13 @@ class SessionPersistence:
         archive_name = f"{state.session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         archive_path = self.history_dir / archive_name
         
-        data = self._state_to_dict(state)
-        archive_path.write_text(json.dumps(data, indent=2, default=str))
+        _write_bytes(archive_path, _encode(state))
         
         # Remove active session
         if self.state_file.exists():
             self.state_file.unlink()
+        self.journal_file.unlink(missing_ok=True)
+        self._persisted = None
         
         return archive_path
     
@@ -229,7 +415,7 @@ class SessionPersistence:
                 status = "✓" if c.name in state.completed_agents else "○"
                 if c.name in state.failed_agents:
                     status = "✗"
-                if c.name == state.current_agent:
+                if c.name in state.current_agents:
                     status = "▶"
                 lines.append(f"  {status} {c.name}: {c.goal[:50]}...")
             lines.append("")
@@ -261,16 +447,6 @@ class SessionPersistence:
         
         return "\n".join(lines)
     
-    def _state_to_dict(self, state: SessionState) -> dict:
-        """Convert state to serializable dict."""
-        d = asdict(state)
-        # Convert nested dataclasses
-        d['proposed_contracts'] = [asdict(c) if hasattr(c, '__dataclass_fields__') else c 
-                                   for c in state.proposed_contracts]
-        d['results'] = {k: asdict(v) if hasattr(v, '__dataclass_fields__') else v 
-                        for k, v in state.results.items()}
-        return d
-    
     def _dict_to_state(self, data: dict) -> SessionState:
         """Convert dict back to state."""
         # Convert nested structures
@@ -280,7 +456,8 @@ class SessionPersistence:
         data['proposed_contracts'] = contracts
         data['results'] = results
         
-        return SessionState(**data)
+        # Fields dropped since the session was saved
+        return SessionState(**{k: v for k, v in data.items() if k in _STATE_FIELDS})
 
 
 def get_resume_prompt(state: SessionState) -> str:
@@ -14,7 +14,13 @@ BEFORE execution, not after.
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
+import copy
 import re
+import threading
+
+
+# Distinct contract signatures whose derived checks are kept
+_PLAN_CACHE_SIZE = 256
 
 
 @dataclass
@@ -84,9 +90,43 @@ class VerificationPlanner:
     
     def __init__(self, repo_root: Path):
         self.repo_root = Path(repo_root)
+        
+        # Checks derived from contract fields alone, by those fields;
+        # modify_plan and re-planning ask for the same contracts again
+        self._plan_cache: dict[tuple, VerificationPlan] = {}
+        # generate_plan also runs in worker threads via asyncio.to_thread
+        self._plan_cache_lock = threading.Lock()
     
     def generate_plan(self, contract: "Contract") -> VerificationPlan:
         """Generate a verification plan for a contract."""
+        key = (
+            tuple(contract.scope),
+            tuple(contract.depends),
+            tuple(contract.expects),
+            tuple(contract.produces),
+            tuple(contract.verify),
+        )
+        with self._plan_cache_lock:
+            template = self._plan_cache.get(key)
+        if template is None:
+            template = self._plan_from_fields(contract)
+            with self._plan_cache_lock:
+                if len(self._plan_cache) >= _PLAN_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._plan_cache[next(iter(self._plan_cache))]
+                self._plan_cache[key] = template
+        
+        # Callers record results on the checks, so each gets its own copy
+        plan = copy.deepcopy(template)
+        plan.agent_name = contract.name
+        
+        # Discover tests in scope; files change between calls, so this
+        # always runs
+        plan.automated_checks.extend(self._discover_tests(contract))
+        return plan
+    
+    def _plan_from_fields(self, contract: "Contract") -> VerificationPlan:
+        """Build the parts of a plan that depend only on the contract."""
         plan = VerificationPlan(agent_name=contract.name)
         
         # Pre-checks: verify dependencies exist
@@ -105,10 +145,6 @@ class VerificationPlanner:
             checks = self._infer_checks_from_produce(produce, contract)
             plan.automated_checks.extend(checks)
         
-        # Discover tests in scope
-        test_checks = self._discover_tests(contract)
-        plan.automated_checks.extend(test_checks)
-        
         # Generate manual checks for UX-related produces
         manual = self._generate_manual_checks(contract)
         plan.manual_checks.extend(manual)
@@ -0,0 +1,82 @@
+"""
+Tests for the on-disk result cache.
+
+Tests:
+- Round-tripping values through load/store
+- Reusing execution plan orderings within the process
+"""
+
+import pytest
+
+from agent_harness import cache
+from agent_harness.models import Contract, ExecutionPlan
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at tmp_path."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+class TestLoadStore:
+    """Tests for load() and store()."""
+
+    def test_round_trips_values(self):
+        """Should return what was stored under the same key."""
+        key = cache.cache_key("a", 1)
+        assert cache.load("things", key) is None
+        cache.store("things", key, {"x": [1, 2]})
+        assert cache.load("things", key) == {"x": [1, 2]}
+
+    def test_keys_depend_on_every_part(self):
+        """Should produce different keys for different parts."""
+        assert cache.cache_key("a", 1) != cache.cache_key("a", 2)
+        assert cache.cache_key("ab") != cache.cache_key("a", "b")
+
+    def test_treats_corrupt_entries_as_misses(self, cache_dir):
+        """Should ignore entries that fail to unpickle."""
+        key = cache.cache_key("bad")
+        (cache_dir / "things").mkdir()
+        (cache_dir / "things" / f"{key}.pkl").write_bytes(b"not a pickle")
+        assert cache.load("things", key) is None
+
+
+class TestCachedPlan:
+    """Tests for ExecutionPlan.from_contracts_cached()."""
+
+    CONTRACTS = [
+        Contract(name="api", scope=["src/api/"]),
+        Contract(name="web", scope=["src/web/"], depends=["READY:api"]),
+        Contract(name="docs", scope=["docs/"], depends=["READY:api"]),
+    ]
+
+    def test_matches_uncached_plan(self):
+        """Should produce the same ordering on a miss and on a hit."""
+        expected = ExecutionPlan.from_contracts(self.CONTRACTS)
+        for _ in range(2):
+            plan = ExecutionPlan.from_contracts_cached(self.CONTRACTS)
+            assert plan.parallel_groups == expected.parallel_groups
+            assert plan.sequential_order == expected.sequential_order
+            assert plan.agents is self.CONTRACTS
+
+    def test_reuses_ordering_for_same_graph(self, monkeypatch):
+        """Should not re-run the sort for a graph seen before."""
+        ExecutionPlan.from_contracts_cached(self.CONTRACTS)
+        monkeypatch.setattr(ExecutionPlan, "from_contracts", None)
+        plan = ExecutionPlan.from_contracts_cached(self.CONTRACTS)
+        assert plan.sequential_order == ["api", "docs", "web"]
+
+    def test_stays_in_process(self, cache_dir):
+        """Should not write plan orderings to the on-disk cache."""
+        ExecutionPlan.from_contracts_cached(self.CONTRACTS)
+        assert list(cache_dir.iterdir()) == []
+
+    def test_returns_fresh_lists(self):
+        """Should not let callers mutate the cached ordering."""
+        plan = ExecutionPlan.from_contracts_cached(self.CONTRACTS)
+        plan.sequential_order.append("extra")
+        plan.parallel_groups[0].append("extra")
+        again = ExecutionPlan.from_contracts_cached(self.CONTRACTS)
+        assert "extra" not in again.sequential_order
+        assert "extra" not in again.parallel_groups[0]
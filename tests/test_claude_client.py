@@ -0,0 +1,243 @@
+"""
+Tests for ClaudeClient response parsing.
+
+Tests the structured data extracted from agent output:
+- Signal extraction (prefixed and bare forms)
+- Trajectory detection
+- CHANGED/ADDED file operations
+- VERIFIED results
+- Checkpoint fields
+- Unanswered tool calls kept out of the history
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from agent_harness.claude_client import ClaudeClient
+from agent_harness.models import Contract, SignalType, Trajectory
+
+
+RESPONSE = """GOAL:add auth|STATUS:done|3/3|none|CTX:40%|SPLIT:1
+STATE:tests=green|TRAJ:CONVERGED|BLOCK:none
+
+COMPLETE
+GOAL:add auth
+CHANGED:src/app.py:wired routes
+CHANGED:src/db.py:added users table
+ADDED:src/auth.py:jwt helpers
+VERIFIED:
+- pytest exit 0
+- lint FAILED with 2 errors
+- manual check ✓
+SIGNAL:DATA:backend:/tmp/schema.json
+SIGNAL:READY:backend
+READY:backend
+BLOCKED:frontend:waiting on api
+"""
+
+
+@pytest.fixture
+def client():
+    """Create a ClaudeClient without touching the environment."""
+    return ClaudeClient(api_key="test-key")
+
+
+class TestParseResponse:
+    """Tests for parse_response()."""
+
+    def test_extracts_signals(self, client):
+        """Should extract prefixed signals and dedupe bare repeats."""
+        response = client.parse_response(RESPONSE, "backend")
+        assert [(s.type, s.agent, s.payload) for s in response.signals] == [
+            (SignalType.DATA, "backend", "/tmp/schema.json"),
+            (SignalType.READY, "backend", None),
+            (SignalType.BLOCKED, "frontend", "waiting on api"),
+        ]
+
+    def test_extracts_tokens_inside_payloads(self, client):
+        """Should find signals and TRAJ embedded in another signal's payload."""
+        response = client.parse_response(
+            "BLOCKED:frontend:see SIGNAL:DATA:backend:/tmp/api.json\n"
+            "SIGNAL:ESCALATE:backend:scope TRAJ:ESCAPING\n",
+            "frontend",
+        )
+        assert [(s.type, s.agent) for s in response.signals] == [
+            (SignalType.DATA, "backend"),
+            (SignalType.ESCALATE, "backend"),
+            (SignalType.BLOCKED, "frontend"),
+        ]
+        assert response.trajectory == Trajectory.ESCAPING
+
+    def test_extracts_trajectory(self, client):
+        """Should read TRAJ from the header, defaulting to BOUNDED."""
+        assert client.parse_response(RESPONSE, "backend").trajectory == Trajectory.CONVERGED
+        assert client.parse_response("no header", "backend").trajectory == Trajectory.BOUNDED
+
+    def test_extracts_file_ops(self, client):
+        """Should split CHANGED and ADDED lines."""
+        response = client.parse_response(RESPONSE, "backend")
+        assert response.files_modified == ["src/app.py", "src/db.py"]
+        assert response.files_created == ["src/auth.py"]
+
+    def test_file_ops_stay_on_one_line(self, client):
+        """Should ignore CHANGED/ADDED lines missing the description field."""
+        response = client.parse_response("CHANGED:src/a.py\nnotes: x\n", "backend")
+        assert response.files_modified == []
+
+    def test_extracts_verification(self, client):
+        """Should mark lines with success indicators as passed."""
+        response = client.parse_response(RESPONSE, "backend")
+        assert response.verification_results == {
+            "pytest exit 0": True,
+            "lint FAILED with 2 errors": False,
+            "manual check ✓": True,
+        }
+
+    def test_completion_and_block_state(self, client):
+        """Should report completion and the first blocking reason."""
+        response = client.parse_response(RESPONSE, "backend")
+        assert response.is_complete
+        assert response.is_blocked
+        assert response.block_reason == "waiting on api"
+
+    def test_checkpoint(self, client):
+        """Should only parse checkpoint fields when CHECKPOINT is present."""
+        assert client.parse_response(RESPONSE, "backend").checkpoint is None
+
+        response = client.parse_response(
+            "CHECKPOINT\nGOAL:ship it\nDONE:a,b\nRESUME:run tests\n", "backend"
+        )
+        assert response.checkpoint == {
+            "goal": "ship it",
+            "done": "a,b",
+            "resume": "run tests",
+        }
+
+
+class TestPromptCaching:
+    """Tests for system prompt and tool memoization."""
+
+    def test_reuses_prompt_for_same_contract(self, client):
+        """Should return the same built prompt and tools for equal contracts."""
+        first = Contract(name="backend", scope=["src/"])
+        second = Contract(name="backend", scope=["src/"])
+        assert client.build_system_prompt(first) is client.build_system_prompt(second)
+        assert client.get_tools(first) is client.get_tools(second)
+
+    def test_rebuilds_prompt_for_changed_contract(self, client):
+        """Should not share prompts between contracts that differ."""
+        base = Contract(name="backend", scope=["src/"])
+        other = Contract(name="backend", scope=["src/"], verify=["pytest"])
+        assert client.build_system_prompt(base) is not client.build_system_prompt(other)
+        assert "pytest" in client.build_system_prompt(other)[1]["text"]
+
+    async def test_conversations_share_prompt_and_tools(self, client):
+        """Should hand every conversation on a contract the same objects."""
+        contract = Contract(name="backend", scope=["src/"])
+        first = await client.create_conversation(contract, goal="a")
+        second = await client.create_conversation(contract, goal="b")
+        assert first.system_prompt is second.system_prompt
+        assert first.tools is second.tools
+
+
+class TestHistoryCompaction:
+    """Tests for AgentConversation history compaction."""
+
+    async def test_folds_old_exchanges_into_opening_message(self, client):
+        """Should keep the opening and latest messages with valid roles."""
+        conversation = await client.create_conversation(
+            Contract(name="backend", scope=["src/"]), goal="g"
+        )
+        conversation.compact_keep_messages = 2
+        conversation._append_message("user", "Your goal: g")
+        for i in range(3):
+            conversation._append_message("assistant", [
+                {"type": "tool_use", "id": f"t{i}", "name": "read_file",
+                 "input": {"path": f"src/{i}.py"}},
+            ])
+            conversation._append_message("user", [
+                {"type": "tool_result", "tool_use_id": f"t{i}", "content": "ok"},
+            ])
+
+        conversation._compact_history()
+
+        messages = list(conversation.messages)
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+        assert messages[1]["content"][0]["id"] == "t2"
+        summary = messages[0]["content"][-1]
+        assert "4 earlier messages compacted" in summary["text"]
+        assert 'read_file {"path":' in summary["text"]
+        assert summary["cache_control"] == {"type": "ephemeral"}
+
+    async def test_tracks_history_text_size(self, client):
+        """Should size messages by their text, tool inputs and results."""
+        conversation = await client.create_conversation(
+            Contract(name="backend", scope=["src/"]), goal="g"
+        )
+        conversation._append_message("user", "hello")
+        conversation._append_message("assistant", [
+            {"type": "text", "text": "abc"},
+            {"type": "tool_use", "id": "t0", "name": "read_file",
+             "input": {"path": "src/a.py"}},
+        ])
+        conversation._append_message("user", [
+            {"type": "tool_result", "tool_use_id": "t0", "content": "x = 1"},
+        ])
+
+        assert conversation._history_chars == 5 + 3 + 8 + 5
+
+
+class _FakeStream:
+    """Async stream context yielding a fixed final message."""
+
+    def __init__(self, message):
+        self.message = message
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for block in self.message.content:
+            if block.type == "text":
+                yield block.text
+
+    async def get_final_message(self):
+        return self.message
+
+
+class TestSend:
+    """Tests for AgentConversation.send()."""
+
+    async def test_drops_tool_calls_cut_off_at_max_tokens(self, client):
+        """Should not leave unanswered tool_use blocks in the history."""
+        conversation = await client.create_conversation(
+            Contract(name="backend", scope=["src/"]), goal="g"
+        )
+        handled = []
+
+        async def read_file(tool_input):
+            handled.append(tool_input)
+
+        conversation.set_tool_handler("read_file", read_file)
+        message = SimpleNamespace(stop_reason="max_tokens", content=[
+            SimpleNamespace(type="text", text="Reading\n"),
+            SimpleNamespace(type="tool_use", id="t1", name="read_file",
+                            input={"path": "src/"}),
+        ])
+        api = SimpleNamespace(messages=SimpleNamespace(
+            stream=lambda **kwargs: _FakeStream(message)
+        ))
+        client._get_anthropic = lambda: api
+
+        await conversation.send("go")
+
+        assert handled == []
+        assert conversation.messages[-1] == {
+            "role": "assistant",
+            "content": [{"type": "text", "text": "Reading\n"}],
+        }
@@ -0,0 +1,63 @@
+"""
+Tests for the command-line interface.
+
+Tests the CLI entry point:
+- Lazy subcommand loading
+- Top-level help fast path
+- Missing input files
+- Batch validation
+"""
+
+import pytest
+from click.testing import CliRunner
+
+from agent_harness.cli import HELP_TEXT, cli
+
+
+class TestEntryPoint:
+    """Tests for the cli group and main()."""
+
+    def test_help_text_matches_click(self):
+        """Should keep the fast-path help identical to click's rendering."""
+        result = CliRunner().invoke(cli, ["--help"], prog_name="aph")
+        assert result.output == HELP_TEXT.format(prog="aph")
+
+    def test_resolves_subcommands(self):
+        """Should load each listed subcommand from its module."""
+        ctx = cli.make_context("aph", ["--version"], resilient_parsing=True)
+        for name in cli.list_commands(ctx):
+            assert cli.get_command(ctx, name).name == name
+        assert cli.get_command(ctx, "missing") is None
+
+
+class TestValidateBatch:
+    """Tests for validating several contract files at once."""
+
+    def test_summarizes_each_file(self, tmp_path):
+        """Should report every file and fail if any is invalid."""
+        good = tmp_path / "good.md"
+        good.write_text("---AGENT:backend\nSCOPE: src/\n---\n")
+        bad = tmp_path / "bad.md"
+        bad.write_text("---AGENT:web\nSCOPE: web/\nDEPENDS: READY:api\n---\n")
+
+        result = CliRunner().invoke(cli, ["validate", str(good), str(bad)])
+        assert result.exit_code == 1
+        assert f"{good}: ✓ 1 contract(s) valid" in result.output
+        assert "✗ Agent web depends on unknown agent: api" in result.output
+
+
+class TestMissingFiles:
+    """Tests for file arguments that do not exist."""
+
+    @pytest.mark.parametrize("command, param", [
+        ("validate", "CONTRACTS_FILES..."),
+        ("plan", "CONTRACTS_FILE"),
+        ("run", "CONTRACTS_FILE"),
+        ("extract", "RESPONSE_FILE"),
+    ])
+    def test_reports_usage_error(self, tmp_path, command, param):
+        """Should fail like click.Path(exists=True) did."""
+        missing = str(tmp_path / "missing.md")
+        result = CliRunner().invoke(cli, [command, missing])
+        assert result.exit_code == 2
+        assert f"Invalid value for '{param}': Path '{missing}' does not exist." in result.output
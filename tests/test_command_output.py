@@ -0,0 +1,59 @@
+"""
+Tests for bounded command output capture.
+
+Tests:
+- Decoding chunks split mid-line and mid-character
+- Keeping the first and last lines of long output
+- Draining a running process and killing it on timeout
+"""
+
+import asyncio
+import sys
+
+from agent_harness.command_output import CommandOutput, collect_output
+
+
+class TestCommandOutput:
+    """Tests for CommandOutput."""
+
+    def test_keeps_last_lines(self):
+        """Should decode split chunks and drop the oldest lines."""
+        output = CommandOutput(max_lines=3)
+        for chunk in [b"a\nb", b"\nc\n\xc3", b"\xa9\nd\ne"]:
+            output.feed(chunk)
+        assert output.text() == "[... 2 earlier lines dropped]\nc\né\nd\ne"
+
+    def test_keeps_head_lines(self):
+        """Should keep the first lines and mark the gap before the tail."""
+        output = CommandOutput(max_lines=2, head_lines=2)
+        output.feed(b"".join(b"%d\n" % i for i in range(10)))
+        assert output.text() == "0\n1\n[... 6 lines dropped]\n8\n9\n"
+
+    def test_short_output_unchanged(self):
+        """Should return output that fits as it was written."""
+        output = CommandOutput(max_lines=2, head_lines=2)
+        output.feed(b"0\n1\n2\n3")
+        assert output.text() == "0\n1\n2\n3"
+
+
+class TestCollectOutput:
+    """Tests for collect_output()."""
+
+    async def _run(self, code, timeout=10, head_lines=0):
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        return await collect_output(proc, timeout, head_lines)
+
+    async def test_collects_both_streams(self):
+        """Should return the exit code and both streams."""
+        code = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+        assert await self._run(code) == (3, "out\n", "err\n")
+
+    async def test_kills_on_timeout(self):
+        """Should kill a process that outlives the timeout."""
+        assert await self._run("import time; time.sleep(30)", timeout=0.5) == (
+            -1, "", "Command timed out",
+        )
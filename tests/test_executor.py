@@ -0,0 +1,308 @@
+"""
+Tests for the full-power executor.
+
+Runs a fake claude CLI in place of the real one:
+- Materializing the repo as a worktree, a clone or a copy
+- Draining agent output, with timeouts and optional logging
+- Syncing workspace changes back to the repo
+- Pre-provisioned workspaces
+- Running independent agents concurrently
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from agent_harness.executor import FullPowerExecutor
+from agent_harness.models import Contract
+
+
+# Reads the prompt from stdin, then acts on AGENT_NAME
+_FAKE_CLAUDE = """\
+import os, sys, time
+
+prompt = sys.stdin.read()
+name = os.environ["AGENT_NAME"]
+out = sys.stdout.buffer
+
+if name == "chatty":
+    # "é" is split across two writes
+    for chunk in (b"h\\xc3", b"\\xa9llo\\nwor", b"ld"):
+        out.write(chunk)
+        out.flush()
+        time.sleep(0.05)
+    sys.stderr.write("oops\\n")
+elif name == "slow":
+    out.write(b"started\\n")
+    out.flush()
+    time.sleep(30)
+elif name == "writer":
+    with open("app.py", "a") as f:
+        f.write(prompt.strip().splitlines()[0] + "\\n")
+    os.mkdir("pkg")
+    with open("pkg/new.py", "w") as f:
+        f.write("y = 2\\n")
+    with open(".agent_complete.json", "w") as f:
+        f.write('{"status": "complete"}')
+"""
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A git repository with one committed file."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "app.py").write_text("x = 1\n")
+    _git(root, "init", "-q")
+    _git(root, "add", "app.py")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+@pytest.fixture
+def claude(tmp_path):
+    """Path of the fake claude CLI."""
+    path = tmp_path / "claude"
+    path.write_text(f"#!{sys.executable}\n{_FAKE_CLAUDE}")
+    path.chmod(0o755)
+    return path
+
+
+def _executor(repo, tmp_path, claude, **kwargs):
+    return FullPowerExecutor(
+        repo,
+        work_dir=tmp_path / "work",
+        claude_path=str(claude),
+        require_container=False,
+        **kwargs,
+    )
+
+
+class TestCopyRepo:
+    """Tests for _copy_repo_to_workspace()."""
+
+    async def test_adds_worktree(self, repo, tmp_path, claude):
+        """Should check git repos out as a detached worktree."""
+        executor = _executor(repo, tmp_path, claude)
+        workspace = tmp_path / "work" / "ws"
+
+        await executor._copy_repo_to_workspace(workspace)
+
+        assert (workspace / ".git").is_file()
+        assert (workspace / "app.py").read_text() == "x = 1\n"
+
+    async def test_falls_back_to_clone(self, repo, tmp_path, claude, monkeypatch):
+        """Should clone the repo when git cannot add a worktree."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "git").write_text(
+            "#!/bin/sh\n"
+            'for arg; do [ "$arg" = worktree ] && exit 1; done\n'
+            f'exec {shutil.which("git")} "$@"\n'
+        )
+        (bin_dir / "git").chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        executor = _executor(repo, tmp_path, claude)
+        workspace = tmp_path / "work" / "ws"
+
+        await executor._copy_repo_to_workspace(workspace)
+
+        assert (workspace / ".git").is_dir()
+        assert (workspace / "app.py").read_text() == "x = 1\n"
+
+    async def test_copies_plain_tree(self, tmp_path, claude):
+        """Should copy non-git trees without dependency directories."""
+        root = tmp_path / "plain"
+        (root / "node_modules").mkdir(parents=True)
+        (root / "node_modules" / "dep.js").write_text("")
+        (root / "app.py").write_text("x = 1\n")
+        executor = _executor(root, tmp_path, claude)
+        workspace = tmp_path / "work" / "ws"
+
+        await executor._copy_repo_to_workspace(workspace)
+
+        assert (workspace / "app.py").read_text() == "x = 1\n"
+        assert not (workspace / "node_modules").exists()
+
+
+class TestExecuteAgent:
+    """Tests for execute_agent()."""
+
+    async def test_collects_output(self, repo, tmp_path, claude):
+        """Should pass whole lines to on_output and log both streams."""
+        executor = _executor(repo, tmp_path, claude)
+        lines = []
+
+        execution = await executor.execute_agent(
+            Contract(name="chatty", scope=["*"]), on_output=lines.append
+        )
+
+        assert execution.exit_code == 0
+        assert execution.output == "héllo\nworld"
+        assert execution.stderr_output == "oops\n"
+        assert sorted(lines) == sorted(["héllo\n", "world", "oops\n"])
+        log = execution.log_file.read_text()
+        assert "héllo\nworld" in log and "oops\n" in log
+
+    async def test_without_log(self, repo, tmp_path, claude):
+        """Should not write a log file with log=False."""
+        executor = _executor(repo, tmp_path, claude)
+
+        execution = await executor.execute_agent(
+            Contract(name="chatty", scope=["*"]), log=False
+        )
+
+        assert execution.log_file is None
+        assert not (execution.workspace / ".agent_log.txt").exists()
+        assert execution.output == "héllo\nworld"
+
+    async def test_kills_on_timeout(self, repo, tmp_path, claude):
+        """Should kill an agent that outlives its timeout and keep its output."""
+        executor = _executor(repo, tmp_path, claude)
+
+        execution = await executor.execute_agent(
+            Contract(name="slow", scope=["*"]), timeout=1
+        )
+
+        assert execution.exit_code != 0
+        assert execution.output.startswith("started\n")
+        assert execution.output.endswith("[TIMEOUT - Agent killed]\n")
+
+
+class TestSyncBack:
+    """Tests for sync_workspace_back()."""
+
+    async def test_applies_patch(self, repo, tmp_path, claude):
+        """Should apply the workspace's diff to the repo."""
+        executor = _executor(repo, tmp_path, claude)
+        await executor.execute_agent(Contract(name="writer", scope=["*"]))
+
+        synced = await executor.sync_workspace_back("writer")
+
+        assert synced == {"app.py": repo / "app.py", "pkg/new.py": repo / "pkg" / "new.py"}
+        assert (repo / "app.py").read_text() == "x = 1\n# Agent Mission: writer\n"
+        assert (repo / "pkg" / "new.py").read_text() == "y = 2\n"
+        assert not (repo / ".agent_complete.json").exists()
+        assert not (repo / ".agent_log.txt").exists()
+        assert await executor.get_agent_result("writer") == {"status": "complete"}
+
+    async def test_copies_when_patch_fails(self, repo, tmp_path, claude):
+        """Should copy changed files over a repo that has diverged."""
+        executor = _executor(repo, tmp_path, claude)
+        await executor.execute_agent(Contract(name="writer", scope=["*"]))
+        (repo / "app.py").write_text("x = 'diverged'\n")
+
+        synced = await executor.sync_workspace_back("writer")
+
+        assert synced == {"app.py": repo / "app.py", "pkg/new.py": repo / "pkg" / "new.py"}
+        assert (repo / "app.py").read_text() == "x = 1\n# Agent Mission: writer\n"
+        assert (repo / "pkg" / "new.py").read_text() == "y = 2\n"
+
+    def test_sync_by_mtime(self, tmp_path, claude):
+        """Should copy new and newer files, but not older ones or agent files."""
+        root = tmp_path / "plain"
+        root.mkdir()
+        (root / "old.py").write_text("repo")
+        (root / "new.py").write_text("repo")
+        workspace = tmp_path / "ws"
+        (workspace / "pkg").mkdir(parents=True)
+        (workspace / "old.py").write_text("workspace")
+        (workspace / "new.py").write_text("workspace")
+        (workspace / "pkg" / "added.py").write_text("workspace")
+        (workspace / ".agent_log.txt").write_text("log")
+        os.utime(workspace / "old.py", (0, 0))
+        os.utime(root / "new.py", (0, 0))
+        executor = _executor(root, tmp_path, claude)
+
+        synced = executor._sync_by_mtime(workspace)
+
+        assert sorted(synced) == ["new.py", os.path.join("pkg", "added.py")]
+        assert (root / "new.py").read_text() == "workspace"
+        assert (root / "old.py").read_text() == "repo"
+        assert (root / "pkg" / "added.py").read_text() == "workspace"
+        assert not (root / ".agent_log.txt").exists()
+
+
+class TestWorkspacePool:
+    """Tests for WorkspacePool."""
+
+    async def test_checks_out_current_head(self, repo, tmp_path, claude):
+        """Should hand out worktrees at HEAD and remove unused ones on close."""
+        executor = _executor(repo, tmp_path, claude, workspace_pool_size=2)
+        pool = executor.workspace_pool
+
+        first = await pool.acquire()
+        (repo / "later.py").write_text("y = 2\n")
+        _git(repo, "add", "later.py")
+        _git(repo, "commit", "-q", "-m", "later")
+        second = await pool.acquire()
+
+        assert (first / "app.py").exists()
+        assert (second / "later.py").read_text() == "y = 2\n"
+
+        await asyncio.gather(*pool._refills)
+        await pool.close()
+        remaining = {p for p in (tmp_path / "work").iterdir() if p.name.startswith("pool_")}
+        assert remaining == {first, second}
+
+    async def test_raises_provisioning_error(self, repo, tmp_path, claude, monkeypatch):
+        """Should raise from acquire() when a workspace could not be made."""
+        executor = _executor(repo, tmp_path, claude, workspace_pool_size=1)
+
+        async def fail(workspace):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(executor, "_copy_repo_to_workspace", fail)
+
+        with pytest.raises(OSError, match="No space left"):
+            await asyncio.wait_for(executor.workspace_pool.acquire(), timeout=5)
+        await executor.workspace_pool.close()
+
+    def test_not_used_without_git(self, tmp_path, claude):
+        """Should not pool workspaces of non-git trees."""
+        root = tmp_path / "plain"
+        root.mkdir()
+        executor = _executor(root, tmp_path, claude, workspace_pool_size=2)
+
+        assert executor.workspace_pool is None
+
+
+class TestExecuteAgents:
+    """Tests for execute_agents()."""
+
+    async def test_order_and_exceptions(self, repo, tmp_path, claude, monkeypatch):
+        """Should return results in contract order, with exceptions in place."""
+        executor = _executor(repo, tmp_path, claude)
+        running = []
+        peak = []
+
+        async def execute_agent(contract, on_output, timeout):
+            running.append(contract.name)
+            peak.append(len(running))
+            # Later contracts finish first
+            await asyncio.sleep(0.01 * (4 - len(contract.name)))
+            running.remove(contract.name)
+            if contract.name == "bb":
+                raise RuntimeError("workspace setup failed")
+            return contract.name
+
+        monkeypatch.setattr(executor, "execute_agent", execute_agent)
+        contracts = [Contract(name=n, scope=["*"]) for n in ("a", "bb", "ccc")]
+
+        results = await executor.execute_agents(contracts, max_concurrent=2)
+
+        assert results[0] == "a" and results[2] == "ccc"
+        assert isinstance(results[1], RuntimeError)
+        assert max(peak) == 2
@@ -0,0 +1,39 @@
+"""
+Tests for project initialization (aph-init).
+"""
+
+import json
+
+from agent_harness.init import init_project
+
+
+class TestInitProject:
+    """Tests for init_project()."""
+
+    def test_writes_bundled_templates(self, tmp_path):
+        """Should copy CLAUDE.md and .mcp.json from package data."""
+        results = init_project(tmp_path)
+
+        assert (tmp_path / "CLAUDE.md").read_text().startswith("# CLAUDE.md\n")
+        servers = json.loads((tmp_path / ".mcp.json").read_text())["mcpServers"]
+        assert "agent-protocol-harness" in servers
+        assert len(results["created"]) == 2
+
+    def test_keeps_existing_files(self, tmp_path):
+        """Should skip files that already exist."""
+        (tmp_path / "CLAUDE.md").write_text("mine")
+        results = init_project(tmp_path)
+
+        assert (tmp_path / "CLAUDE.md").read_text() == "mine"
+        assert results["skipped"] == [str(tmp_path / "CLAUDE.md")]
+
+    def test_appends_gitignore_entry_once(self, tmp_path):
+        """Should add .agent-harness/ to an existing .gitignore only once."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n")
+
+        init_project(tmp_path)
+        init_project(tmp_path)
+
+        assert gitignore.read_text().count(".agent-harness/") == 1
+        assert gitignore.read_text().startswith("node_modules/\n")
@@ -0,0 +1,362 @@
+"""
+Tests for filesystem isolation.
+
+Tests workspace setup and sync without Docker:
+- Change detection between workspace and repo files
+- Syncing modified and new files back
+- Falling back to a plain copy when overlays fail
+- Per-agent containers and their removal
+- Docker API version negotiation and image pulls
+"""
+
+import errno
+import os
+
+import pytest
+
+from agent_harness import isolator as isolator_module
+from agent_harness.isolator import (
+    FilesystemIsolator,
+    _DockerAPI,
+    _files_differ,
+)
+from agent_harness.models import Contract
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A small repository with one in-scope and one out-of-scope file."""
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "app.py").write_text("print('app')\n")
+    (root / "docs").mkdir()
+    (root / "docs" / "index.md").write_text("# Docs\n")
+    return root
+
+
+class TestFilesDiffer:
+    """Tests for _files_differ()."""
+
+    def test_size_mismatch(self, tmp_path):
+        """Should report files of different sizes as different."""
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.write_text("one")
+        b.write_text("three")
+        assert _files_differ(a, b)
+
+    def test_same_size_different_content(self, tmp_path):
+        """Should compare contents when sizes match but mtimes do not."""
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.write_text("abc")
+        b.write_text("abd")
+        os.utime(b, ns=(0, 0))
+        assert _files_differ(a, b)
+
+        b.write_text("abc")
+        os.utime(b, ns=(0, 0))
+        assert not _files_differ(a, b)
+
+
+class TestSyncBack:
+    """Tests for FilesystemIsolator.sync_back() on local workspaces."""
+
+    @pytest.mark.parametrize("overlay", [True, False])
+    async def test_syncs_only_changes(self, repo, tmp_path, overlay):
+        """Should copy modified and new files, but not out-of-scope ones."""
+        isolator = FilesystemIsolator(
+            repo, work_dir=tmp_path / "work", use_docker=False
+        )
+        # Without root or overlay support both cases use the copy fallback
+        isolator._overlay_supported &= overlay
+        contract = Contract(name="backend", scope=["src/"])
+        workspace = await isolator.create_workspace(contract, tmp_path / "signals")
+        try:
+            assert (workspace.workspace_path / "src" / "app.py").exists()
+            assert not (workspace.workspace_path / "docs" / "index.md").exists()
+
+            (workspace.workspace_path / "src" / "app.py").write_text("print('v2')\n")
+            (workspace.workspace_path / "src" / "new.py").write_text("x = 1\n")
+            (workspace.workspace_path / "docs").mkdir(exist_ok=True)
+            (workspace.workspace_path / "docs" / "index.md").write_text("# Escaped\n")
+
+            target = tmp_path / "out"
+            synced = await isolator.sync_back(workspace, target)
+        finally:
+            await isolator.cleanup_all()
+
+        assert sorted(synced) == ["src/app.py", "src/new.py"]
+        assert (target / "src" / "app.py").read_text() == "print('v2')\n"
+        assert (repo / "src" / "app.py").read_text() == "print('app')\n"
+
+    @pytest.mark.parametrize("overlay", [True, False])
+    async def test_repeated_sync_skips_synced_files(self, repo, tmp_path, overlay):
+        """Should only return files changed since the previous sync."""
+        isolator = FilesystemIsolator(
+            repo, work_dir=tmp_path / "work", use_docker=False
+        )
+        isolator._overlay_supported &= overlay
+        contract = Contract(name="backend", scope=["src/"])
+        workspace = await isolator.create_workspace(contract, tmp_path / "signals")
+        target = tmp_path / "out"
+        try:
+            (workspace.workspace_path / "src" / "a.py").write_text("a = 1\n")
+            first = await isolator.sync_back(workspace, target)
+            second = await isolator.sync_back(workspace, target)
+            (workspace.workspace_path / "src" / "b.py").write_text("b = 1\n")
+            third = await isolator.sync_back(workspace, target)
+        finally:
+            await isolator.cleanup_all()
+
+        assert list(first) == ["src/a.py"]
+        assert second == {}
+        assert list(third) == ["src/b.py"]
+
+    async def test_overlay_is_a_snapshot(self, repo, tmp_path):
+        """Should not show repo changes made after the workspace was mounted."""
+        isolator = FilesystemIsolator(
+            repo, work_dir=tmp_path / "work", use_docker=False
+        )
+        if not isolator._overlay_supported:
+            pytest.skip("overlay mounts need root on Linux")
+        (repo / "linked").symlink_to(repo / "docs")
+        contract = Contract(name="backend", scope=["src/"])
+        workspace = await isolator.create_workspace(contract, tmp_path / "signals")
+        try:
+            if not workspace.overlay_dir:
+                pytest.skip("overlay mount failed")
+            (repo / "src" / "app.py").write_text("print('synced')\n")
+            (repo / "src" / "later.py").write_text("x = 1\n")
+
+            assert (workspace.workspace_path / "src" / "app.py").read_text() == "print('app')\n"
+            assert not (workspace.workspace_path / "src" / "later.py").exists()
+            assert not os.path.lexists(workspace.workspace_path / "linked")
+        finally:
+            await isolator.cleanup_all()
+
+    async def test_untouched_copies_not_synced(self, repo, tmp_path):
+        """Should not sync a copied file back because the repo changed since."""
+        isolator = FilesystemIsolator(
+            repo, work_dir=tmp_path / "work", use_docker=False
+        )
+        isolator._overlay_supported = False
+        contract = Contract(name="backend", scope=["src/"])
+        workspace = await isolator.create_workspace(contract, tmp_path / "signals")
+        try:
+            assert "src/app.py" in workspace.original_stats
+            (repo / "src" / "app.py").write_text("print('from another agent')\n")
+
+            synced = await isolator.sync_back(workspace, tmp_path / "out")
+        finally:
+            await isolator.cleanup_all()
+
+        assert synced == {}
+
+
+class TestPrepareWorkspace:
+    """Tests for the overlay snapshot and its copy fallback."""
+
+    async def test_mount_failure_reuses_snapshot(self, repo, tmp_path, monkeypatch):
+        """Should move the snapshot into the workspace instead of copying again."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "mount").write_text("#!/bin/sh\nexit 32\n")
+        (bin_dir / "mount").chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        copies = []
+        fast_copy = isolator_module._fast_copy
+        monkeypatch.setattr(
+            isolator_module, "_fast_copy",
+            lambda src, dst: copies.append(dst) or fast_copy(src, dst),
+        )
+        isolator = FilesystemIsolator(
+            repo, work_dir=tmp_path / "work", use_docker=False
+        )
+        isolator._overlay_supported = True
+        workspace = await isolator.create_workspace(
+            Contract(name="backend", scope=["src/"]), tmp_path / "signals"
+        )
+        try:
+            assert workspace.overlay_dir is None
+            assert not isolator._overlay_supported
+            assert len(copies) == 1
+            assert (workspace.workspace_path / "src" / "app.py").read_text() == "print('app')\n"
+            assert not workspace.workspace_path.with_name(
+                f"{workspace.workspace_path.name}.overlay"
+            ).exists()
+            assert "src/app.py" in workspace.original_stats
+            assert await isolator.sync_back(workspace, repo) == {}
+        finally:
+            await isolator.cleanup_all()
+
+    async def test_copy_error_cleans_up(self, repo, tmp_path, monkeypatch):
+        """Should raise RuntimeError and remove the partial copy when out of space."""
+        def full(src, dst):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(isolator_module, "_fast_copy", full)
+        work_dir = tmp_path / "work"
+        isolator = FilesystemIsolator(repo, work_dir=work_dir, use_docker=False)
+
+        with pytest.raises(RuntimeError, match="No space left"):
+            await isolator.create_workspace(
+                Contract(name="backend", scope=["src/"]), tmp_path / "signals"
+            )
+        assert list(work_dir.iterdir()) == []
+
+
+class TestContainers:
+    """Tests for per-agent containers, using a stub docker CLI."""
+
+    @pytest.fixture
+    def docker_log(self, tmp_path, monkeypatch):
+        """Put a docker CLI on PATH that logs its arguments."""
+        log = tmp_path / "docker.log"
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        docker = bin_dir / "docker"
+        docker.write_text(
+            "#!/bin/sh\n"
+            f'echo "$@" >> {log}\n'
+            '[ "$1" = create ] && echo "id_$3"\n'
+            "exit 0\n"
+        )
+        docker.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setattr(isolator_module, "DOCKER_SOCKET", str(tmp_path / "none"))
+        return log
+
+    async def test_mounts_only_own_workspace(self, repo, tmp_path, docker_log):
+        """Should give each agent a container with just its own mounts, removed on cleanup."""
+        isolator = FilesystemIsolator(repo, work_dir=tmp_path / "work")
+        isolator._overlay_supported = False
+        backend = await isolator.create_workspace(
+            Contract(name="backend", scope=["src/"]), tmp_path / "signals" / "backend"
+        )
+        docs = await isolator.create_workspace(
+            Contract(name="docs", scope=["docs/"]), tmp_path / "signals" / "docs"
+        )
+        try:
+            create = [line for line in docker_log.read_text().splitlines()
+                      if line.startswith("create")]
+            assert len(create) == 2
+            assert f"source={backend.workspace_path.resolve()},target=/workspace" in create[0]
+            assert f"{tmp_path / 'signals' / 'backend'}:/signals:rw" in create[0]
+            assert str(docs.workspace_path) not in create[0]
+
+            await backend.cleanup()
+            assert docker_log.read_text().splitlines()[-1] == f"rm -f {backend.container_id}"
+        finally:
+            await isolator.cleanup_all()
+
+        assert docker_log.read_text().splitlines()[-1] == f"rm -f {docs.container_id}"
+        assert not isolator._containers
+
+    async def test_create_failure_removes_workspace(self, repo, tmp_path, docker_log):
+        """Should unmount and delete the workspace when its container fails."""
+        (tmp_path / "bin" / "docker").write_text(
+            "#!/bin/sh\necho 'No such image' >&2\nexit 1\n"
+        )
+        work_dir = tmp_path / "work"
+        isolator = FilesystemIsolator(repo, work_dir=work_dir)
+
+        with pytest.raises(RuntimeError, match="No such image"):
+            await isolator.create_workspace(
+                Contract(name="backend", scope=["src/"]), tmp_path / "signals"
+            )
+        assert list(work_dir.iterdir()) == []
+
+
+class TestDockerAPI:
+    """Tests for the Docker socket API client."""
+
+    async def test_uses_daemon_api_version(self, tmp_path):
+        """Should address requests to the version the daemon reports."""
+        web = pytest.importorskip("aiohttp.web")
+        paths = []
+
+        async def version(request):
+            paths.append(request.path)
+            return web.json_response({"ApiVersion": "1.41"})
+
+        async def remove(request):
+            paths.append(request.path)
+            return web.Response(status=204)
+
+        app = web.Application()
+        app.router.add_get("/version", version)
+        app.router.add_delete("/v1.41/containers/{id}", remove)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        socket_path = str(tmp_path / "docker.sock")
+        await web.UnixSite(runner, socket_path).start()
+
+        docker = _DockerAPI(socket_path)
+        try:
+            await docker.negotiate_version()
+            await docker.remove_container("abc")
+        finally:
+            await docker.close()
+            await runner.cleanup()
+
+        assert paths == ["/version", "/v1.41/containers/abc"]
+
+    @pytest.fixture
+    async def pull_daemon(self, tmp_path):
+        """Serve a daemon without the image; pulls answer with `progress`."""
+        web = pytest.importorskip("aiohttp.web")
+        daemon = {"pulls": [], "progress": '{"status":"Pulling"}\n{"status":"Done"}\n'}
+
+        async def create(request):
+            if not daemon["pulls"]:
+                return web.json_response(
+                    {"message": "No such image: python:3.11-slim"}, status=404
+                )
+            return web.json_response({"Id": "abc"}, status=201)
+
+        async def pull(request):
+            daemon["pulls"].append(dict(request.query))
+            return web.Response(text=daemon["progress"])
+
+        app = web.Application()
+        app.router.add_post("/containers/create", create)
+        app.router.add_post("/images/create", pull)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        socket_path = str(tmp_path / "docker.sock")
+        await web.UnixSite(runner, socket_path).start()
+
+        docker = _DockerAPI(socket_path)
+        daemon["docker"] = docker
+        yield daemon
+        await docker.close()
+        await runner.cleanup()
+
+    async def test_pulls_missing_image(self, pull_daemon):
+        """Should pull the image and retry when create reports it missing."""
+        container_id = await pull_daemon["docker"].create_container(
+            "agent_x", {"Image": "python:3.11-slim"}
+        )
+
+        assert container_id == "abc"
+        assert pull_daemon["pulls"] == [{"fromImage": "python:3.11-slim"}]
+
+    async def test_pull_error(self, pull_daemon):
+        """Should raise the error reported in the pull's progress stream."""
+        pull_daemon["progress"] = '{"status":"Pulling"}\n{"error":"manifest unknown"}\n'
+
+        with pytest.raises(RuntimeError, match="manifest unknown"):
+            await pull_daemon["docker"].create_container(
+                "agent_x", {"Image": "nosuch"}
+            )
+        assert pull_daemon["pulls"] == [{"fromImage": "nosuch", "tag": "latest"}]
+
+    async def test_falls_back_to_cli(self, tmp_path, monkeypatch):
+        """Should use the docker CLI when the socket does not answer."""
+        pytest.importorskip("aiohttp")
+        socket_path = tmp_path / "docker.sock"
+        socket_path.touch()
+        monkeypatch.setattr(isolator_module, "DOCKER_SOCKET", str(socket_path))
+        isolator = FilesystemIsolator(tmp_path, work_dir=tmp_path / "work")
+
+        assert await isolator._get_docker() is None
+        assert not isolator._docker_api_usable
@@ -0,0 +1,280 @@
+"""
+Tests for the MCP server helpers.
+
+Tests:
+- Running simple check commands without a shell
+- Picking and running batches of ready agents
+- Wrapping tool results for the SDK in use
+"""
+
+import json
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from mcp.types import CallToolRequest, CallToolResult, TextContent
+
+from agent_harness import mcp_server
+from agent_harness.mcp_server import AgentHarnessMCP, _command_argv
+from agent_harness.persistence import ContractPersist, SessionState
+
+
+class TestCommandArgv:
+    """Tests for _command_argv()."""
+
+    @pytest.mark.parametrize("command, argv", [
+        ("pytest -q tests/", ["pytest", "-q", "tests/"]),
+        ("npm run 'lint:fix'", ["npm", "run", "lint:fix"]),
+        ("grep -c a#b file", ["grep", "-c", "a#b", "file"]),
+    ])
+    def test_splits_plain_commands(self, command, argv):
+        """Should split commands without shell syntax into argv."""
+        assert _command_argv(command) == argv
+
+    @pytest.mark.parametrize("command", [
+        "",
+        None,
+        "pytest -q # flaky on CI",
+        "# disabled",
+        "npm test && npm run lint",
+        "ls *.py",
+        "echo $HOME",
+        "FOO=1 pytest",
+        "echo 'unbalanced",
+    ])
+    def test_needs_shell(self, command):
+        """Should return None for commands the shell has to interpret."""
+        assert _command_argv(command) is None
+
+
+class _FakeExecutor:
+    """Executor whose agents finish with preset results."""
+
+    def __init__(self, repo_root, results):
+        self.repo_root = repo_root
+        self.results = results
+        self.batches = []
+
+    async def execute_agents(self, contracts, timeout):
+        self.batches.append([c.name for c in contracts])
+        return [SimpleNamespace(output="") for _ in contracts]
+
+    async def get_agent_result(self, agent_name):
+        return self.results[agent_name]
+
+    async def sync_workspace_back(self, agent_name):
+        path = self.repo_root / f"{agent_name}.txt"
+        path.write_text(agent_name)
+        return {path.name: "created"}
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """A server on a fresh git repository, without the MCP transport."""
+    for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(var, "test")
+    for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(var, "test@example.com")
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-C", str(tmp_path), "commit", "-q", "--allow-empty", "-m", "init"],
+        check=True,
+    )
+
+    server = AgentHarnessMCP.__new__(AgentHarnessMCP)
+    server.repo_root = tmp_path
+    server._persistence = None
+    server._contract_cache = {}
+    server._state = SessionState(phase="executing")
+    return server
+
+
+def _contract(name, depends=()):
+    return ContractPersist(
+        name=name, goal=f"Build {name}", scope=[f"{name}/"], cannot=[],
+        depends=[f"READY:{d}" for d in depends], expects=[],
+        produces=[f"READY:{name}"], verify=[],
+    )
+
+
+class TestExecuteNextAgent:
+    """Tests for the execute_next_agent tool."""
+
+    async def test_runs_ready_agents_as_one_batch(self, server):
+        """Should run every agent whose dependencies completed, then its dependents."""
+        server.state.proposed_contracts = [
+            _contract("api"), _contract("db"), _contract("web", depends=["api", "db"]),
+        ]
+        server.state.pending_agents = ["api", "db", "web"]
+        server._executor = _FakeExecutor(server.repo_root, {
+            name: {"status": "complete"} for name in ("api", "db", "web")
+        })
+
+        first = json.loads(await server._tool_execute_next_agent({}))
+        second = json.loads(await server._tool_execute_next_agent({}))
+
+        assert server._executor.batches == [["api", "db"], ["web"]]
+        assert first["status"] == "success"
+        assert [c["agent"] for c in server.state.commits] == ["api, db", "web"]
+        assert second["commit"] == server.state.commits[-1]["hash"]
+        assert server.state.current_agents == ["web"]
+
+    async def test_uses_dependencies_edited_after_approval(self, server):
+        """Should read dependencies from the contracts at execution time."""
+        server.state.proposed_contracts = [_contract("api"), _contract("web")]
+        server.state.pending_agents = ["api", "web"]
+        server.state.proposed_contracts[1].depends = ["READY:api"]
+        server._executor = _FakeExecutor(server.repo_root, {
+            "api": {"status": "complete"}, "web": {"status": "complete"},
+        })
+
+        await server._tool_execute_next_agent({})
+
+        assert server._executor.batches == [["api"]]
+
+    async def test_reports_partial_batch(self, server):
+        """Should commit the agents that completed and report the rest."""
+        server.state.proposed_contracts = [
+            _contract("api"), _contract("db"), _contract("web", depends=["db"]),
+        ]
+        server.state.pending_agents = ["api", "db", "web"]
+        server._executor = _FakeExecutor(server.repo_root, {
+            "api": {"status": "complete"},
+            "db": {"status": "blocked", "reason": "No schema", "need": "schema.sql"},
+        })
+
+        response = json.loads(await server._tool_execute_next_agent({}))
+
+        assert response["status"] == "partial"
+        assert [(o["agent"], o["status"]) for o in response["agents"]] == [
+            ("api", "success"), ("db", "blocked"),
+        ]
+        assert server.state.commits[-1]["agent"] == "api"
+        assert server.state.failed_agents == ["db"]
+
+        waiting = json.loads(await server._tool_execute_next_agent({}))
+        assert waiting == {
+            "status": "waiting",
+            "waiting_on": {"web": ["db"]},
+            "next": "Retry failed dependencies, or pass agent_name to run one anyway",
+        }
+
+
+class TestRunVerification:
+    """Tests for the run_verification tool."""
+
+    async def test_keeps_head_of_long_output(self, server):
+        """Should report and analyze the first lines of a long failing check."""
+        command = (
+            f"{sys.executable} -c \"import sys; print('ModuleNotFoundError: x'); "
+            "[print(i) for i in range(20000)]; sys.exit(1)\""
+        )
+        contract = _contract("api")
+        contract.verification_plan = [{"description": "tests", "command": command}]
+        server.state.proposed_contracts = [contract]
+        analyzed = []
+        server._reconciler = SimpleNamespace(
+            analyze=lambda output: analyzed.append(output)
+            or SimpleNamespace(can_auto_resolve=False)
+        )
+
+        response = json.loads(
+            await server._tool_run_verification({"agent_name": "api"})
+        )
+
+        result = response["results"][0]
+        assert result["passed"] is False
+        assert result["output"].startswith("ModuleNotFoundError: x\n0\n")
+        assert analyzed[0].startswith("ModuleNotFoundError: x\n")
+        assert analyzed[0].rstrip().endswith("19999")
+
+
+class TestRevert:
+    """Tests for provide_feedback's revert action."""
+
+    async def test_requeues_batch_members(self, server):
+        """Should put the agents sharing the reverted checkpoint back in pending."""
+        server.state.proposed_contracts = [
+            _contract("api"), _contract("db"), _contract("web", depends=["api", "db"]),
+        ]
+        server.state.pending_agents = ["api", "db", "web"]
+        server._executor = _FakeExecutor(server.repo_root, {
+            name: {"status": "complete"} for name in ("api", "db", "web")
+        })
+        await server._tool_execute_next_agent({})
+
+        response = json.loads(await server._tool_provide_feedback({
+            "agent_name": "db", "feedback": "wrong schema", "action": "revert",
+        }))
+
+        assert response["requeued_agents"] == ["api"]
+        assert server.state.completed_agents == ["db"]
+        assert server.state.pending_agents == ["api", "web"]
+        assert not (server.repo_root / "api.txt").exists()
+        assert not (server.repo_root / "db.txt").exists()
+
+
+class _ProbeServer:
+    """Low-level server stub; `passes_through` picks the SDK behavior."""
+
+    passes_through = True
+
+    def __init__(self, name):
+        self.request_handlers = {}
+
+    def call_tool(self):
+        def decorator(func):
+            async def handler(request):
+                result = await func(request.params.name, request.params.arguments)
+                if not self.passes_through:
+                    # Older SDKs wrap whatever the handler returned as content
+                    result = CallToolResult(
+                        content=[TextContent(type="text", text=str(result))]
+                    )
+                return SimpleNamespace(root=result)
+
+            self.request_handlers[CallToolRequest] = handler
+            return func
+        return decorator
+
+
+class TestCallTool:
+    """Tests for the call_tool handler."""
+
+    @pytest.mark.parametrize("passes_through", [True, False])
+    async def test_probes_sdk(self, monkeypatch, passes_through):
+        """Should detect whether the SDK passes a CallToolResult through."""
+        monkeypatch.setattr(_ProbeServer, "passes_through", passes_through)
+        monkeypatch.setattr(mcp_server, "Server", _ProbeServer)
+        monkeypatch.setattr(mcp_server, "_CALL_TOOL_RESULT", None)
+
+        assert await mcp_server._accepts_call_tool_result() is passes_through
+        assert mcp_server._CALL_TOOL_RESULT is passes_through
+
+    async def test_probe_without_decorator(self, monkeypatch):
+        """Should fall back to plain content on SDKs without call_tool."""
+        monkeypatch.setattr(mcp_server, "Server", lambda name: object())
+        monkeypatch.setattr(mcp_server, "_CALL_TOOL_RESULT", None)
+
+        assert await mcp_server._accepts_call_tool_result() is False
+
+    async def test_hints_no_cache_where_supported(self, server, monkeypatch):
+        """Should send the cache hint only to SDKs that accept CallToolResult."""
+        monkeypatch.setattr(mcp_server, "_CALL_TOOL_RESULT", True)
+        result = await server._call_tool("check_session", {})
+        assert isinstance(result, CallToolResult)
+        assert result.meta == {"cache_hint": "no-cache"}
+        assert "has_session" in json.loads(result.content[0].text)
+
+        monkeypatch.setattr(mcp_server, "_CALL_TOOL_RESULT", False)
+        result = await server._call_tool("check_session", {})
+        assert isinstance(result, list)
+        assert "has_session" in json.loads(result[0].text)
+
+    async def test_returns_plain_content(self, server):
+        """Should return a list of content for other and unknown tools."""
+        assert await server._call_tool("no_such_tool", {}) == [
+            TextContent(type="text", text="Unknown tool: no_such_tool"),
+        ]
@@ -0,0 +1,73 @@
+"""
+Tests for ContractParser file parsing.
+
+Tests the cached parse path used by the CLI:
+- Cache hits for unchanged files
+- Invalidation on modification
+- Isolation of returned contracts from the cache
+"""
+
+import os
+
+import pytest
+
+from agent_harness import cache, parser
+from agent_harness.parser import ContractParser
+
+
+CONTRACTS = """---AGENT:backend
+SCOPE: src/api/
+PRODUCES: api_ready
+---
+---AGENT:frontend
+SCOPE: src/web/
+DEPENDS: READY:backend
+---
+"""
+
+
+@pytest.fixture
+def contracts_file(tmp_path, monkeypatch):
+    """Write a contracts file and point the parse cache at tmp_path."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    parser._parse_file_cached.cache_clear()
+    path = tmp_path / "contracts.md"
+    path.write_text(CONTRACTS)
+    return path
+
+
+class TestParseFile:
+    """Tests for parse_file()."""
+
+    def test_parses_and_validates(self, contracts_file):
+        """Should return the same contracts and errors as the uncached path."""
+        contracts, errors = ContractParser.parse_file(contracts_file)
+        expected = parser.parse_contracts(CONTRACTS)
+        assert [c.name for c in contracts] == [c.name for c in expected]
+        assert errors == ContractParser.validate_contracts(expected)
+
+    def test_reuses_on_disk_cache(self, contracts_file, monkeypatch):
+        """Should load an unchanged file from the pickle cache."""
+        ContractParser.parse_file(contracts_file)
+        assert len(list((contracts_file.parent / "cache" / "contracts").glob("*.pkl"))) == 1
+
+        parser._parse_file_cached.cache_clear()
+        monkeypatch.setattr(parser, "parse_contracts", None)
+        contracts, _ = ContractParser.parse_file(contracts_file)
+        assert [c.name for c in contracts] == ["backend", "frontend"]
+
+    def test_reparses_modified_file(self, contracts_file):
+        """Should miss the cache once the file's mtime or size changes."""
+        ContractParser.parse_file(contracts_file)
+        contracts_file.write_text(CONTRACTS.split("---AGENT:frontend")[0])
+        stat = contracts_file.stat()
+        os.utime(contracts_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        contracts, _ = ContractParser.parse_file(contracts_file)
+        assert [c.name for c in contracts] == ["backend"]
+
+    def test_returns_independent_copies(self, contracts_file):
+        """Should not let callers mutate the cached contracts."""
+        first, _ = ContractParser.parse_file(contracts_file)
+        first[0].goal = "changed"
+        second, _ = ContractParser.parse_file(contracts_file)
+        assert second[0].goal != "changed"
@@ -0,0 +1,149 @@
+"""
+Tests for session persistence.
+
+Tests saving and resuming sessions:
+- Round trip of nested contracts and results
+- Journaling saves between snapshots
+- Ignoring journals of older snapshots
+- Spilling long session logs
+- Keeping pending manual checks out of the spill
+- Marking the running batch in the resume context
+"""
+
+from agent_harness.persistence import (
+    AgentResultPersist,
+    ContractPersist,
+    SessionPersistence,
+)
+
+
+class TestSessionPersistence:
+    """Tests for SessionPersistence save() and load()."""
+
+    def test_round_trip(self, tmp_path):
+        """Should restore nested dataclasses from the saved file."""
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        state.proposed_contracts.append(ContractPersist(
+            name="backend", goal="Auth API", scope=["src/"], cannot=[],
+            depends=[], expects=[], produces=["READY:backend"], verify=[],
+        ))
+        state.results["backend"] = AgentResultPersist(
+            agent_name="backend", status="completed", files_created=["src/auth.py"],
+            files_modified=[], verification_passed=True,
+        )
+        state.analysis_result = {"root": tmp_path}
+        persistence.save(state)
+
+        loaded = persistence.load()
+        assert loaded.proposed_contracts == state.proposed_contracts
+        assert loaded.results == state.results
+        assert loaded.analysis_result == {"root": str(tmp_path)}
+        assert "backend" in loaded.resume_context
+
+    def test_saves_append_to_journal(self, tmp_path):
+        """Should journal changed fields and replay them on load."""
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        snapshot = persistence.state_file.read_bytes()
+
+        state.commits.append({"hash": "abc123", "message": "checkpoint: backend"})
+        state.verification_results.append({"check": "npm test", "passed": None})
+        persistence.save(state)
+        state.commits.append({"hash": "def456", "message": "checkpoint: web"})
+        state.verification_results[0]["passed"] = True
+        state.phase = "verifying"
+        persistence.save(state)
+
+        assert persistence.state_file.read_bytes() == snapshot
+        journal = persistence.journal_file.read_text().splitlines()
+        assert sum('"op":"extend"' in line for line in journal) == 3
+
+        # A torn final write is ignored
+        with open(persistence.journal_file, "a") as f:
+            f.write('{"base":"')
+
+        loaded = SessionPersistence(tmp_path).load()
+        assert loaded.commits == state.commits
+        assert loaded.verification_results == [{"check": "npm test", "passed": True}]
+        assert loaded.phase == "verifying"
+        assert loaded.resume_context == state.resume_context
+
+    def test_compacts_journal(self, tmp_path, monkeypatch):
+        """Should rewrite the snapshot once the journal is long enough."""
+        monkeypatch.setattr("agent_harness.persistence.JOURNAL_MAX_OPS", 4)
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        for i in range(3):
+            state.feedback_history.append({"iteration": i})
+            persistence.save(state)
+
+        assert not persistence.journal_file.exists()
+        state.phase = "feedback"
+        persistence.save(state)
+
+        loaded = SessionPersistence(tmp_path).load()
+        assert loaded.feedback_history == state.feedback_history
+        assert loaded.phase == "feedback"
+
+    def test_ignores_journal_of_older_snapshot(self, tmp_path, monkeypatch):
+        """Should not replay lines left over from before a compaction."""
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        state.commits.append({"hash": "abc123", "message": "checkpoint: backend"})
+        persistence.save(state)
+        stale = persistence.journal_file.read_bytes()
+
+        # Compact, then crash before the old journal was removed
+        monkeypatch.setattr("agent_harness.persistence.JOURNAL_MAX_OPS", 0)
+        persistence.save(state)
+        persistence.journal_file.write_bytes(stale)
+
+        assert SessionPersistence(tmp_path).load().commits == state.commits
+
+    def test_spills_long_logs(self, tmp_path, monkeypatch):
+        """Should move the oldest entries of long lists to history.jsonl."""
+        monkeypatch.setattr("agent_harness.persistence.MAX_LOG_ENTRIES", 4)
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        state.commits.extend({"hash": str(i), "message": "checkpoint"} for i in range(5))
+        persistence.save(state)
+
+        assert [c["hash"] for c in state.commits] == ["3", "4"]
+        spilled = persistence.overflow_file.read_text().splitlines()
+        assert len(spilled) == 3
+        assert '"field":"commits","entry":{"hash":"0",' in spilled[0]
+        assert SessionPersistence(tmp_path).load().commits == state.commits
+
+    def test_keeps_pending_manual_checks_when_spilling(self, tmp_path, monkeypatch):
+        """Should not spill verification results still awaiting the user."""
+        monkeypatch.setattr("agent_harness.persistence.MAX_LOG_ENTRIES", 4)
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        state.verification_results.append(
+            {"check": "manual: login flow", "passed": None, "awaiting_user": True}
+        )
+        state.verification_results.extend({"check": f"test {i}", "passed": True} for i in range(4))
+        persistence.save(state)
+
+        assert [r["check"] for r in state.verification_results] == [
+            "manual: login flow", "test 3",
+        ]
+        assert len(persistence.overflow_file.read_text().splitlines()) == 3
+
+    def test_marks_running_batch(self, tmp_path):
+        """Should mark every agent of the current batch as running."""
+        persistence = SessionPersistence(tmp_path)
+        state = persistence.create_new("Add login")
+        for name in ("api", "db", "web"):
+            state.proposed_contracts.append(ContractPersist(
+                name=name, goal=f"Build {name}", scope=[f"{name}/"], cannot=[],
+                depends=[], expects=[], produces=[], verify=[],
+            ))
+        state.current_agents = ["api", "db"]
+        persistence.save(state)
+
+        assert "▶ api" in state.resume_context
+        assert "▶ db" in state.resume_context
+        assert "○ web" in state.resume_context
+        assert SessionPersistence(tmp_path).load().current_agents == ["api", "db"]